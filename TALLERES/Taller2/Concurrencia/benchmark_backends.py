@@ -0,0 +1,186 @@
+"""
+Benchmark de los motores de descarga
+====================================
+
+Levanta un ``LocalServer`` (ver ``local_server.py``) con el tamaño de
+cuerpo, la latencia, el jitter y la tasa de errores indicados, y descarga
+el mismo lote de URLs con cada motor ("asyncio", "threads", "processes")
+y cada nivel de concurrencia. Para cada combinación informa:
+
+- Rendimiento: peticiones por segundo y MB/s.
+- Latencia p50 y p99 de las peticiones.
+- Memoria pico (RSS) del proceso cliente y sus hijos.
+- Cantidad de peticiones fallidas.
+
+Cada medición corre en un proceso nuevo para que la memoria de una no
+contamine a la siguiente; el servidor corre en el proceso principal.
+
+Uso:
+    python benchmark_backends.py                                   # valores por defecto
+    python benchmark_backends.py --concurrency 1 8 64 --requests 500
+    python benchmark_backends.py --latency 0.05 --jitter 0.02 --error-rate 0.01 --output res.json
+    python benchmark_backends.py --disk                            # descargas a disco
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+try:
+    import resource
+except ImportError:  # no existe en Windows
+    resource = None
+
+from downloader import BACKENDS, download_all, fetch_all
+from local_server import LocalServer
+from policies import Policy
+
+NIVELES = [1, 4, 16, 64]
+
+
+def percentil(valores, p):
+    """Percentil p (0-100) por el método del rango más cercano."""
+    if not valores:
+        return 0.0
+    ordenados = sorted(valores)
+    indice = max(0, min(len(ordenados) - 1, round(p / 100 * len(ordenados) + 0.5) - 1))
+    return ordenados[indice]
+
+
+def memoria_pico_mb():
+    """Memoria pico (RSS) del proceso más la del hijo más grande, en MB."""
+    if resource is None:
+        return None
+    propia = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    hijos = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    # Linux informa KB y macOS bytes
+    escala = 1 / 1024 ** 2 if sys.platform == "darwin" else 1 / 1024
+    return (propia + hijos) * escala
+
+
+def medir(backend, concurrencia, urls, retries, disco):
+    """
+    Descarga las URLs una vez y resume la medición.
+
+    Returns:
+        Diccionario con el resultado de la medición
+    """
+    politica = Policy(retries=retries, breaker_threshold=0)
+    inicio = time.perf_counter()
+    if disco:
+        with tempfile.TemporaryDirectory() as carpeta:
+            destinos = {f"archivo{i}": url for i, url in enumerate(urls)}
+            resultados = download_all(destinos, carpeta, backend, concurrencia, policy=politica)
+    else:
+        resultados = fetch_all(urls, backend, concurrencia, politica)
+    segundos = time.perf_counter() - inicio
+
+    latencias = [r.latency for r in resultados]
+    bytes_totales = sum(r.size for r in resultados if r.ok)
+    return {
+        "backend": backend,
+        "concurrency": concurrencia,
+        "requests": len(urls),
+        "seconds": segundos,
+        "requests_per_second": len(urls) / segundos,
+        "mb_per_second": bytes_totales / segundos / 1e6,
+        "p50": percentil(latencias, 50),
+        "p99": percentil(latencias, 99),
+        "peak_memory_mb": memoria_pico_mb(),
+        "failed": sum(not r.ok for r in resultados),
+    }
+
+
+def medir_en_proceso(backend, concurrencia, urls, retries, disco):
+    """Corre ``medir`` en un intérprete nuevo y lee su resultado en JSON."""
+    entrada = json.dumps({"backend": backend, "concurrency": concurrencia, "urls": urls,
+                          "retries": retries, "disk": disco})
+    salida = subprocess.run([sys.executable, __file__, "--run-one"], input=entrada,
+                            capture_output=True, text=True, check=True)
+    return json.loads(salida.stdout)
+
+
+def ejecutar(args):
+    """Corre todas las combinaciones de motor y concurrencia contra el servidor local."""
+    resultados = []
+    with LocalServer(args.size, args.latency, args.jitter, args.error_rate, seed=args.seed) as servidor:
+        urls = servidor.urls(args.requests)
+        for backend in args.backends:
+            for concurrencia in args.concurrency:
+                r = medir_en_proceso(backend, concurrencia, urls, args.retries, args.disk)
+                resultados.append(r)
+                memoria = "-" if r["peak_memory_mb"] is None else f"{r['peak_memory_mb']:.1f}"
+                print(f"  {backend:<10} c={concurrencia:<4} {r['requests_per_second']:9.1f} req/s "
+                      f"{r['mb_per_second']:8.2f} MB/s  p50 {r['p50'] * 1e3:8.2f} ms  "
+                      f"p99 {r['p99'] * 1e3:8.2f} ms  {memoria:>7} MB  fallidas {r['failed']}",
+                      file=sys.stderr)
+    return resultados
+
+
+def imprimir_tabla(resultados):
+    print(f"\n{'motor':<10}{'conc.':>6}{'req/s':>10}{'MB/s':>9}{'p50 (ms)':>10}"
+          f"{'p99 (ms)':>10}{'mem. (MB)':>11}{'fallidas':>10}")
+    for r in resultados:
+        memoria = "-" if r["peak_memory_mb"] is None else f"{r['peak_memory_mb']:.1f}"
+        print(f"{r['backend']:<10}{r['concurrency']:>6}{r['requests_per_second']:>10.1f}"
+              f"{r['mb_per_second']:>9.2f}{r['p50'] * 1e3:>10.2f}{r['p99'] * 1e3:>10.2f}"
+              f"{memoria:>11}{r['failed']:>10}")
+    mejores = {}
+    for r in resultados:
+        if r["concurrency"] not in mejores or r["requests_per_second"] > mejores[r["concurrency"]]["requests_per_second"]:
+            mejores[r["concurrency"]] = r
+    print("\nMotor más rápido por concurrencia:")
+    for concurrencia, r in sorted(mejores.items()):
+        print(f"  c={concurrencia:<4} {r['backend']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de los motores de descarga")
+    parser.add_argument("--backends", nargs="+", choices=BACKENDS, default=list(BACKENDS))
+    parser.add_argument("--concurrency", type=int, nargs="+", default=NIVELES,
+                        help="niveles de concurrencia (por defecto 1 4 16 64)")
+    parser.add_argument("--requests", type=int, default=200, help="peticiones por medición")
+    parser.add_argument("--size", type=int, default=64 * 1024, help="bytes por respuesta")
+    parser.add_argument("--latency", type=float, default=0.02, help="latencia del servidor (s)")
+    parser.add_argument("--jitter", type=float, default=0.005, help="jitter (±) de la latencia (s)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="probabilidad de 503")
+    parser.add_argument("--retries", type=int, default=0, help="reintentos por petición")
+    parser.add_argument("--seed", type=int, default=0, help="semilla del servidor")
+    parser.add_argument("--disk", action="store_true", help="descargar a disco por bloques")
+    parser.add_argument("--output", help="archivo JSON donde guardar los resultados")
+    parser.add_argument("--run-one", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.run_one:
+        # Medición individual pedida por ``medir_en_proceso``
+        pedido = json.load(sys.stdin)
+        json.dump(medir(pedido["backend"], pedido["concurrency"], pedido["urls"],
+                        pedido["retries"], pedido["disk"]), sys.stdout)
+        return 0
+
+    resultados = ejecutar(args)
+    imprimir_tabla(resultados)
+    if args.output:
+        documento = {
+            "meta": {
+                "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "size": args.size, "latency": args.latency, "jitter": args.jitter,
+                "error_rate": args.error_rate, "retries": args.retries,
+                "requests": args.requests, "disk": args.disk, "seed": args.seed,
+            },
+            "results": resultados,
+        }
+        with open(args.output, "w", encoding="utf-8") as archivo:
+            json.dump(documento, archivo, indent=2)
+        print(f"\nResultados guardados en {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
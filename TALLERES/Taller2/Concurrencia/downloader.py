@@ -0,0 +1,425 @@
+"""
+Descargador concurrente con motores intercambiables
+===================================================
+
+``fetch_all(urls, backend=..., concurrency=...)`` descarga una lista de URLs
+con cualquiera de los tres modelos de concurrencia de esta carpeta y
+retorna, para cada URL y en el mismo orden, un ``FetchResult`` con el
+contenido, el código de estado y la latencia:
+
+- ``"asyncio"``: un solo hilo con ``aiohttp`` (``io_asyncio.py``).
+- ``"threads"``: un pool de hilos con ``requests`` (``io_threading.py``).
+- ``"processes"``: un pool de procesos con ``requests`` (``io_multiprocessing.py``).
+
+Uso::
+
+    from downloader import URLS, fetch_all
+
+    for resultado in fetch_all(list(URLS.values()), backend="threads", concurrency=5):
+        print(resultado)
+
+``download_all(urls, directory, ...)`` guarda las respuestas en disco por
+bloques de ``CHUNK_SIZE`` bytes en lugar de leerlas enteras a memoria:
+cada descarga se escribe en ``<archivo>.part``, se reanuda con una
+petición ``Range`` si se interrumpió, informa su avance y calcula la suma
+de verificación a medida que llegan los bloques.
+
+Todas las descargas siguen una ``policies.Policy``: tiempos límite de
+conexión y lectura, reintentos con espera exponencial y cortacircuitos por
+host. Cada resultado trae en ``failures`` los intentos fallidos, y
+``policies.failure_report`` resume los de un lote.
+
+Para listas muy largas, ``io_asyncio.fetch_stream`` descarga con
+concurrencia acotada (en total y por host) y entrega los resultados con un
+generador asíncrono a medida que terminan, con memoria constante.
+
+Para comparar los motores sin internet, ``local_server.py`` levanta un
+servidor local con latencia y errores inyectados y ``benchmark_backends.py``
+mide el rendimiento, la latencia p50/p99 y la memoria de cada motor.
+
+Los módulos de cada motor se importan solo al usarlos, así que basta con
+tener instalada la dependencia del motor elegido.
+"""
+
+import hashlib
+import importlib
+import os
+import re
+from collections import Counter
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+from urllib.parse import unquote, urlsplit
+
+from policies import CONNECTION, DEFAULT_POLICIES, Failure, Policy
+
+BACKENDS = ("asyncio", "threads", "processes")
+
+# Módulo que implementa cada motor.
+_MODULES = {
+    "asyncio": "io_asyncio",
+    "threads": "io_threading",
+    "processes": "io_multiprocessing",
+}
+
+DEFAULT_CONCURRENCY = 5
+
+# Tamaño de bloque de las descargas a disco: la memoria por transferencia.
+CHUNK_SIZE = 64 * 1024
+
+# Algoritmo de ``hashlib`` para la suma de verificación de las descargas a disco.
+CHECKSUM_ALGORITHM = "sha256"
+
+# Avance de una descarga a disco: (url, bytes descargados, bytes totales o None).
+ProgressCallback = Callable[[str, int, Optional[int]], None]
+
+URLS = {
+    "imagen": "https://images.unsplash.com/photo-1506905925346-21bda4d32df4?w=800",
+    "json": "https://jsonplaceholder.typicode.com/posts/1",
+    "csv": "https://raw.githubusercontent.com/plotly/datasets/master/tips.csv",
+    "texto": "https://www.gutenberg.org/files/11/11-0.txt",
+    "xml": "https://www.w3schools.com/xml/note.xml",
+    "pdf": "https://www.w3.org/WAI/ER/tests/xhtml/testfiles/resources/pdf/dummy.pdf",
+}
+
+
+class FetchResult:
+    """
+    Resultado de descargar una URL.
+
+    Atributos:
+        url: La URL pedida
+        status: Código de estado HTTP (None si la petición falló)
+        content: Cuerpo de la respuesta (b"" si falló o se guardó en disco)
+        latency: Segundos desde el envío de la petición hasta leer el cuerpo
+        error: Descripción del error (None si hubo respuesta)
+        path: Archivo donde se guardó el cuerpo (descargas a disco)
+        checksum: Suma de verificación hexadecimal del archivo completo
+        error_kind: Tipo del error ("timeout", "connection", "circuit_open")
+        retry_after: Segundos pedidos por el encabezado ``Retry-After``
+        attempts: Intentos realizados
+        failures: Los intentos fallidos, como ``policies.Failure``
+    """
+
+    def __init__(self, url: str, status: Optional[int] = None, content: bytes = b"",
+                 latency: float = 0.0, error: Optional[str] = None,
+                 path: Optional[str] = None, size: Optional[int] = None,
+                 checksum: Optional[str] = None, error_kind: Optional[str] = None,
+                 retry_after: Optional[float] = None):
+        self.url = url
+        self.status = status
+        self.content = content
+        self.latency = latency
+        self.error = error
+        self.path = path
+        self.checksum = checksum
+        self.error_kind = error_kind
+        self.retry_after = retry_after
+        self.attempts = 1
+        self.failures: List[Failure] = []
+        self._size = size
+
+    @property
+    def size(self) -> int:
+        """Bytes del cuerpo de la respuesta (en disco si se guardó en ``path``)."""
+        return len(self.content) if self._size is None else self._size
+
+    @property
+    def ok(self) -> bool:
+        """Indica si hubo respuesta con un código 2xx."""
+        return self.error is None and self.status is not None and 200 <= self.status < 300
+
+    def __repr__(self) -> str:
+        intentos = f", intentos={self.attempts}" if self.attempts > 1 else ""
+        if self.error is not None:
+            return (f"FetchResult({self.url}, error={self.error!r}, "
+                    f"latencia={self.latency:.3f}s{intentos})")
+        destino = f", archivo={self.path}" if self.path is not None else ""
+        return (f"FetchResult({self.url}, estado={self.status}, bytes={self.size}{destino}, "
+                f"latencia={self.latency:.3f}s{intentos})")
+
+
+def _describe(error: BaseException) -> str:
+    """Texto de un error para guardarlo en ``FetchResult.error``."""
+    return f"{type(error).__name__}: {error}" if str(error) else type(error).__name__
+
+
+def _failed(url: str, error: BaseException, latency: float, kind: str) -> FetchResult:
+    """Resultado de un intento que terminó con una excepción."""
+    return FetchResult(url, latency=latency, error=_describe(error), error_kind=kind)
+
+
+def _retry_after(headers) -> Optional[float]:
+    """Segundos del encabezado ``Retry-After`` (solo la forma numérica)."""
+    valor = headers.get("Retry-After")
+    try:
+        return float(valor) if valor is not None else None
+    except ValueError:
+        return None
+
+
+def _content_range(value: Optional[str]) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Interpreta ``Content-Range: bytes <inicio>-<fin>/<total>`` (o ``bytes */<total>``).
+
+    Returns:
+        (inicio, total); cada uno es None si falta o no se entiende
+    """
+    coincidencia = re.fullmatch(r"\s*bytes\s+(?:(\d+)-\d+|\*)/(\d+|\*)\s*", value or "")
+    if coincidencia is None:
+        return None, None
+    inicio, total = coincidencia.groups()
+    return (int(inicio) if inicio is not None else None,
+            int(total) if total != "*" else None)
+
+
+class StreamWriter:
+    """
+    Escribe en disco el cuerpo de una respuesta, bloque por bloque.
+
+    Los motores piden los encabezados con ``request_headers()``, llaman
+    ``start()`` con la respuesta, ``write()`` con cada bloque y al final
+    ``finish()`` (o ``fail()`` si hubo un error). Los datos se escriben en
+    ``<path>.part`` y se renombran a ``path`` al terminar; si la descarga
+    se corta, el ``.part`` queda para reanudarla.
+
+    Si la respuesta a un ``Range`` no corresponde al ``.part`` (un 416 con
+    otro tamaño total, o un 206 que no empieza donde termina el ``.part``),
+    el ``.part`` se descarta y ``restart`` queda en True: el motor debe
+    volver a pedir el archivo completo con un ``StreamWriter`` nuevo.
+    """
+
+    def __init__(self, url: str, path: str, resume: bool = True,
+                 algorithm: str = CHECKSUM_ALGORITHM,
+                 progress: Optional[ProgressCallback] = None):
+        self.url = url
+        self.path = path
+        self.partial = path + ".part"
+        self.progress = progress
+        self.total: Optional[int] = None
+        self.retry_after: Optional[float] = None
+        self.restart = False
+        self._algorithm = algorithm
+        self._hasher = hashlib.new(algorithm)
+        self._file = None
+        self.offset = os.path.getsize(self.partial) if resume and os.path.exists(self.partial) else 0
+        self.received = self.offset
+
+    def request_headers(self) -> Dict[str, str]:
+        """
+        Encabezados de la petición: ``Range`` si hay una descarga parcial.
+
+        Se pide el cuerpo sin comprimir para que los bytes recibidos
+        coincidan con ``Content-Length`` y con las posiciones de ``Range``.
+        """
+        encabezados = {"Accept-Encoding": "identity"}
+        if self.offset:
+            encabezados["Range"] = f"bytes={self.offset}-"
+        return encabezados
+
+    def start(self, status: int, headers) -> bool:
+        """
+        Prepara el archivo según la respuesta.
+
+        Args:
+            status: Código de estado HTTP
+            headers: Encabezados de la respuesta
+
+        Returns:
+            True si hay que leer el cuerpo, False si no (error HTTP, el
+            archivo parcial ya estaba completo o hay que reiniciar)
+        """
+        inicio_rango, total_rango = _content_range(headers.get("Content-Range"))
+        if status == 416 and self.offset:
+            if total_rango != self.offset:
+                # El .part no es el archivo remoto completo (viejo o más grande)
+                return self._discard()
+            self._rehash()
+            self.total = self.offset
+            return False
+        if status >= 400:
+            self.retry_after = _retry_after(headers)
+            return False
+        if status == 206 and self.offset:
+            if inicio_rango != self.offset:
+                return self._discard()
+            self._rehash()
+            self._file = open(self.partial, "ab")
+        else:
+            # El servidor ignoró el rango (o no había): se empieza de cero
+            self.offset = self.received = 0
+            self._hasher = hashlib.new(self._algorithm)
+            self._file = open(self.partial, "wb")
+        if status == 206 and total_rango is not None:
+            self.total = total_rango
+        elif headers.get("Content-Length") is not None:
+            self.total = self.offset + int(headers["Content-Length"])
+        return True
+
+    def _discard(self) -> bool:
+        """Borra el ``.part`` que no sirve para reanudar y pide reiniciar."""
+        os.remove(self.partial)
+        self.offset = self.received = 0
+        self.restart = True
+        return False
+
+    def _rehash(self):
+        """Suma al hash los bytes ya descargados antes de reanudar."""
+        with open(self.partial, "rb") as archivo:
+            for bloque in iter(lambda: archivo.read(CHUNK_SIZE), b""):
+                self._hasher.update(bloque)
+
+    def write(self, chunk: bytes):
+        """Escribe un bloque, actualiza la suma de verificación e informa el avance."""
+        self._file.write(chunk)
+        self._hasher.update(chunk)
+        self.received += len(chunk)
+        if self.progress is not None:
+            self.progress(self.url, self.received, self.total)
+
+    def _close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def finish(self, status: int, latency: float) -> FetchResult:
+        """Cierra el archivo y, si la respuesta fue exitosa, lo renombra a ``path``."""
+        self._close()
+        if status >= 400 and status != 416:
+            return FetchResult(self.url, status, latency=latency, retry_after=self.retry_after)
+        if self.total is not None and self.received != self.total:
+            return self.fail(f"Descarga incompleta: {self.received} de {self.total} bytes", latency)
+        os.replace(self.partial, self.path)
+        return FetchResult(self.url, 200 if status == 416 else status, latency=latency,
+                           path=self.path, size=self.received, checksum=self._hasher.hexdigest())
+
+    def fail(self, error: Union[str, BaseException], latency: float,
+             kind: str = CONNECTION) -> FetchResult:
+        """Cierra el archivo (el ``.part`` queda para reanudar) y reporta el error."""
+        self._close()
+        if isinstance(error, BaseException):
+            error = _describe(error)
+        return FetchResult(self.url, latency=latency, error=error, path=self.partial,
+                           size=self.received, error_kind=kind)
+
+
+def file_name(url: str) -> str:
+    """Nombre de archivo para una URL: el último segmento de la ruta o el host."""
+    partes = urlsplit(url)
+    return unquote(partes.path.rstrip("/").rsplit("/", 1)[-1]) or partes.netloc or "descarga"
+
+
+def _unique_name(url: str, name: str) -> str:
+    """Agrega al nombre un hash corto de la URL completa, antes de la extensión."""
+    base, extension = os.path.splitext(name)
+    return f"{base}-{hashlib.sha1(url.encode()).hexdigest()[:8]}{extension}"
+
+
+def _targets(urls: Union[Iterable[str], Dict[str, str]], directory: str) -> List[Tuple[str, str]]:
+    """
+    Pares (url, ruta de destino); un diccionario indica {nombre de archivo: url}.
+
+    Las URLs que darían el mismo nombre (solo difieren en la consulta, o
+    la misma ruta en distintos hosts) reciben todas un hash corto de la URL
+    en el nombre, así que cada una tiene su propio ``.part`` y destino y el
+    nombre no depende del orden de la lista.
+
+    Raises:
+        ValueError: Si una URL se repite o dos nombres llevan al mismo archivo
+    """
+    if isinstance(urls, dict):
+        pares = [(url, nombre) for nombre, url in urls.items()]
+    else:
+        urls = list(urls)
+        repetidas = sorted(url for url, veces in Counter(urls).items() if veces > 1)
+        if repetidas:
+            raise ValueError(f"URLs repetidas: {', '.join(repetidas)}")
+        nombres = [file_name(url) for url in urls]
+        usos = Counter(nombres)
+        pares = [(url, _unique_name(url, nombre) if usos[nombre] > 1 else nombre)
+                 for url, nombre in zip(urls, nombres)]
+    destinos = {}
+    for url, nombre in pares:
+        ruta = os.path.join(directory, nombre)
+        clave = os.path.normcase(os.path.normpath(ruta))
+        if clave in destinos:
+            raise ValueError(f"{destinos[clave]} y {url} se guardarían en el mismo archivo: {ruta}")
+        destinos[clave] = url
+    return [(url, os.path.join(directory, nombre)) for url, nombre in pares]
+
+
+def get_backend(name: str):
+    """
+    Importa el módulo de un motor.
+
+    Args:
+        name: "asyncio", "threads" o "processes"
+
+    Returns:
+        El módulo, que expone ``fetch_all(urls, concurrency, policy)`` y
+        ``download_all(targets, concurrency, chunk_size, resume, algorithm, progress, policy)``
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Motor desconocido: {name}. Opciones: {', '.join(BACKENDS)}")
+    return importlib.import_module(_MODULES[name])
+
+
+def fetch_all(urls: Iterable[str], backend: str = "threads",
+              concurrency: int = DEFAULT_CONCURRENCY,
+              policy: Optional[Policy] = None) -> List[FetchResult]:
+    """
+    Descarga todas las URLs con el motor indicado.
+
+    Los errores de cada URL no interrumpen las demás: quedan en
+    ``FetchResult.error`` y ``FetchResult.failures``.
+
+    Args:
+        urls: URLs a descargar
+        backend: "asyncio", "threads" o "processes"
+        concurrency: Máximo de descargas simultáneas
+        policy: Tiempos límite, reintentos y cortacircuitos; por defecto
+            ``policies.DEFAULT_POLICIES[backend]``
+
+    Returns:
+        Un ``FetchResult`` por URL, en el mismo orden
+    """
+    if concurrency < 1:
+        raise ValueError("La concurrencia debe ser positiva")
+    modulo = get_backend(backend)
+    return modulo.fetch_all(list(urls), concurrency, policy or DEFAULT_POLICIES[backend])
+
+
+def download_all(urls: Union[Iterable[str], Dict[str, str]], directory: str,
+                 backend: str = "threads", concurrency: int = DEFAULT_CONCURRENCY,
+                 chunk_size: int = CHUNK_SIZE, resume: bool = True,
+                 algorithm: str = CHECKSUM_ALGORITHM,
+                 progress: Optional[ProgressCallback] = None,
+                 policy: Optional[Policy] = None) -> List[FetchResult]:
+    """
+    Descarga las URLs a disco por bloques, sin cargar los cuerpos en memoria.
+
+    Args:
+        urls: URLs a descargar, o un diccionario {nombre de archivo: url}.
+            Las URLs con el mismo nombre de archivo reciben un hash corto
+            de la URL en el nombre
+        directory: Carpeta de destino (se crea si no existe)
+        backend: "asyncio", "threads" o "processes"
+        concurrency: Máximo de descargas simultáneas
+        chunk_size: Bytes por bloque
+        resume: Si se reanudan los ``.part`` que hayan quedado con ``Range``
+        algorithm: Algoritmo de ``hashlib`` para la suma de verificación
+        progress: Función (url, descargados, total) llamada tras cada
+            bloque; con "processes" corre en el proceso hijo, así que debe
+            poder serializarse con pickle
+        policy: Tiempos límite, reintentos y cortacircuitos; por defecto
+            ``policies.DEFAULT_POLICIES[backend]``. Los reintentos reanudan
+            desde el ``.part`` si ``resume`` es True
+
+    Returns:
+        Un ``FetchResult`` por URL, en el mismo orden, con ``path``,
+        ``size`` y ``checksum``
+    """
+    if concurrency < 1 or chunk_size < 1:
+        raise ValueError("La concurrencia y el tamaño de bloque deben ser positivos")
+    os.makedirs(directory, exist_ok=True)
+    modulo = get_backend(backend)
+    return modulo.download_all(_targets(urls, directory), concurrency, chunk_size, resume,
+                               algorithm, progress, policy or DEFAULT_POLICIES[backend])
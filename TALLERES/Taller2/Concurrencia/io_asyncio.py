@@ -1,31 +1,259 @@
 import asyncio
 import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import AsyncIterable, AsyncIterator, Iterable, List, Optional, Union
+from urllib.parse import urlsplit
+
 import aiohttp
 
-urls = {
-        "imagen": "https://images.unsplash.com/photo-1506905925346-21bda4d32df4?w=800",
-        "json": "https://jsonplaceholder.typicode.com/posts/1",
-        "csv": "https://raw.githubusercontent.com/plotly/datasets/master/tips.csv",
-        "texto": "https://www.gutenberg.org/files/11/11-0.txt",
-        "xml": "https://www.w3schools.com/xml/note.xml",
-        "pdf": "https://www.w3.org/WAI/ER/tests/xhtml/testfiles/resources/pdf/dummy.pdf",
-        }  
+from downloader import (DEFAULT_CONCURRENCY, URLS, FetchResult, StreamWriter, _describe, _failed,
+                        _retry_after)
+from policies import CONNECTION, DEFAULT_POLICIES, TIMEOUT, DeadlineExceeded, Policy, time_left
+
+# Máximo de conexiones simultáneas a un mismo host en ``fetch_stream``.
+DEFAULT_PER_HOST = 2
+
+_FIN = object()  # marca de fin en las colas de ``fetch_stream``
+
+
+def client_timeout(policy, limit=None):
+    # ``total`` acota la petición completa (también el cuerpo) al plazo que queda
+    return aiohttp.ClientTimeout(total=time_left(limit), sock_connect=policy.connect_timeout,
+                                 sock_read=policy.read_timeout)
+
+
+async def download_once(session, url, policy, limit=None):
+    inicio = time.perf_counter()
+    try:
+        async with session.get(url, timeout=client_timeout(policy, limit)) as response:
+            contenido = await response.read()
+            return FetchResult(url, response.status, contenido, time.perf_counter() - inicio,
+                               retry_after=_retry_after(response.headers))
+    except (asyncio.TimeoutError, DeadlineExceeded) as error:
+        return _failed(url, error, time.perf_counter() - inicio, TIMEOUT)
+    except (aiohttp.ClientError, OSError) as error:
+        return _failed(url, error, time.perf_counter() - inicio, CONNECTION)
+
+
+async def download_site(session, url, policy=None):
+    policy = policy or DEFAULT_POLICIES["asyncio"]
+    return await policy.run_async(url, lambda limite: download_once(session, url, policy, limite))
+
+
+async def _bounded(semaphore, coroutine_function, *args):
+    # La latencia se mide desde que la descarga obtiene su turno, no desde que se encoló
+    async with semaphore:
+        return await coroutine_function(*args)
+
+
+async def download_all_sites(sites, concurrency=DEFAULT_CONCURRENCY, policy=None):
+    # El semáforo y el conector limitan las descargas y conexiones a la vez
+    semaforo = asyncio.Semaphore(concurrency)
+    conector = aiohttp.TCPConnector(limit=concurrency)
+    async with aiohttp.ClientSession(connector=conector) as session:
+        tasks = [asyncio.create_task(_bounded(semaforo, download_site, session, url, policy))
+                 for url in sites]
+        return await asyncio.gather(*tasks)
+
+
+def fetch_all(sites, concurrency=DEFAULT_CONCURRENCY, policy=None) -> List[FetchResult]:
+    """Descarga las URLs con un ciclo de eventos de asyncio (ver ``downloader.fetch_all``)."""
+    return asyncio.run(download_all_sites(sites, concurrency, policy))
+
+
+async def download_to_disk_once(session, target, chunk_size, resume, algorithm, progress, policy,
+                                limit=None):
+    url, path = target
+    writer = StreamWriter(url, path, resume, algorithm, progress)
+    loop = asyncio.get_running_loop()
+    inicio = time.perf_counter()
+    try:
+        async with session.get(url, headers=writer.request_headers(),
+                               timeout=client_timeout(policy, limit)) as response:
+            # El disco y el hash trabajan en un hilo aparte para no frenar el ciclo de eventos
+            if await loop.run_in_executor(None, writer.start, response.status, response.headers):
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    await loop.run_in_executor(None, writer.write, chunk)
+            if not writer.restart:
+                return await loop.run_in_executor(None, writer.finish, response.status,
+                                                  time.perf_counter() - inicio)
+    except (asyncio.TimeoutError, DeadlineExceeded) as error:
+        return writer.fail(error, time.perf_counter() - inicio, TIMEOUT)
+    except (aiohttp.ClientError, OSError) as error:
+        return writer.fail(error, time.perf_counter() - inicio)
+    # El .part no correspondía al archivo remoto: se descartó y se pide completo
+    return await download_to_disk_once(session, target, chunk_size, resume, algorithm, progress,
+                                       policy, limit)
+
+
+async def download_to_disk(session, target, chunk_size, resume, algorithm, progress, policy=None):
+    policy = policy or DEFAULT_POLICIES["asyncio"]
+    return await policy.run_async(target[0], lambda limite: download_to_disk_once(
+        session, target, chunk_size, resume, algorithm, progress, policy, limite))
+
+
+async def download_all_to_disk(targets, concurrency, chunk_size, resume, algorithm, progress,
+                               policy=None):
+    semaforo = asyncio.Semaphore(concurrency)
+    conector = aiohttp.TCPConnector(limit=concurrency)
+    async with aiohttp.ClientSession(connector=conector, auto_decompress=False) as session:
+        tasks = [asyncio.create_task(_bounded(semaforo, download_to_disk, session, target,
+                                              chunk_size, resume, algorithm, progress, policy))
+                 for target in targets]
+        return await asyncio.gather(*tasks)
+
+
+def download_all(targets, concurrency, chunk_size, resume, algorithm, progress,
+                 policy=None) -> List[FetchResult]:
+    """
+    Descarga a disco con asyncio (ver ``downloader.download_all``). Las
+    escrituras y ``progress`` corren en el pool de hilos del ciclo de eventos.
+    """
+    return asyncio.run(download_all_to_disk(targets, concurrency, chunk_size, resume,
+                                            algorithm, progress, policy))
+
+
+class HostLimiter:
+    """
+    Semáforos por host creados a demanda.
+
+    El semáforo de un host se descarta cuando nadie lo usa, así que la
+    memoria depende de los hosts activos y no de todos los vistos.
+    """
+
+    def __init__(self, per_host: int):
+        self.per_host = per_host
+        self._semaphores = {}
+        self._users = defaultdict(int)
+
+    @asynccontextmanager
+    async def slot(self, host: str):
+        """Ocupa un cupo del host mientras dura el bloque ``async with``."""
+        semaforo = self._semaphores.get(host)
+        if semaforo is None:
+            semaforo = self._semaphores[host] = asyncio.Semaphore(self.per_host)
+        self._users[host] += 1
+        try:
+            async with semaforo:
+                yield
+        finally:
+            self._users[host] -= 1
+            if not self._users[host]:
+                del self._users[host], self._semaphores[host]
+
+
+async def _produce(urls, work: asyncio.Queue, workers: int):
+    """Pasa las URLs a la cola de trabajo; se bloquea mientras esté llena."""
+    try:
+        if hasattr(urls, "__aiter__"):
+            async for url in urls:
+                await work.put(url)
+        else:
+            for url in urls:
+                await work.put(url)
+    except Exception:
+        # Los trabajadores terminan lo pendiente y el error llega al consumidor
+        for _ in range(workers):
+            await work.put(_FIN)
+        raise
+    for _ in range(workers):
+        await work.put(_FIN)
+
+
+async def _work(session, work: asyncio.Queue, results: asyncio.Queue, limiter: HostLimiter,
+                policy: Policy):
+    """
+    Descarga URLs de la cola de trabajo hasta recibir la marca de fin.
+
+    Un error inesperado (una URL mal formada, una falla en la política)
+    se entrega como el resultado de esa URL: si el trabajador muriera sin
+    poner la marca de fin, el consumidor esperaría para siempre.
+    """
+    while True:
+        url = await work.get()
+        if url is _FIN:
+            await results.put(_FIN)
+            return
+        inicio = time.perf_counter()
+        try:
+            async with limiter.slot(urlsplit(url).netloc):
+                resultado = await download_site(session, url, policy)
+        except Exception as error:
+            resultado = FetchResult(url, latency=time.perf_counter() - inicio, error=_describe(error))
+        await results.put(resultado)
+
+
+async def fetch_stream(urls: Union[Iterable[str], AsyncIterable[str]],
+                       concurrency: int = DEFAULT_CONCURRENCY,
+                       per_host: int = DEFAULT_PER_HOST,
+                       queue_size: Optional[int] = None,
+                       policy: Optional[Policy] = None) -> AsyncIterator[FetchResult]:
+    """
+    Descarga URLs con concurrencia acotada y entrega los resultados a medida
+    que terminan (no en el orden de entrada).
+
+    ``concurrency`` tareas toman las URLs de una cola de trabajo acotada que
+    se llena desde ``urls``; cada descarga ocupa además un cupo de su host.
+    Las colas de trabajo y de resultados tienen tamaño fijo, así que si el
+    consumidor se atrasa las descargas se detienen y ``urls`` deja de
+    leerse: la memoria no depende del largo de la lista.
+
+    Si el consumidor sale antes del final, conviene cerrar el generador
+    con ``contextlib.aclosing`` para cancelar de inmediato las descargas
+    pendientes.
+
+    Args:
+        urls: URLs a descargar (iterable normal o asíncrono)
+        concurrency: Máximo de descargas simultáneas en total
+        per_host: Máximo de descargas simultáneas a un mismo host
+        queue_size: Tamaño de las colas; por defecto 2 * concurrency
+        policy: Tiempos límite, reintentos y cortacircuitos; por defecto
+            ``policies.DEFAULT_POLICIES["asyncio"]``
+
+    Yields:
+        Un ``FetchResult`` por URL
+
+    Ejemplo::
 
-async def download_site(session, url):
-    async with session.get(url) as response:
-        await response.read()
+        async with aclosing(fetch_stream(leer_urls(), concurrency=100)) as resultados:
+            async for resultado in resultados:
+                procesar(resultado)
+    """
+    if concurrency < 1 or per_host < 1:
+        raise ValueError("La concurrencia debe ser positiva")
+    tamaño = queue_size or 2 * concurrency
+    work = asyncio.Queue(maxsize=tamaño)
+    results = asyncio.Queue(maxsize=tamaño)
+    limiter = HostLimiter(per_host)
+    conector = aiohttp.TCPConnector(limit=concurrency, limit_per_host=per_host)
+    async with aiohttp.ClientSession(connector=conector) as session:
+        productor = asyncio.create_task(_produce(urls, work, concurrency))
+        trabajadores = [asyncio.create_task(_work(session, work, results, limiter, policy))
+                        for _ in range(concurrency)]
+        try:
+            activos = concurrency
+            while activos:
+                resultado = await results.get()
+                if resultado is _FIN:
+                    activos -= 1
+                else:
+                    yield resultado
+            await productor  # propaga los errores al leer ``urls``
+        finally:
+            for tarea in (productor, *trabajadores):
+                tarea.cancel()
+            await asyncio.gather(productor, *trabajadores, return_exceptions=True)
 
-async def download_all_sites(sites):
-    async with aiohttp.ClientSession() as session:
-        tasks = [asyncio.create_task(download_site(session, url)) for url in sites]
-        await asyncio.gather(*tasks, return_exceptions=True)
 
 async def main():
-    sites = list(urls.values())
+    sites = list(URLS.values())
     start_time = time.time()
-    await asyncio.create_task(download_all_sites(sites))
+    results = await asyncio.create_task(download_all_sites(sites))
     duration = time.time() - start_time
+    for r in results:
+        print(r)
     print(duration)
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
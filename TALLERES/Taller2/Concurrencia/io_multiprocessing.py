@@ -1,39 +1,89 @@
+import functools
 import requests
 import multiprocessing
 import time
+from typing import List
+
+from downloader import (CHUNK_SIZE, DEFAULT_CONCURRENCY, URLS, FetchResult, StreamWriter, _failed,
+                        _retry_after)
+from io_threading import iter_body
+from policies import CONNECTION, DEFAULT_POLICIES, TIMEOUT, DeadlineExceeded
 
 session = None
+# Política del proceso: se recibe una vez al crear el proceso, así sus
+# cortacircuitos duran entre una URL y la siguiente
+policy = None
 
-def set_global_session():
-    global session
+def set_global_session(worker_policy=None):
+    global session, policy
     if not session:
         session = requests.Session()
+    policy = worker_policy or DEFAULT_POLICIES["processes"]
+
+def download_once(url, limit=None):
+    inicio = time.perf_counter()
+    try:
+        with session.get(url, stream=True, timeout=policy.timeouts(limit)) as response:
+            contenido = b"".join(iter_body(response, CHUNK_SIZE, limit))
+            return FetchResult(url, response.status_code, contenido, time.perf_counter() - inicio,
+                               retry_after=_retry_after(response.headers))
+    except (requests.Timeout, DeadlineExceeded) as error:
+        return _failed(url, error, time.perf_counter() - inicio, TIMEOUT)
+    except requests.RequestException as error:
+        return _failed(url, error, time.perf_counter() - inicio, CONNECTION)
 
 def download_site(url):
-    with session.get(url) as response:
-        return f"Read {len(response.content)} from {url}"
+    return policy.run(url, lambda limite: download_once(url, limite))
 
-def download_all_sites(sites):
-    with multiprocessing.Pool(initializer=set_global_session) as pool:
-        results = pool.map(download_site, sites)
-    for r in results:
-        print(r)
+def download_all_sites(sites, concurrency=DEFAULT_CONCURRENCY, policy=None):
+    with multiprocessing.Pool(processes=concurrency, initializer=set_global_session,
+                              initargs=(policy,)) as pool:
+        return pool.map(download_site, sites)
+
+def fetch_all(sites, concurrency=DEFAULT_CONCURRENCY, policy=None) -> List[FetchResult]:
+    """Descarga las URLs con un pool de procesos (ver ``downloader.fetch_all``)."""
+    return download_all_sites(sites, concurrency, policy)
+
+def download_to_disk_once(target, chunk_size, resume, algorithm, progress, limit=None):
+    url, path = target
+    writer = StreamWriter(url, path, resume, algorithm, progress)
+    inicio = time.perf_counter()
+    try:
+        with session.get(url, headers=writer.request_headers(), stream=True,
+                         timeout=policy.timeouts(limit)) as response:
+            if writer.start(response.status_code, response.headers):
+                for chunk in iter_body(response, chunk_size, limit):
+                    writer.write(chunk)
+            if not writer.restart:
+                return writer.finish(response.status_code, time.perf_counter() - inicio)
+    except (requests.Timeout, DeadlineExceeded) as error:
+        return writer.fail(error, time.perf_counter() - inicio, TIMEOUT)
+    except (requests.RequestException, OSError) as error:
+        return writer.fail(error, time.perf_counter() - inicio)
+    # El .part no correspondía al archivo remoto: se descartó y se pide completo
+    return download_to_disk_once(target, chunk_size, resume, algorithm, progress, limit)
+
+def download_to_disk(target, chunk_size, resume, algorithm, progress):
+    return policy.run(target[0], lambda limite: download_to_disk_once(target, chunk_size, resume,
+                                                                      algorithm, progress, limite))
+
+def download_all(targets, concurrency, chunk_size, resume, algorithm, progress,
+                 policy=None) -> List[FetchResult]:
+    """Descarga a disco con un pool de procesos (ver ``downloader.download_all``)."""
+    descargar = functools.partial(download_to_disk, chunk_size=chunk_size, resume=resume,
+                                  algorithm=algorithm, progress=progress)
+    with multiprocessing.Pool(processes=concurrency, initializer=set_global_session,
+                              initargs=(policy,)) as pool:
+        return pool.map(descargar, targets)
 
 def main():
-    urls = {
-        "imagen": "https://images.unsplash.com/photo-1506905925346-21bda4d32df4?w=800",
-        "json": "https://jsonplaceholder.typicode.com/posts/1",
-        "csv": "https://raw.githubusercontent.com/plotly/datasets/master/tips.csv",
-        "texto": "https://www.gutenberg.org/files/11/11-0.txt",
-        "xml": "https://www.w3schools.com/xml/note.xml",
-        "pdf": "https://www.w3.org/WAI/ER/tests/xhtml/testfiles/resources/pdf/dummy.pdf",
-    }
-    
-    sites = list(urls.values())
+    sites = list(URLS.values())
     start_time = time.time()
-    download_all_sites(sites)
+    results = download_all_sites(sites)
     duration = time.time() - start_time
+    for r in results:
+        print(r)
     print(duration)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
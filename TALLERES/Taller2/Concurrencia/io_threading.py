@@ -1,16 +1,13 @@
 import concurrent.futures
+import functools
 import requests
 import threading
 import time
+from typing import List
 
-urls = {
-        "imagen": "https://images.unsplash.com/photo-1506905925346-21bda4d32df4?w=800",
-        "json": "https://jsonplaceholder.typicode.com/posts/1",
-        "csv": "https://raw.githubusercontent.com/plotly/datasets/master/tips.csv",
-        "texto": "https://www.gutenberg.org/files/11/11-0.txt",
-        "xml": "https://www.w3schools.com/xml/note.xml",
-        "pdf": "https://www.w3.org/WAI/ER/tests/xhtml/testfiles/resources/pdf/dummy.pdf",
-        }
+from downloader import (CHUNK_SIZE, DEFAULT_CONCURRENCY, URLS, FetchResult, StreamWriter, _failed,
+                        _retry_after)
+from policies import CONNECTION, DEFAULT_POLICIES, TIMEOUT, DeadlineExceeded, time_left
 
 thread_local = threading.local()
 
@@ -19,21 +16,94 @@ def get_session():
         thread_local.session = requests.Session()
     return thread_local.session
 
-def download_site(url):
+def iter_body(response, chunk_size, limit):
+    """
+    Bloques del cuerpo de una respuesta pedida con ``stream=True``.
+
+    El tiempo límite de lectura de ``requests`` se aplica a cada lectura del
+    socket, así que una respuesta que llega de a pocos bytes nunca lo
+    dispara; por eso se revisa el plazo total (``limit``) tras cada bloque.
+    Con urllib3 2.x se usa ``read1``, que retorna apenas hay datos en lugar
+    de esperar a juntar ``chunk_size`` bytes.
+    """
+    leer = getattr(response.raw, "read1", None)
+    if leer is not None:
+        bloques = iter(functools.partial(leer, chunk_size, decode_content=True), b"")
+    else:
+        bloques = response.iter_content(chunk_size)
+    for bloque in bloques:
+        time_left(limit)
+        yield bloque
+
+def download_once(session, url, policy, limit=None):
+    inicio = time.perf_counter()
+    try:
+        with session.get(url, stream=True, timeout=policy.timeouts(limit)) as response:
+            contenido = b"".join(iter_body(response, CHUNK_SIZE, limit))
+            return FetchResult(url, response.status_code, contenido, time.perf_counter() - inicio,
+                               retry_after=_retry_after(response.headers))
+    except (requests.Timeout, DeadlineExceeded) as error:
+        return _failed(url, error, time.perf_counter() - inicio, TIMEOUT)
+    except requests.RequestException as error:
+        return _failed(url, error, time.perf_counter() - inicio, CONNECTION)
+
+def download_site(url, policy=None):
+    policy = policy or DEFAULT_POLICIES["threads"]
+    session = get_session()
+    return policy.run(url, lambda limite: download_once(session, url, policy, limite))
+
+def download_all_sites(sites, concurrency=DEFAULT_CONCURRENCY, policy=None):
+    descargar = functools.partial(download_site, policy=policy)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return list(executor.map(descargar, sites))
+
+def fetch_all(sites, concurrency=DEFAULT_CONCURRENCY, policy=None) -> List[FetchResult]:
+    """Descarga las URLs con un pool de hilos (ver ``downloader.fetch_all``)."""
+    return download_all_sites(sites, concurrency, policy)
+
+def download_to_disk_once(session, target, chunk_size, resume, algorithm, progress, policy,
+                          limit=None):
+    url, path = target
+    writer = StreamWriter(url, path, resume, algorithm, progress)
+    inicio = time.perf_counter()
+    try:
+        with session.get(url, headers=writer.request_headers(), stream=True,
+                         timeout=policy.timeouts(limit)) as response:
+            if writer.start(response.status_code, response.headers):
+                for chunk in iter_body(response, chunk_size, limit):
+                    writer.write(chunk)
+            if not writer.restart:
+                return writer.finish(response.status_code, time.perf_counter() - inicio)
+    except (requests.Timeout, DeadlineExceeded) as error:
+        return writer.fail(error, time.perf_counter() - inicio, TIMEOUT)
+    except (requests.RequestException, OSError) as error:
+        return writer.fail(error, time.perf_counter() - inicio)
+    # El .part no correspondía al archivo remoto: se descartó y se pide completo
+    return download_to_disk_once(session, target, chunk_size, resume, algorithm, progress, policy,
+                                 limit)
+
+def download_to_disk(target, chunk_size, resume, algorithm, progress, policy=None):
+    policy = policy or DEFAULT_POLICIES["threads"]
     session = get_session()
-    with session.get(url) as response:
-        return len(response.content)
+    return policy.run(target[0], lambda limite: download_to_disk_once(
+        session, target, chunk_size, resume, algorithm, progress, policy, limite))
 
-def download_all_sites(sites):
-    with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-        executor.map(download_site, sites)
+def download_all(targets, concurrency, chunk_size, resume, algorithm, progress,
+                 policy=None) -> List[FetchResult]:
+    """Descarga a disco con un pool de hilos (ver ``downloader.download_all``)."""
+    descargar = functools.partial(download_to_disk, chunk_size=chunk_size, resume=resume,
+                                  algorithm=algorithm, progress=progress, policy=policy)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return list(executor.map(descargar, targets))
 
 def main():
-    sites = list(urls.values())
+    sites = list(URLS.values())
     start_time = time.time()
-    download_all_sites(sites)
+    results = download_all_sites(sites)
     duration = time.time() - start_time
+    for r in results:
+        print(r)
     print(duration)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
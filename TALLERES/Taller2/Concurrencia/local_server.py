@@ -0,0 +1,218 @@
+"""
+Servidor HTTP local para pruebas
+================================
+
+Sirve cuerpos de tamaño configurable con latencia, jitter y tasa de
+errores inyectados, para medir los motores de descarga sin depender de
+internet y con resultados reproducibles.
+
+Rutas:
+
+- ``/`` o ``/<nombre>``: cuerpo de ``size`` bytes.
+- ``/bytes/<n>``: cuerpo de n bytes.
+
+Los parámetros de la consulta reemplazan la configuración para esa
+petición: ``?latency=0.1&jitter=0.02&error_rate=0.5``. Se atienden
+peticiones ``Range: bytes=<inicio>-`` (respuesta 206), así que también
+sirve para probar las descargas reanudables.
+
+Uso::
+
+    with LocalServer(size=64 * 1024, latency=0.05, jitter=0.01) as servidor:
+        fetch_all(servidor.urls(100), backend="asyncio")
+
+o desde la línea de comandos::
+
+    python local_server.py --port 8000 --size 65536 --latency 0.05 --error-rate 0.01
+"""
+
+import argparse
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+# Bloque que se repite para formar los cuerpos (y tamaño de cada escritura).
+_BLOCK = bytes(range(256)) * 256
+
+
+class ServerConfig:
+    """
+    Configuración del servidor.
+
+    Atributos:
+        size: Bytes del cuerpo por defecto
+        latency: Segundos de espera antes de responder
+        jitter: Variación máxima (±) de la latencia
+        error_rate: Probabilidad de responder 503
+    """
+
+    def __init__(self, size: int = 64 * 1024, latency: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0, seed: Optional[int] = None):
+        if size < 0 or latency < 0 or jitter < 0 or not 0 <= error_rate <= 1:
+            raise ValueError("Configuración inválida del servidor")
+        self.size = size
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def draw(self, latency: float, jitter: float, error_rate: float):
+        """Sortea la espera y si la petición falla."""
+        with self._lock:
+            espera = max(0.0, latency + self.random.uniform(-jitter, jitter))
+            falla = self.random.random() < error_rate
+        return espera, falla
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        config = self.server.config
+        partes = urlsplit(self.path)
+        consulta = {clave: float(valores[-1]) for clave, valores in parse_qs(partes.query).items()
+                    if clave in ("latency", "jitter", "error_rate")}
+        espera, falla = config.draw(consulta.get("latency", config.latency),
+                                    consulta.get("jitter", config.jitter),
+                                    consulta.get("error_rate", config.error_rate))
+        if espera:
+            time.sleep(espera)
+        if falla:
+            self._reply_empty(503)
+            return
+
+        coincidencia = re.fullmatch(r"/bytes/(\d+)", partes.path)
+        tamaño = int(coincidencia.group(1)) if coincidencia else config.size
+        inicio = 0
+        rango = re.fullmatch(r"bytes=(\d+)-", self.headers.get("Range", ""))
+        if rango:
+            inicio = int(rango.group(1))
+            if inicio >= tamaño:
+                self._reply_empty(416, {"Content-Range": f"bytes */{tamaño}"})
+                return
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {inicio}-{tamaño - 1}/{tamaño}")
+        else:
+            self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(tamaño - inicio))
+        self.end_headers()
+
+        posicion = inicio
+        while posicion < tamaño:
+            desplazamiento = posicion % len(_BLOCK)
+            bloque = _BLOCK[desplazamiento:desplazamiento + tamaño - posicion]
+            self.wfile.write(bloque)
+            posicion += len(bloque)
+
+    def _reply_empty(self, status: int, headers: Optional[dict] = None):
+        self.send_response(status)
+        for nombre, valor in (headers or {}).items():
+            self.send_header(nombre, valor)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+class LocalServer:
+    """
+    Servidor HTTP en un hilo aparte, usable como administrador de contexto.
+    """
+
+    def __init__(self, size: int = 64 * 1024, latency: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0, host: str = "127.0.0.1", port: int = 0,
+                 seed: Optional[int] = None):
+        """
+        Args:
+            size: Bytes del cuerpo por defecto
+            latency: Segundos de espera antes de responder
+            jitter: Variación máxima (±) de la latencia
+            error_rate: Probabilidad de responder 503
+            host: Dirección donde escuchar
+            port: Puerto (0 elige uno libre)
+            seed: Semilla del sorteo de latencias y errores
+        """
+        self.config = ServerConfig(size, latency, jitter, error_rate, seed)
+        self._server = _Server((host, port), _Handler)
+        self._server.config = self.config
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """URL base del servidor."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def urls(self, count: int, size: Optional[int] = None) -> List[str]:
+        """
+        URLs distintas del servidor.
+
+        Args:
+            count: Cantidad de URLs
+            size: Bytes de cada cuerpo (por defecto los de la configuración)
+
+        Returns:
+            Lista de URLs
+        """
+        if size is None:
+            return [f"{self.url}/archivo{i}" for i in range(count)]
+        return [f"{self.url}/bytes/{size}?n={i}" for i in range(count)]
+
+    def start(self) -> 'LocalServer':
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """Atiende peticiones en el hilo actual hasta Ctrl+C."""
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._server.server_close()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> 'LocalServer':
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Servidor HTTP local con latencia y errores inyectados")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--size", type=int, default=64 * 1024, help="bytes por respuesta")
+    parser.add_argument("--latency", type=float, default=0.0, help="segundos antes de responder")
+    parser.add_argument("--jitter", type=float, default=0.0, help="variación (±) de la latencia")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="probabilidad de responder 503")
+    parser.add_argument("--seed", type=int, help="semilla del sorteo")
+    args = parser.parse_args(argv)
+
+    servidor = LocalServer(args.size, args.latency, args.jitter, args.error_rate,
+                           args.host, args.port, args.seed)
+    print(f"Sirviendo en {servidor.url} (Ctrl+C para terminar)")
+    servidor.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,383 @@
+"""
+Políticas de reintento, tiempo límite y cortacircuitos
+======================================================
+
+Una ``Policy`` define, para cada URL:
+
+- Tiempos límite de conexión y de lectura (``connect_timeout``, ``read_timeout``).
+- Reintentos con espera exponencial y *jitter* completo: antes del intento
+  n+1 se espera un tiempo al azar entre 0 y ``min(max_backoff, backoff·2^n)``.
+- Un plazo total (``deadline``) que incluye todos los intentos y esperas,
+  para acotar la latencia de cola. Cada intento recibe el instante límite
+  y los motores lo usan como tiempo límite de la petición completa, así
+  que una respuesta que llega byte a byte también se corta.
+- Un cortacircuitos por host: tras ``breaker_threshold`` fallas seguidas
+  el host queda "abierto" y sus URLs fallan de inmediato durante
+  ``breaker_reset`` segundos; luego se deja pasar un intento de prueba
+  ("semiabierto") que lo cierra si tiene éxito.
+
+Cada intento fallido queda registrado como un ``Failure`` en
+``FetchResult.failures``, y ``failure_report`` resume las fallas de un lote.
+
+Con el motor de procesos cada proceso tiene sus propios cortacircuitos.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+# Tipos de falla de un intento.
+TIMEOUT = "timeout"
+CONNECTION = "connection"
+HTTP = "http"
+CIRCUIT_OPEN = "circuit_open"
+
+# Códigos HTTP que vale la pena reintentar (y que cuentan como falla del host).
+RETRYABLE_STATUS = frozenset({408, 429, 500, 502, 503, 504})
+
+
+class DeadlineExceeded(TimeoutError):
+    """Se agotó el plazo total (``Policy.deadline``) de una URL."""
+
+
+def time_left(limit: Optional[float]) -> Optional[float]:
+    """
+    Segundos que faltan para ``limit``, un instante de ``time.monotonic()``.
+
+    Returns:
+        Los segundos restantes, o None si no hay plazo
+
+    Raises:
+        DeadlineExceeded: Si el plazo ya pasó
+    """
+    if limit is None:
+        return None
+    restante = limit - time.monotonic()
+    if restante <= 0:
+        raise DeadlineExceeded("Se agotó el plazo total")
+    return restante
+
+
+class Failure:
+    """
+    Registro de un intento fallido.
+
+    Atributos:
+        attempt: Número de intento (desde 1)
+        kind: "timeout", "connection", "http" o "circuit_open"
+        detail: Descripción del error o código HTTP
+        elapsed: Segundos que tardó el intento
+    """
+
+    def __init__(self, attempt: int, kind: str, detail: str, elapsed: float):
+        self.attempt = attempt
+        self.kind = kind
+        self.detail = detail
+        self.elapsed = elapsed
+
+    def __repr__(self) -> str:
+        return f"Failure(intento={self.attempt}, tipo={self.kind}, {self.detail!r}, {self.elapsed:.3f}s)"
+
+
+class Policy:
+    """
+    Política de tiempos límite, reintentos y cortacircuitos.
+    """
+
+    def __init__(self, connect_timeout: float = 5.0, read_timeout: float = 30.0,
+                 retries: int = 3, backoff: float = 0.5, max_backoff: float = 30.0,
+                 deadline: Optional[float] = None, breaker_threshold: int = 5,
+                 breaker_reset: float = 30.0):
+        """
+        Args:
+            connect_timeout: Segundos máximos para establecer la conexión
+            read_timeout: Segundos máximos sin recibir datos
+            retries: Reintentos después del primer intento
+            backoff: Espera base (segundos) entre intentos
+            max_backoff: Tope de la espera entre intentos
+            deadline: Plazo total por URL, con reintentos (None = sin plazo)
+            breaker_threshold: Fallas seguidas de un host que abren su
+                cortacircuitos (0 lo desactiva)
+            breaker_reset: Segundos que el cortacircuitos queda abierto
+        """
+        if retries < 0 or backoff < 0 or max_backoff < 0:
+            raise ValueError("Los reintentos y las esperas no pueden ser negativos")
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.deadline = deadline
+        self.breaker_threshold = breaker_threshold
+        self.breaker_reset = breaker_reset
+        self.breakers = BreakerRegistry(breaker_threshold, breaker_reset)
+
+    def __getstate__(self) -> dict:
+        # Los cortacircuitos (con su lock) no viajan a otros procesos
+        estado = self.__dict__.copy()
+        del estado["breakers"]
+        return estado
+
+    def __setstate__(self, estado: dict):
+        self.__dict__.update(estado)
+        self.breakers = BreakerRegistry(self.breaker_threshold, self.breaker_reset)
+
+    def __repr__(self) -> str:
+        return (f"Policy(connect_timeout={self.connect_timeout}, read_timeout={self.read_timeout}, "
+                f"retries={self.retries}, backoff={self.backoff}, deadline={self.deadline}, "
+                f"breaker_threshold={self.breaker_threshold})")
+
+    def timeouts(self, limit: Optional[float]) -> Tuple[float, float]:
+        """
+        Tiempos límite (conexión, lectura) de un intento, sin pasar de ``limit``.
+
+        Raises:
+            DeadlineExceeded: Si el plazo ya pasó
+        """
+        restante = time_left(limit)
+        if restante is None:
+            return self.connect_timeout, self.read_timeout
+        return min(self.connect_timeout, restante), min(self.read_timeout, restante)
+
+    def delay(self, attempt: int) -> float:
+        """Espera antes del intento ``attempt + 1`` (jitter completo)."""
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))
+
+    def _next_delay(self, result, attempt: int, start: float) -> Optional[float]:
+        """
+        Decide si se reintenta tras un intento.
+
+        Returns:
+            La espera antes del siguiente intento, o None si no se reintenta
+        """
+        if attempt > self.retries or not _retryable(result):
+            return None
+        espera = self.delay(attempt)
+        if result.retry_after is not None and result.retry_after <= self.max_backoff:
+            espera = max(espera, result.retry_after)
+        if self.deadline is not None and time.monotonic() - start + espera >= self.deadline:
+            return None
+        return espera
+
+    def run(self, url: str, attempt: Callable[[Optional[float]], object]):
+        """
+        Ejecuta los intentos de una URL aplicando la política (motores síncronos).
+
+        Args:
+            url: La URL
+            attempt: Función que hace un intento y retorna un ``FetchResult``.
+                Recibe el instante límite del plazo total (de
+                ``time.monotonic()``, o None sin plazo) y no debe pasarse de
+                él. Si lanza una excepción, cuenta como falla del host y se
+                propaga
+
+        Returns:
+            El ``FetchResult`` del último intento, con ``failures`` y ``attempts``
+        """
+        cortacircuitos = self.breakers.get(url)
+        fallas = []
+        inicio = time.monotonic()
+        limite = None if self.deadline is None else inicio + self.deadline
+        intento = 0
+        while True:
+            intento += 1
+            if limite is not None and time.monotonic() >= limite:
+                return _deadline_exceeded(url, intento, fallas)
+            if not cortacircuitos.allow():
+                return _circuit_open(url, intento, fallas)
+            try:
+                resultado = attempt(limite)
+            except BaseException:
+                # Una excepción no debe dejar el cortacircuitos semiabierto para siempre
+                cortacircuitos.record_failure()
+                raise
+            _record(cortacircuitos, resultado, intento, fallas)
+            espera = self._next_delay(resultado, intento, inicio)
+            if espera is None:
+                return _finish(resultado, intento, fallas)
+            time.sleep(espera)
+
+    async def run_async(self, url: str, attempt: Callable[[Optional[float]], Awaitable[object]]):
+        """Como ``run``, pero con intentos y esperas asíncronos."""
+        cortacircuitos = self.breakers.get(url)
+        fallas = []
+        inicio = time.monotonic()
+        limite = None if self.deadline is None else inicio + self.deadline
+        intento = 0
+        while True:
+            intento += 1
+            if limite is not None and time.monotonic() >= limite:
+                return _deadline_exceeded(url, intento, fallas)
+            if not cortacircuitos.allow():
+                return _circuit_open(url, intento, fallas)
+            try:
+                resultado = await attempt(limite)
+            except BaseException:
+                # Una excepción no debe dejar el cortacircuitos semiabierto para siempre
+                cortacircuitos.record_failure()
+                raise
+            _record(cortacircuitos, resultado, intento, fallas)
+            espera = self._next_delay(resultado, intento, inicio)
+            if espera is None:
+                return _finish(resultado, intento, fallas)
+            await asyncio.sleep(espera)
+
+
+def _retryable(result) -> bool:
+    """Indica si el resultado de un intento es una falla transitoria."""
+    if result.error is not None:
+        return result.error_kind in (TIMEOUT, CONNECTION)
+    return result.status in RETRYABLE_STATUS
+
+
+def _record(breaker: 'CircuitBreaker', result, attempt: int, failures: List[Failure]):
+    """Anota el intento en el cortacircuitos y, si falló, en la lista de fallas."""
+    if result.error is not None:
+        failures.append(Failure(attempt, result.error_kind or CONNECTION, result.error, result.latency))
+        breaker.record_failure()
+    elif result.status in RETRYABLE_STATUS:
+        failures.append(Failure(attempt, HTTP, f"HTTP {result.status}", result.latency))
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+
+
+def _finish(result, attempts: int, failures: List[Failure]):
+    result.attempts = attempts
+    result.failures = failures
+    return result
+
+
+def _circuit_open(url: str, attempt: int, failures: List[Failure]):
+    from downloader import FetchResult
+    detalle = f"Cortacircuitos abierto para {host_of(url)}"
+    failures.append(Failure(attempt, CIRCUIT_OPEN, detalle, 0.0))
+    resultado = FetchResult(url, error=detalle, error_kind=CIRCUIT_OPEN)
+    return _finish(resultado, attempt, failures)
+
+
+def _deadline_exceeded(url: str, attempt: int, failures: List[Failure]):
+    from downloader import FetchResult
+    detalle = "Se agotó el plazo total antes del intento"
+    failures.append(Failure(attempt, TIMEOUT, detalle, 0.0))
+    resultado = FetchResult(url, error=detalle, error_kind=TIMEOUT)
+    return _finish(resultado, attempt, failures)
+
+
+def host_of(url: str) -> str:
+    """Host (con puerto) de una URL."""
+    return urlsplit(url).netloc
+
+
+# =============================================================================
+# CORTACIRCUITOS
+# =============================================================================
+
+class CircuitBreaker:
+    """
+    Cortacircuitos de un host: cerrado, abierto o semiabierto.
+    """
+
+    CLOSED = "cerrado"
+    OPEN = "abierto"
+    HALF_OPEN = "semiabierto"
+
+    def __init__(self, threshold: int, reset: float):
+        self.threshold = threshold
+        self.reset = reset
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Indica si se puede intentar; en semiabierto deja pasar un solo intento."""
+        if self.threshold <= 0:
+            return True
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.reset:
+                self.state = self.HALF_OPEN
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or (self.threshold > 0 and self.failures >= self.threshold):
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def __repr__(self) -> str:
+        return f"CircuitBreaker({self.state}, fallas={self.failures})"
+
+
+class BreakerRegistry:
+    """Cortacircuitos por host, creados a demanda."""
+
+    def __init__(self, threshold: int, reset: float):
+        self.threshold = threshold
+        self.reset = reset
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> CircuitBreaker:
+        """Cortacircuitos del host de la URL."""
+        host = host_of(url)
+        with self._lock:
+            cortacircuitos = self._breakers.get(host)
+            if cortacircuitos is None:
+                cortacircuitos = self._breakers[host] = CircuitBreaker(self.threshold, self.reset)
+            return cortacircuitos
+
+    def states(self) -> Dict[str, str]:
+        """Estado del cortacircuitos de cada host visto."""
+        with self._lock:
+            return {host: c.state for host, c in self._breakers.items()}
+
+
+# Política por defecto de cada motor; se puede reemplazar, por ejemplo
+# ``DEFAULT_POLICIES["asyncio"] = Policy(read_timeout=5)``.
+DEFAULT_POLICIES = {
+    "asyncio": Policy(),
+    "threads": Policy(),
+    "processes": Policy(),
+}
+
+
+def failure_report(results: list) -> dict:
+    """
+    Resume las fallas de un lote de resultados.
+
+    Args:
+        results: Los ``FetchResult`` retornados por un motor
+
+    Returns:
+        Diccionario con "total", "failed" (URLs que terminaron en error o
+        con un código >= 400), "retried" (URLs que necesitaron más de un
+        intento), "by_kind" (intentos fallidos por tipo) y "by_host"
+        (intentos fallidos por host)
+    """
+    por_tipo: Dict[str, int] = {}
+    por_host: Dict[str, int] = {}
+    for resultado in results:
+        for falla in resultado.failures:
+            por_tipo[falla.kind] = por_tipo.get(falla.kind, 0) + 1
+            host = host_of(resultado.url)
+            por_host[host] = por_host.get(host, 0) + 1
+    return {
+        "total": len(results),
+        "failed": [r.url for r in results if r.error is not None or (r.status or 0) >= 400],
+        "retried": [r.url for r in results if r.attempts > 1],
+        "by_kind": por_tipo,
+        "by_host": por_host,
+    }
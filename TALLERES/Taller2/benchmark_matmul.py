@@ -0,0 +1,85 @@
+"""
+Benchmark de la multiplicación de matrices
+==========================================
+
+Compara el bucle clásico i-j-k de la implementación original de
+``matrix_multiply`` (listas de listas indexadas con ``.values``) con el
+kernel de la librería (operando derecho transpuesto y ``math.sumprod`` en
+Python 3.12+), y con Strassen-Winograd para varios tamaños de corte (junto
+con su error frente al resultado clásico). Ambos caminos se miden con el
+motor Python aunque NumPy esté instalado.
+
+Uso:
+    python benchmark_matmul.py [tamaño] [repeticiones]
+"""
+import math
+import random
+import sys
+import time
+
+from linearAlg import Matrix, matrix_multiply, set_backend
+
+
+class MatrizListas:
+    """Contenedor mínimo con la representación original (lista de listas)."""
+
+    def __init__(self, data):
+        self.values = data
+
+
+def multiplicacion_clasica(m1, m2):
+    """Bucle i-j-k original de ``matrix_multiply``, usado como referencia."""
+    result = []
+    for i in range(len(m1.values)):
+        fila = []
+        for j in range(len(m2.values[0])):
+            suma = 0
+            for k in range(len(m2.values)):
+                suma += m1.values[i][k] * m2.values[k][j]
+            fila.append(suma)
+        result.append(fila)
+    return result
+
+
+def medir(funcion, repeticiones):
+    """Retorna el mejor tiempo (en segundos) de varias ejecuciones."""
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def main(n=200, repeticiones=3):
+    """Mide ambos caminos para matrices n x n y verifica que coincidan."""
+    set_backend("python")
+    datos_a = [[random.random() for _ in range(n)] for _ in range(n)]
+    datos_b = [[random.random() for _ in range(n)] for _ in range(n)]
+    m1, m2 = Matrix(datos_a), Matrix(datos_b)
+    l1, l2 = MatrizListas(datos_a), MatrizListas(datos_b)
+
+    esperado = multiplicacion_clasica(l1, l2)
+    obtenido = matrix_multiply(m1, m2, strassen=False).values
+    error = max(abs(x - y) for fa, fb in zip(esperado, obtenido) for x, y in zip(fa, fb))
+
+    t_clasico = medir(lambda: multiplicacion_clasica(l1, l2), repeticiones)
+    print(f"Multiplicación {n}x{n} (mejor de {repeticiones})")
+    print(f"  bucle clásico i-j-k: {t_clasico:.4f} s")
+    producto_punto = "math.sumprod" if hasattr(math, "sumprod") else "sum(map(mul))"
+    t_kernel = medir(lambda: matrix_multiply(m1, m2, strassen=False), repeticiones)
+    print(f"  kernel transpuesto ({producto_punto}): {t_kernel:.4f} s  "
+          f"-> {t_clasico / t_kernel:.1f}x")
+    print(f"  error máximo frente al bucle clásico: {error:.2e}")
+
+    for corte in (32, 64, 128):
+        t_strassen = medir(lambda: matrix_multiply(m1, m2, strassen=True, cutoff=corte), repeticiones)
+        obtenido = matrix_multiply(m1, m2, strassen=True, cutoff=corte).values
+        error = max(abs(x - y) for fa, fb in zip(esperado, obtenido) for x, y in zip(fa, fb))
+        print(f"  Strassen-Winograd (corte={corte:>3}): {t_strassen:.4f} s  "
+              f"-> {t_clasico / t_strassen:.1f}x  error máximo: {error:.2e}")
+
+
+if __name__ == "__main__":
+    argumentos = [int(x) for x in sys.argv[1:3]]
+    main(*argumentos)
@@ -0,0 +1,252 @@
+"""
+Suite de benchmarks de linearAlg
+================================
+
+Mide operaciones de ``Vector`` (suma, producto punto, magnitud,
+normalización) y de ``Matrix`` (``matrix_multiply``, ``transpose``,
+``determinant`` e ``inverse``) para tamaños de 2 a 512, con cada motor de
+cálculo disponible (Python puro y, si está instalado, NumPy).
+
+Los resultados se pueden guardar en JSON y comparar contra una línea base
+guardada antes: si alguna medición empeora más que el umbral indicado, el
+programa lo informa y termina con código de salida 1.
+
+La línea base del repositorio es ``benchmark_baseline.json``, junto a este
+archivo (``--baseline`` sin valor la usa). Los tiempos dependen de la
+máquina, así que conviene regenerarla en la máquina donde se compara,
+antes de los cambios a medir:
+
+    python benchmark_suite.py --output benchmark_baseline.json
+
+Uso:
+    python benchmark_suite.py                              # todos los tamaños
+    python benchmark_suite.py --sizes 2 8 32 --output actual.json
+    python benchmark_suite.py --baseline                   # contra benchmark_baseline.json
+    python benchmark_suite.py --baseline base.json --threshold 0.15
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+from datetime import datetime, timezone
+
+from linearAlg import Vector, Matrix, matrix_multiply, transpose, determinant, inverse
+from linearAlg import dot_product, magnitude, normalize, set_backend, get_backend
+from linearAlg.backend import BACKENDS
+
+TAMAÑOS = [2, 4, 8, 16, 32, 64, 128, 256, 512]
+
+# Línea base guardada en el repositorio.
+LINEA_BASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_baseline.json")
+
+# Tiempo mínimo (segundos) de cada repetición: las operaciones rápidas se
+# ejecutan varias veces seguidas para que el reloj las pueda medir.
+TIEMPO_MINIMO = 0.05
+
+
+def vector_aleatorio(n):
+    return Vector([random.uniform(-1, 1) for _ in range(n)])
+
+
+def matriz_aleatoria(n):
+    """Matriz n x n con diagonal dominante, para que sea invertible."""
+    filas = [[random.uniform(-1, 1) for _ in range(n)] for _ in range(n)]
+    for i in range(n):
+        filas[i][i] += n
+    return Matrix(filas)
+
+
+def operaciones(n):
+    """
+    Casos de prueba para el tamaño n.
+
+    Returns:
+        Lista de (nombre, función). Las operaciones de matrices descartan
+        antes los resultados memorizados para medir siempre el cálculo real.
+    """
+    v1, v2 = vector_aleatorio(n), vector_aleatorio(n)
+    m1, m2 = matriz_aleatoria(n), matriz_aleatoria(n)
+
+    def sin_memoria(funcion):
+        def medir_sin_memoria():
+            m1.clear_cache()
+            return funcion()
+        return medir_sin_memoria
+
+    return [
+        ("vector_add", lambda: v1 + v2),
+        ("dot_product", lambda: dot_product(v1, v2)),
+        ("magnitude", lambda: magnitude(v1)),
+        ("normalize", lambda: normalize(v1)),
+        ("matrix_multiply", lambda: matrix_multiply(m1, m2)),
+        ("transpose", sin_memoria(lambda: transpose(m1))),
+        ("determinant", sin_memoria(lambda: determinant(m1))),
+        ("inverse", sin_memoria(lambda: inverse(m1))),
+    ]
+
+
+def medir(funcion, repeticiones):
+    """
+    Mide el tiempo por llamada de una función.
+
+    Returns:
+        El mejor tiempo por llamada (en segundos) entre las repeticiones
+    """
+    inicio = time.perf_counter()
+    funcion()
+    llamadas = max(1, int(TIEMPO_MINIMO / max(time.perf_counter() - inicio, 1e-9)))
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        for _ in range(llamadas):
+            funcion()
+        mejor = min(mejor, (time.perf_counter() - inicio) / llamadas)
+    return mejor
+
+
+def motores_disponibles():
+    """Motores de cálculo que se pueden activar en este entorno."""
+    disponibles = []
+    original = get_backend()
+    for motor in BACKENDS:
+        try:
+            set_backend(motor)
+        except ImportError:
+            continue
+        disponibles.append(motor)
+    set_backend(original)
+    return disponibles
+
+
+def ejecutar(tamaños, motores, repeticiones, seleccion=None):
+    """
+    Corre la suite completa.
+
+    Args:
+        tamaños: Tamaños n de vectores y matrices (n x n)
+        motores: Motores de cálculo a comparar
+        repeticiones: Repeticiones por medición (se toma la mejor)
+        seleccion: Nombres de operaciones a medir (todas si es None)
+
+    Returns:
+        Lista de resultados {"operation", "backend", "size", "seconds"}
+    """
+    resultados = []
+    original = get_backend()
+    try:
+        for n in tamaños:
+            random.seed(n)
+            casos = operaciones(n)
+            for motor in motores:
+                set_backend(motor)
+                for nombre, funcion in casos:
+                    if seleccion and nombre not in seleccion:
+                        continue
+                    segundos = medir(funcion, repeticiones)
+                    resultados.append({"operation": nombre, "backend": motor,
+                                       "size": n, "seconds": segundos})
+                    print(f"  {nombre:<16} {motor:<7} n={n:<4} {segundos * 1e3:12.4f} ms",
+                          file=sys.stderr)
+    finally:
+        set_backend(original)
+    return resultados
+
+
+def comparar_motores(resultados):
+    """Imprime, para cada medición, cuántas veces más rápido es NumPy que Python puro."""
+    tiempos = {(r["operation"], r["size"], r["backend"]): r["seconds"] for r in resultados}
+    filas = [(op, n, tiempos[(op, n, "python")] / tiempos[(op, n, "numpy")])
+             for (op, n, motor) in tiempos if motor == "numpy" and (op, n, "python") in tiempos]
+    if not filas:
+        return
+    print("\nComparación de motores (python / numpy):")
+    for op, n, aceleracion in filas:
+        print(f"  {op:<16} n={n:<4} {aceleracion:8.1f}x")
+
+
+def comparar_con_base(resultados, base, umbral):
+    """
+    Compara los resultados con una línea base.
+
+    Args:
+        resultados: Mediciones actuales
+        base: Mediciones de referencia (mismo formato)
+        umbral: Empeoramiento relativo tolerado (0.1 = 10 % más lento)
+
+    Returns:
+        Lista de regresiones (operación, motor, tamaño, antes, ahora)
+    """
+    referencia = {(r["operation"], r["backend"], r["size"]): r["seconds"] for r in base}
+    regresiones = []
+    print(f"\nComparación con la línea base (umbral {umbral:.0%}):")
+    for r in resultados:
+        clave = (r["operation"], r["backend"], r["size"])
+        if clave not in referencia:
+            continue
+        antes, ahora = referencia[clave], r["seconds"]
+        cambio = ahora / antes - 1
+        marca = ""
+        if cambio > umbral:
+            marca = "  <-- REGRESIÓN"
+            regresiones.append((*clave, antes, ahora))
+        print(f"  {clave[0]:<16} {clave[1]:<7} n={clave[2]:<4} "
+              f"{antes * 1e3:10.4f} ms -> {ahora * 1e3:10.4f} ms ({cambio:+.1%}){marca}")
+    return regresiones
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks de linearAlg")
+    parser.add_argument("--sizes", type=int, nargs="+", default=TAMAÑOS,
+                        help="tamaños a medir (por defecto de 2 a 512)")
+    parser.add_argument("--backends", nargs="+", choices=BACKENDS,
+                        help="motores a comparar (por defecto todos los disponibles)")
+    parser.add_argument("--operations", nargs="+", help="solo estas operaciones")
+    parser.add_argument("--repeat", type=int, default=3, help="repeticiones por medición")
+    parser.add_argument("--output", help="archivo JSON donde guardar los resultados")
+    parser.add_argument("--baseline", nargs="?", const=LINEA_BASE,
+                        help="archivo JSON con la línea base a comparar "
+                             "(sin valor: benchmark_baseline.json)")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="empeoramiento relativo tolerado frente a la base (0.10 = 10 %%)")
+    args = parser.parse_args(argv)
+
+    disponibles = motores_disponibles()
+    faltantes = [motor for motor in args.backends or [] if motor not in disponibles]
+    if faltantes:
+        parser.error(f"motor no disponible en este entorno: {', '.join(faltantes)} "
+                     f"(disponibles: {', '.join(disponibles)})")
+    motores = args.backends or disponibles
+    resultados = ejecutar(args.sizes, motores, args.repeat, args.operations)
+    comparar_motores(resultados)
+
+    documento = {
+        "meta": {
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "backends": motores,
+            "repeat": args.repeat,
+        },
+        "results": resultados,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as archivo:
+            json.dump(documento, archivo, indent=2)
+        print(f"\nResultados guardados en {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as archivo:
+            base = json.load(archivo)["results"]
+        regresiones = comparar_con_base(resultados, base, args.threshold)
+        if regresiones:
+            print(f"\n{len(regresiones)} regresión(es) por encima del {args.threshold:.0%}")
+            return 1
+        print("\nSin regresiones")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
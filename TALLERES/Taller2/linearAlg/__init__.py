@@ -11,7 +11,36 @@ Módulos disponibles:
 - Funciones de matriz: Operaciones con matrices
 """
 
-from .linAlg import Vector, Matrix
+from .linAlg import Vector, Matrix, LUDecomposition
+from .sparse import SparseMatrix
+from .structured import (
+    StructuredMatrix,
+    SymmetricMatrix,
+    LowerTriangular,
+    UpperTriangular,
+    DiagonalMatrix
+)
+from .batch import VectorBatch
+from .lazy import LazyExpr, lazy
+from .mapped import MappedMatrix, mapped_multiply
+from .solvers import (
+    SolverResult,
+    conjugate_gradient,
+    gmres,
+    bicgstab,
+    jacobi_preconditioner
+)
+from .decompositions import (
+    qr_decomposition,
+    symmetric_eigen,
+    power_iteration,
+    lanczos,
+    svd,
+    condition_number
+)
+from .backend import set_backend, get_backend
+from .profiling import Profiler, profile
+from .serialization import save, load, save_archive, load_archive
 from .linAlg import (
     # Funciones de vector
     dot_product,
@@ -29,6 +58,8 @@ from .linAlg import (
     transpose,
     determinant,
     inverse,
+    solve,
+    lu_decomposition,
     identity_matrix,
     zeros_matrix,
     ones_matrix
@@ -39,6 +70,29 @@ __author__ = "Estudiantes de Fundamentos de Programación"
 __all__ = [
     'Vector',
     'Matrix',
+    'LUDecomposition',
+    'SparseMatrix',
+    'StructuredMatrix',
+    'SymmetricMatrix',
+    'LowerTriangular',
+    'UpperTriangular',
+    'DiagonalMatrix',
+    'VectorBatch',
+    'LazyExpr',
+    'lazy',
+    'MappedMatrix',
+    'mapped_multiply',
+    'SolverResult',
+    'conjugate_gradient',
+    'gmres',
+    'bicgstab',
+    'jacobi_preconditioner',
+    'qr_decomposition',
+    'symmetric_eigen',
+    'power_iteration',
+    'lanczos',
+    'svd',
+    'condition_number',
     'dot_product',
     'magnitude',
     'normalize',
@@ -52,7 +106,17 @@ __all__ = [
     'transpose',
     'determinant',
     'inverse',
+    'solve',
+    'lu_decomposition',
     'identity_matrix',
     'zeros_matrix',
-    'ones_matrix'
+    'ones_matrix',
+    'set_backend',
+    'get_backend',
+    'Profiler',
+    'profile',
+    'save',
+    'load',
+    'save_archive',
+    'load_archive'
 ]
\ No newline at end of file
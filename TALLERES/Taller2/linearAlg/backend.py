@@ -0,0 +1,180 @@
+"""
+Selección del motor de cálculo de la librería
+=============================================
+
+La librería funciona en Python puro, pero si NumPy está instalado las
+operaciones más costosas de ``Vector`` y ``Matrix`` (producto punto,
+multiplicación, transpuesta, determinante e inversa) se despachan a
+kernels vectorizados de NumPy/BLAS.
+
+El motor se elige, en este orden:
+
+1. Con ``set_backend("python")`` o ``set_backend("numpy")``.
+2. Con la variable de entorno ``LINEARALG_BACKEND`` al importar la librería
+   (si el valor no se reconoce o NumPy no está instalado, se avisa con un
+   ``RuntimeWarning`` y se usa ``"python"``).
+3. Automáticamente: ``"numpy"`` si está instalado, ``"python"`` si no.
+"""
+
+import os
+import warnings
+from array import array
+from typing import List, Optional
+
+try:
+    import numpy
+except ImportError:  # NumPy es opcional
+    numpy = None
+
+BACKENDS = ("python", "numpy")
+ENV_VAR = "LINEARALG_BACKEND"
+
+# Por debajo de esta dimensión el producto punto se calcula en Python aun con
+# el motor NumPy: convertir los buffers cuesta más que la suma (el cruce
+# medido está entre 32 y 64 componentes).
+NUMPY_DOT_MIN_SIZE = 64
+
+_active = "python"
+
+
+def set_backend(name: str):
+    """
+    Selecciona el motor de cálculo.
+
+    Args:
+        name: "python" o "numpy"
+    """
+    global _active
+    name = name.strip().lower()
+    if name not in BACKENDS:
+        raise ValueError(f"Motor desconocido: {name}. Opciones: {', '.join(BACKENDS)}")
+    if name == "numpy" and numpy is None:
+        raise ImportError("El motor 'numpy' requiere tener NumPy instalado")
+    _active = name
+
+
+def get_backend() -> str:
+    """Retorna el nombre del motor de cálculo activo."""
+    return _active
+
+
+def use_numpy() -> bool:
+    """Indica si las operaciones deben despacharse a NumPy."""
+    return _active == "numpy"
+
+
+def use_numpy_dot(size: int) -> bool:
+    """Indica si un producto punto de ``size`` componentes debe despacharse a NumPy."""
+    return _active == "numpy" and size >= NUMPY_DOT_MIN_SIZE
+
+
+def _default_backend() -> str:
+    """Motor inicial: el de la variable de entorno o, si no hay, el más rápido disponible."""
+    elegido = os.environ.get(ENV_VAR)
+    if elegido:
+        return elegido
+    return "numpy" if numpy is not None else "python"
+
+
+# =============================================================================
+# KERNELS DE NUMPY
+# =============================================================================
+# Reciben y retornan los buffers row-major ``array('d')`` de ``Matrix``;
+# ``numpy.frombuffer`` los envuelve sin copiarlos.
+
+def _as_ndarray(buffer: array, rows: int, columns: int):
+    """Vista NumPy (sin copia) de un buffer row-major."""
+    return numpy.frombuffer(buffer, dtype=numpy.float64).reshape(rows, columns)
+
+
+def _to_buffer(result) -> array:
+    """Convierte un ndarray en un buffer ``array('d')`` row-major."""
+    buffer = array('d')
+    buffer.frombytes(numpy.ascontiguousarray(result, dtype=numpy.float64).tobytes())
+    return buffer
+
+
+def numpy_dot(x: List[float], y: List[float]) -> float:
+    """Producto punto de dos secuencias."""
+    return float(numpy.dot(numpy.asarray(x, dtype=numpy.float64),
+                           numpy.asarray(y, dtype=numpy.float64)))
+
+
+def numpy_matmul(a: array, b: array, rows: int, inner: int, columns: int) -> array:
+    """Producto de dos buffers (rows x inner) · (inner x columns)."""
+    return _to_buffer(_as_ndarray(a, rows, inner) @ _as_ndarray(b, inner, columns))
+
+
+def numpy_matvec(a: array, rows: int, columns: int, x: List[float]) -> List[float]:
+    """Producto de un buffer (rows x columns) por un vector."""
+    return (_as_ndarray(a, rows, columns) @ numpy.asarray(x, dtype=numpy.float64)).tolist()
+
+
+def numpy_transpose(a: array, rows: int, columns: int) -> array:
+    """Transpuesta de un buffer (rows x columns)."""
+    return _to_buffer(_as_ndarray(a, rows, columns).T)
+
+
+def numpy_determinant(a: array, n: int) -> float:
+    """Determinante de un buffer cuadrado n x n."""
+    return float(numpy.linalg.det(_as_ndarray(a, n, n)))
+
+
+def numpy_inverse(a: array, n: int) -> Optional[array]:
+    """Inversa de un buffer cuadrado n x n; retorna None si es singular."""
+    try:
+        return _to_buffer(numpy.linalg.inv(_as_ndarray(a, n, n)))
+    except numpy.linalg.LinAlgError:
+        return None
+
+
+def numpy_elementwise(a: array, b: array, operation: str) -> array:
+    """Operación elemento a elemento ("add", "sub", "mul" o "div") entre dos buffers."""
+    x = numpy.frombuffer(a, dtype=numpy.float64)
+    y = numpy.frombuffer(b, dtype=numpy.float64)
+    return _to_buffer(_UFUNCS[operation](x, y))
+
+
+def numpy_broadcast(a: array, rows: int, columns: int, v: List[float], axis: int,
+                    operation: str) -> array:
+    """Aplica un vector a cada fila (axis=1) o a cada columna (axis=0) de un buffer."""
+    x = numpy.asarray(v, dtype=numpy.float64)
+    if axis == 0:
+        x = x[:, None]
+    return _to_buffer(_UFUNCS[operation](_as_ndarray(a, rows, columns), x))
+
+
+def numpy_reduce(a: array, rows: int, columns: int, reduction: str, axis: Optional[int]):
+    """
+    Reducción ("sum", "mean" o "argmax") de un buffer (rows x columns).
+
+    Retorna un escalar si axis es None, o una lista por columna (axis=0) o
+    por fila (axis=1).
+    """
+    resultado = getattr(_as_ndarray(a, rows, columns), reduction)(axis=axis)
+    if axis is None:
+        return resultado.item()
+    return resultado.tolist()
+
+
+def numpy_norm(a: array, rows: int, columns: int, ord) -> float:
+    """Norma matricial ("fro", 1, 2 o inf) de un buffer (rows x columns)."""
+    return float(numpy.linalg.norm(_as_ndarray(a, rows, columns), ord))
+
+
+_UFUNCS = {} if numpy is None else {
+    "add": numpy.add, "sub": numpy.subtract, "mul": numpy.multiply, "div": numpy.true_divide,
+}
+
+def _init_backend():
+    """Fija el motor inicial; una variable de entorno inválida no impide importar la librería."""
+    global _active
+    try:
+        set_backend(_default_backend())
+    except (ValueError, ImportError) as error:
+        warnings.warn(f"{ENV_VAR} no es utilizable ({error}); se usa el motor 'python'",
+                      RuntimeWarning, stacklevel=2)
+        _active = "python"
+
+
+_init_backend()
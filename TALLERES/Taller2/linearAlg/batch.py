@@ -0,0 +1,196 @@
+"""
+Lotes de vectores
+=================
+
+``VectorBatch`` guarda N vectores de la misma dimensión d en un único
+buffer contiguo ``array('d')`` de N x d elementos (un vector por fila).
+Las operaciones por lotes (producto punto, normas, normalización, ángulos
+y producto cruz) recorren el buffer completo sin crear N objetos
+``Vector`` ni repetir la validación de dimensiones en cada par.
+
+La semántica es la misma que la de ``dot_product``, ``magnitude``,
+``normalize``, ``angle_between`` y ``cross_product`` aplicadas vector a
+vector, incluidos los errores para vectores nulos o no 3D.
+"""
+
+import math
+import operator
+from array import array
+from itertools import chain, repeat
+from typing import List, Sequence, Tuple, Union
+
+from .linAlg import Vector
+
+# Hasta esta dimensión las reducciones por fila se hacen columna a columna
+# con slices con paso, que son más rápidas para vectores pequeños.
+_STRIDED_REDUCE_MAX_DIM = 16
+
+
+class VectorBatch:
+    """
+    Clase para representar un lote de N vectores de dimensión d.
+    """
+
+    def __init__(self, vectors: Sequence[Union[Vector, Sequence[Union[int, float]]]]):
+        """
+        Crea el lote a partir de una secuencia de vectores o listas.
+
+        Args:
+            vectors: Vectores (o listas de componentes) de igual dimensión
+        """
+        n = len(vectors)
+        d = len(vectors[0]) if n else 0
+        buffer = array('d')
+        for v in vectors:
+            componentes = v._data if isinstance(v, Vector) else v
+            if len(componentes) != d:
+                raise ValueError("Los vectores no tienen la misma dimensión")
+            if isinstance(componentes, array) and componentes.typecode != 'd':
+                componentes = array('d', componentes)
+            buffer.extend(componentes)
+        self._set_buffer(buffer, n, d)
+
+    def _set_buffer(self, buffer: array, n: int, d: int):
+        """Asigna el buffer contiguo y la forma del lote."""
+        self._data = buffer
+        self._n = n
+        self._d = d
+
+    @classmethod
+    def _from_buffer(cls, buffer: array, n: int, d: int) -> 'VectorBatch':
+        """Crea un lote directamente a partir de un buffer N x d (sin copiarlo)."""
+        lote = cls.__new__(cls)
+        lote._set_buffer(buffer, n, d)
+        return lote
+
+    def __len__(self) -> int:
+        """Retorna el número de vectores del lote."""
+        return self._n
+
+    def __getitem__(self, index: int) -> Vector:
+        """Retorna el vector en la posición index como un nuevo ``Vector``."""
+        if index < 0:
+            index += self._n
+        if not 0 <= index < self._n:
+            raise IndexError("Índice fuera del rango del lote")
+        return Vector._from_buffer(self._data[index * self._d:(index + 1) * self._d])
+
+    def __repr__(self) -> str:
+        """Representación detallada del lote."""
+        return f"VectorBatch(n={self._n}, dimension={self._d})"
+
+    @property
+    def dimension(self) -> int:
+        """Retorna la dimensión d de los vectores del lote."""
+        return self._d
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """Retorna la forma del lote como (N, d)."""
+        return (self._n, self._d)
+
+    def to_vectors(self) -> List[Vector]:
+        """Convierte el lote en una lista de objetos ``Vector``."""
+        return [self[i] for i in range(self._n)]
+
+    def _operand(self, other: Union['VectorBatch', Vector]) -> array:
+        """Buffer del otro operando; un ``Vector`` se repite para cada fila del lote."""
+        if isinstance(other, VectorBatch):
+            if other.shape != self.shape:
+                raise ValueError("Los lotes no tienen la misma forma")
+            return other._data
+        if isinstance(other, Vector):
+            if len(other._data) != self._d:
+                raise ValueError("Los vectores no tienen la misma dimensión")
+            return array('d', other._data) * self._n
+        raise TypeError("Se esperaba un VectorBatch o un Vector")
+
+    def _columns(self, buffer: array) -> List[array]:
+        """Separa un buffer N x d en sus d columnas (slices con paso)."""
+        d = self._d
+        return [buffer[j::d] for j in range(d)]
+
+    def dot(self, other: Union['VectorBatch', Vector]) -> List[float]:
+        """
+        Calcula el producto punto fila a fila.
+
+        Args:
+            other: Otro lote de la misma forma, o un vector que se usa con cada fila
+
+        Returns:
+            Lista con los N productos punto
+        """
+        a, b = self._data, self._operand(other)
+        n, d = self._n, self._d
+        if d <= _STRIDED_REDUCE_MAX_DIM:
+            totales = [0.0] * n
+            for columna_a, columna_b in zip(self._columns(a), self._columns(b)):
+                totales = list(map(operator.add, totales, map(operator.mul, columna_a, columna_b)))
+            return totales
+        return [sum(map(operator.mul, a[i * d:(i + 1) * d], b[i * d:(i + 1) * d])) for i in range(n)]
+
+    def norms(self) -> List[float]:
+        """Calcula la magnitud (norma) de cada vector del lote."""
+        n, d = self._n, self._d
+        if d <= _STRIDED_REDUCE_MAX_DIM:
+            return list(map(math.hypot, *self._columns(self._data))) if d else [0.0] * n
+        return [math.hypot(*self._data[i * d:(i + 1) * d]) for i in range(n)]
+
+    def normalize(self) -> 'VectorBatch':
+        """
+        Normaliza todos los vectores del lote.
+
+        Returns:
+            Un nuevo lote con vectores unitarios
+        """
+        normas = self.norms()
+        if 0 in normas:
+            raise ValueError("Error")
+        divisores = chain.from_iterable(map(repeat, normas, repeat(self._d)))
+        return VectorBatch._from_buffer(array('d', map(operator.truediv, self._data, divisores)),
+                                        self._n, self._d)
+
+    def angle_between(self, other: Union['VectorBatch', Vector]) -> List[float]:
+        """
+        Calcula el ángulo (en radianes) entre cada par de vectores.
+
+        Args:
+            other: Otro lote de la misma forma, o un vector que se usa con cada fila
+
+        Returns:
+            Lista con los N ángulos
+        """
+        if isinstance(other, Vector):
+            otras_normas = [math.hypot(*other._data)] * self._n
+        else:
+            self._operand(other)
+            otras_normas = other.norms()
+        normas = self.norms()
+        if 0 in normas or 0 in otras_normas:
+            raise ValueError("Error")
+        productos = self.dot(other)
+        return list(map(math.acos, map(operator.truediv, productos,
+                                       map(operator.mul, normas, otras_normas))))
+
+    def cross(self, other: Union['VectorBatch', Vector]) -> 'VectorBatch':
+        """
+        Calcula el producto cruz fila a fila (solo para vectores 3D).
+
+        Args:
+            other: Otro lote de la misma forma, o un vector que se usa con cada fila
+
+        Returns:
+            Un nuevo lote con los productos cruz
+        """
+        if self._d != 3:
+            raise ValueError("Solo vectores 3D")
+        b = self._operand(other)
+        a = self._data
+        x1, y1, z1 = a[0::3], a[1::3], a[2::3]
+        x2, y2, z2 = b[0::3], b[1::3], b[2::3]
+        mul, sub = operator.mul, operator.sub
+        resultado = array('d', bytes(len(a) * 8))
+        resultado[0::3] = array('d', map(sub, map(mul, y1, z2), map(mul, z1, y2)))
+        resultado[1::3] = array('d', map(sub, map(mul, z1, x2), map(mul, x1, z2)))
+        resultado[2::3] = array('d', map(sub, map(mul, x1, y2), map(mul, y1, x2)))
+        return VectorBatch._from_buffer(resultado, self._n, 3)
@@ -0,0 +1,530 @@
+"""
+Descomposiciones matriciales
+============================
+
+- ``qr_decomposition``: QR por reflexiones de Householder (Q delgada).
+- ``symmetric_eigen``: valores y vectores propios de una matriz simétrica
+  (tridiagonalización de Householder + algoritmo QL implícito).
+- ``power_iteration`` y ``lanczos``: los k pares propios dominantes usando
+  solo productos matriz-vector, útiles para matrices grandes o dispersas.
+- ``svd``: SVD delgada por el método de Jacobi de un lado.
+- ``condition_number``: número de condición en norma 2; con
+  ``method="lanczos"`` se estima con Lanczos directo e inverso (sobre una
+  LU o una Cholesky) en lugar de la SVD completa.
+"""
+
+import math
+import operator
+import random
+from itertools import repeat
+from typing import List, Optional, Tuple
+
+from .linAlg import Vector, Matrix, lu_decomposition
+from .structured import SymmetricMatrix
+from .solvers import LinearOperator, _as_operator, _axpy, _dot, _norm, _scale
+
+_EPS = 2.0 ** -52
+
+# Hasta este número de columnas (o filas) ``condition_number`` usa la SVD
+# completa; por encima estima con Lanczos.
+CONDITION_SVD_MAX_DIM = 64
+
+
+# =============================================================================
+# QR
+# =============================================================================
+
+def qr_decomposition(matrix: Matrix) -> Tuple[Matrix, Matrix]:
+    """
+    Factorización QR delgada por reflexiones de Householder.
+
+    Args:
+        matrix: Matriz m x n
+
+    Returns:
+        (Q, R) con Q de m x k con columnas ortonormales, R triangular
+        superior de k x n y k = min(m, n)
+    """
+    m, n = matrix.shape
+    k = min(m, n)
+    columnas = [matrix.column_view(j).tolist() for j in range(n)]
+    reflectores: List[Optional[List[float]]] = []
+
+    for j in range(k):
+        x = columnas[j][j:]
+        norma = _norm(x)
+        if norma == 0:
+            reflectores.append(None)
+            continue
+        alpha = -norma if x[0] >= 0 else norma
+        v = list(x)
+        v[0] -= alpha
+        vv = _dot(v, v)
+        reflectores.append(v)
+        for c in range(j, n):
+            columna = columnas[c]
+            factor = 2 * _dot(v, columna[j:]) / vv
+            columna[j:] = _axpy(-factor, v, columna[j:])
+
+    # Q = H0·H1·…·H(k-1) aplicado a las primeras k columnas de la identidad
+    columnas_q = []
+    for c in range(k):
+        e = [0.0] * m
+        e[c] = 1.0
+        for j in range(k - 1, -1, -1):
+            v = reflectores[j]
+            if v is None:
+                continue
+            factor = 2 * _dot(v, e[j:]) / _dot(v, v)
+            e[j:] = _axpy(-factor, v, e[j:])
+        columnas_q.append(e)
+
+    Q = Matrix([[columnas_q[c][i] for c in range(k)] for i in range(m)])
+    R = Matrix([[columnas[c][i] if c >= i else 0.0 for c in range(n)] for i in range(k)])
+    return Q, R
+
+
+# =============================================================================
+# VALORES PROPIOS DE MATRICES SIMÉTRICAS
+# =============================================================================
+
+def _tridiagonalize(V: List[List[float]], d: List[float], e: List[float]):
+    """
+    Reduce la matriz simétrica V a forma tridiagonal (Householder).
+
+    Al terminar, d tiene la diagonal, e la subdiagonal (e[0] = 0) y V la
+    transformación ortogonal acumulada.
+    """
+    n = len(d)
+    for j in range(n):
+        d[j] = V[n - 1][j]
+
+    for i in range(n - 1, 0, -1):
+        escala = sum(abs(d[k]) for k in range(i))
+        h = 0.0
+        if escala == 0.0:
+            e[i] = d[i - 1]
+            for j in range(i):
+                d[j] = V[i - 1][j]
+                V[i][j] = 0.0
+                V[j][i] = 0.0
+        else:
+            for k in range(i):
+                d[k] /= escala
+                h += d[k] * d[k]
+            f = d[i - 1]
+            g = math.sqrt(h)
+            if f > 0:
+                g = -g
+            e[i] = escala * g
+            h -= f * g
+            d[i - 1] = f - g
+            for j in range(i):
+                e[j] = 0.0
+            for j in range(i):
+                f = d[j]
+                V[j][i] = f
+                g = e[j] + V[j][j] * f
+                for k in range(j + 1, i):
+                    g += V[k][j] * d[k]
+                    e[k] += V[k][j] * f
+                e[j] = g
+            f = 0.0
+            for j in range(i):
+                e[j] /= h
+                f += e[j] * d[j]
+            hh = f / (h + h)
+            for j in range(i):
+                e[j] -= hh * d[j]
+            for j in range(i):
+                f = d[j]
+                g = e[j]
+                for k in range(j, i):
+                    V[k][j] -= f * e[k] + g * d[k]
+                d[j] = V[i - 1][j]
+                V[i][j] = 0.0
+        d[i] = h
+
+    for i in range(n - 1):
+        V[n - 1][i] = V[i][i]
+        V[i][i] = 1.0
+        h = d[i + 1]
+        if h != 0.0:
+            for k in range(i + 1):
+                d[k] = V[k][i + 1] / h
+            for j in range(i + 1):
+                g = sum(V[k][i + 1] * V[k][j] for k in range(i + 1))
+                for k in range(i + 1):
+                    V[k][j] -= g * d[k]
+        for k in range(i + 1):
+            V[k][i + 1] = 0.0
+    for j in range(n):
+        d[j] = V[n - 1][j]
+        V[n - 1][j] = 0.0
+    V[n - 1][n - 1] = 1.0
+    e[0] = 0.0
+
+
+def _tridiagonal_ql(V: List[List[float]], d: List[float], e: List[float]):
+    """
+    Valores y vectores propios de una matriz tridiagonal simétrica (QL implícito).
+
+    Args:
+        V: Transformación acumulada (identidad si la matriz ya era tridiagonal)
+        d: Diagonal; al terminar contiene los valores propios en orden ascendente
+        e: Subdiagonal con e[0] = 0 y e[i] entre las posiciones i-1 e i
+    """
+    n = len(d)
+    for i in range(1, n):
+        e[i - 1] = e[i]
+    e[n - 1] = 0.0
+
+    f = 0.0
+    tst1 = 0.0
+    for l in range(n):
+        tst1 = max(tst1, abs(d[l]) + abs(e[l]))
+        m = l
+        while m < n - 1 and abs(e[m]) > _EPS * tst1:
+            m += 1
+        if m > l:
+            while True:
+                g = d[l]
+                p = (d[l + 1] - g) / (2.0 * e[l])
+                r = math.hypot(p, 1.0)
+                if p < 0:
+                    r = -r
+                d[l] = e[l] / (p + r)
+                d[l + 1] = e[l] * (p + r)
+                dl1 = d[l + 1]
+                h = g - d[l]
+                for i in range(l + 2, n):
+                    d[i] -= h
+                f += h
+
+                p = d[m]
+                c = c2 = c3 = 1.0
+                el1 = e[l + 1]
+                s = s2 = 0.0
+                for i in range(m - 1, l - 1, -1):
+                    c3 = c2
+                    c2 = c
+                    s2 = s
+                    g = c * e[i]
+                    h = c * p
+                    r = math.hypot(p, e[i])
+                    e[i + 1] = s * r
+                    s = e[i] / r
+                    c = p / r
+                    p = c * d[i] - s * g
+                    d[i + 1] = h + s * (c * g + s * d[i])
+                    for fila in V:
+                        h = fila[i + 1]
+                        fila[i + 1] = s * fila[i] + c * h
+                        fila[i] = c * fila[i] - s * h
+                p = -s * s2 * c3 * el1 * e[l] / dl1
+                e[l] = s * p
+                d[l] = c * p
+                if abs(e[l]) <= _EPS * tst1:
+                    break
+        d[l] += f
+        e[l] = 0.0
+
+    orden = sorted(range(n), key=d.__getitem__)
+    d[:] = [d[i] for i in orden]
+    for fila in V:
+        fila[:] = [fila[i] for i in orden]
+
+
+def symmetric_eigen(matrix: Matrix) -> Tuple[List[float], Matrix]:
+    """
+    Calcula todos los valores y vectores propios de una matriz simétrica.
+
+    Args:
+        matrix: Matriz simétrica n x n (solo se usa la parte triangular inferior)
+
+    Returns:
+        (valores, vectores): los valores propios en orden ascendente y una
+        matriz cuyas columnas son los vectores propios correspondientes
+    """
+    if not matrix.is_square():
+        raise ValueError("La matriz no es cuadrada")
+    n = matrix.num_rows
+    if n == 0:
+        return [], Matrix([])
+    V = matrix._rows()
+    d = [0.0] * n
+    e = [0.0] * n
+    _tridiagonalize(V, d, e)
+    _tridiagonal_ql(V, d, e)
+    return d, Matrix(V)
+
+
+# =============================================================================
+# MÉTODOS ITERATIVOS (SOLO PRODUCTOS MATRIZ-VECTOR)
+# =============================================================================
+
+def _start_vector(n: int, seed: int) -> List[float]:
+    """Vector inicial aleatorio (reproducible) de norma 1."""
+    generador = random.Random(seed)
+    x = [generador.uniform(-1.0, 1.0) for _ in range(n)]
+    return _scale(1 / _norm(x), x)
+
+
+def _orthogonalize(x: List[float], basis: List[List[float]]) -> List[float]:
+    """Quita a x sus componentes sobre una base ortonormal (Gram-Schmidt)."""
+    for q in basis:
+        x = _axpy(-_dot(x, q), q, x)
+    return x
+
+
+def power_iteration(A: LinearOperator, k: int = 1, tol: float = 1e-10,
+                    max_iter: int = 1000, n: Optional[int] = None,
+                    seed: int = 0) -> Tuple[List[float], List[Vector]]:
+    """
+    Calcula los k pares propios de mayor magnitud con el método de la potencia.
+
+    Cada par siguiente se busca en el complemento ortogonal de los ya
+    encontrados (deflación), por lo que A debe ser simétrica.
+
+    Args:
+        A: Matriz simétrica o función A(x)
+        k: Número de pares propios
+        tol: Tolerancia sobre el cambio del cociente de Rayleigh
+        max_iter: Máximo de iteraciones por par propio
+        n: Dimensión (obligatoria si A es una función)
+        seed: Semilla del vector inicial
+
+    Returns:
+        (valores, vectores) ordenados por magnitud descendente
+    """
+    n = n if n is not None else A.shape[0]
+    aplicar = _as_operator(A, n)
+    valores: List[float] = []
+    vectores: List[List[float]] = []
+    for indice in range(min(k, n)):
+        x = _orthogonalize(_start_vector(n, seed + indice), vectores)
+        x = _scale(1 / _norm(x), x)
+        valor = 0.0
+        for _ in range(max_iter):
+            y = _orthogonalize(aplicar(x), vectores)
+            nuevo = _dot(x, y)
+            norma = _norm(y)
+            if norma == 0:
+                break
+            x = _scale(1 / norma, y)
+            if abs(nuevo - valor) <= tol * max(1.0, abs(nuevo)):
+                valor = nuevo
+                break
+            valor = nuevo
+        valores.append(valor)
+        vectores.append(x)
+    return valores, [Vector(v) for v in vectores]
+
+
+def _lanczos_ritz(A: LinearOperator, n: int, steps: int, seed: int
+                  ) -> Tuple[List[float], List[List[float]], List[List[float]]]:
+    """Corre Lanczos con reortogonalización completa y retorna (θ, S, Q)."""
+    aplicar = _as_operator(A, n)
+    q = _start_vector(n, seed)
+    Q = [q]
+    alphas: List[float] = []
+    betas: List[float] = []
+    for j in range(min(steps, n)):
+        w = aplicar(Q[j])
+        alpha = _dot(w, Q[j])
+        alphas.append(alpha)
+        w = _axpy(-alpha, Q[j], w)
+        if j > 0:
+            w = _axpy(-betas[j - 1], Q[j - 1], w)
+        w = _orthogonalize(_orthogonalize(w, Q), Q)
+        beta = _norm(w)
+        if j == min(steps, n) - 1 or beta <= _EPS * max(1.0, abs(alpha)):
+            break
+        betas.append(beta)
+        Q.append(_scale(1 / beta, w))
+
+    m = len(alphas)
+    d = list(alphas)
+    e = [0.0] + betas[:m - 1]
+    S = [[1.0 if i == j else 0.0 for j in range(m)] for i in range(m)]
+    _tridiagonal_ql(S, d, e)
+    return d, S, Q
+
+
+def lanczos(A: LinearOperator, k: int = 1, which: str = "largest",
+            steps: Optional[int] = None, n: Optional[int] = None,
+            seed: int = 0) -> Tuple[List[float], List[Vector]]:
+    """
+    Aproxima k pares propios extremos de una matriz simétrica con Lanczos.
+
+    Args:
+        A: Matriz simétrica o función A(x)
+        k: Número de pares propios
+        which: "largest" (los mayores) o "smallest" (los menores)
+        steps: Pasos de Lanczos (dimensión del subespacio); por defecto
+            max(2k + 20, 40), limitado por n
+        n: Dimensión (obligatoria si A es una función)
+        seed: Semilla del vector inicial
+
+    Returns:
+        (valores, vectores): los mayores en orden descendente, o los
+        menores en orden ascendente
+    """
+    if which not in ("largest", "smallest"):
+        raise ValueError("which debe ser 'largest' o 'smallest'")
+    n = n if n is not None else A.shape[0]
+    theta, S, Q = _lanczos_ritz(A, n, steps or max(2 * k + 20, 40), seed)
+    m = len(theta)
+    indices = list(range(m - 1, -1, -1)) if which == "largest" else list(range(m))
+    indices = indices[:k]
+    valores = [theta[i] for i in indices]
+    vectores = []
+    for i in indices:
+        y = [0.0] * n
+        for j in range(m):
+            y = _axpy(S[j][i], Q[j], y)
+        vectores.append(Vector(y))
+    return valores, vectores
+
+
+# =============================================================================
+# SVD Y NÚMERO DE CONDICIÓN
+# =============================================================================
+
+def svd(matrix: Matrix, tol: float = 1e-12, max_sweeps: int = 60
+        ) -> Tuple[Matrix, List[float], Matrix]:
+    """
+    SVD delgada A = U·diag(s)·Vᵀ por el método de Jacobi de un lado.
+
+    Args:
+        matrix: Matriz m x n
+        tol: Tolerancia de ortogonalidad entre columnas
+        max_sweeps: Máximo de barridos de rotaciones
+
+    Returns:
+        (U, s, Vt) con U de m x k, s los k valores singulares en orden
+        descendente y Vt de k x n, donde k = min(m, n)
+    """
+    m, n = matrix.shape
+    if m < n:
+        U, s, Vt = svd(matrix.T, tol, max_sweeps)
+        return Vt.T, s, U.T
+
+    columnas = [matrix.column_view(j).tolist() for j in range(n)]
+    V = [[1.0 if i == j else 0.0 for i in range(n)] for j in range(n)]  # columnas de V
+    for _ in range(max_sweeps):
+        rotado = False
+        for p in range(n - 1):
+            for q in range(p + 1, n):
+                cp, cq = columnas[p], columnas[q]
+                alpha = _dot(cp, cp)
+                beta = _dot(cq, cq)
+                gamma = _dot(cp, cq)
+                if abs(gamma) <= tol * math.sqrt(alpha * beta) or gamma == 0:
+                    continue
+                rotado = True
+                zeta = (beta - alpha) / (2 * gamma)
+                t = math.copysign(1.0, zeta) / (abs(zeta) + math.sqrt(1 + zeta * zeta))
+                c = 1 / math.sqrt(1 + t * t)
+                s = c * t
+                columnas[p] = list(map(operator.sub, map(operator.mul, repeat(c), cp),
+                                       map(operator.mul, repeat(s), cq)))
+                columnas[q] = list(map(operator.add, map(operator.mul, repeat(s), cp),
+                                       map(operator.mul, repeat(c), cq)))
+                vp, vq = V[p], V[q]
+                V[p] = list(map(operator.sub, map(operator.mul, repeat(c), vp),
+                                map(operator.mul, repeat(s), vq)))
+                V[q] = list(map(operator.add, map(operator.mul, repeat(s), vp),
+                                map(operator.mul, repeat(c), vq)))
+        if not rotado:
+            break
+
+    valores = [_norm(c) for c in columnas]
+    orden = sorted(range(n), key=lambda j: -valores[j])
+    s = [valores[j] for j in orden]
+    columnas_u = [_scale(1 / valores[j], columnas[j]) if valores[j] else [0.0] * m for j in orden]
+    U = Matrix([[columnas_u[j][i] for j in range(n)] for i in range(m)])
+    Vt = Matrix([V[j] for j in orden])
+    return U, s, Vt
+
+
+def _largest_eigenvalue(A: LinearOperator, n: int, tol: float = 1e-10) -> float:
+    """
+    Mayor valor propio de una matriz simétrica semidefinida con Lanczos.
+
+    Duplica los pasos hasta que el mayor valor de Ritz deja de cambiar (o
+    hasta n pasos), en lugar de confiar en un número fijo de pasos.
+    """
+    pasos = min(n, 40)
+    anterior = None
+    while True:
+        theta = _lanczos_ritz(A, n, pasos, 0)[0]
+        actual = theta[-1]
+        if pasos >= n or len(theta) < pasos or (
+                anterior is not None and abs(actual - anterior) <= tol * abs(actual)):
+            return actual
+        anterior = actual
+        pasos = min(n, 2 * pasos)
+
+
+def condition_number(matrix: Matrix, method: str = "auto") -> float:
+    """
+    Número de condición en norma 2: σ_max / σ_min.
+
+    Con ``method="lanczos"`` σ_max sale de Lanczos sobre AᵀA y σ_min de
+    Lanczos sobre (AᵀA)⁻¹ (iteración inversa: los valores singulares
+    pequeños pasan a ser los mayores y convergen rápido). Si A es cuadrada,
+    (AᵀA)⁻¹ se aplica con las LU de A y de Aᵀ; si es rectangular, con una
+    sola Cholesky de la matriz normal AᵀA de n x n. La matriz normal tiene
+    condición κ², así que con κ por encima de ~1e8 la Cholesky falla y se
+    retorna ``math.inf``; en ese caso conviene ``method="svd"``. Cada
+    Lanczos corre hasta que su valor de Ritz extremo deja de cambiar.
+    Los valores de Ritz nunca superan a los verdaderos, así que la
+    estimación es una cota inferior de κ (ajustada tras converger).
+
+    Args:
+        matrix: La matriz
+        method: "svd" (exacto), "lanczos" (estimación para matrices
+            grandes, ver arriba) o "auto" (SVD si la dimensión menor es a
+            lo sumo CONDITION_SVD_MAX_DIM, Lanczos si no)
+
+    Returns:
+        El número de condición (``math.inf`` si la matriz es singular)
+    """
+    m, n = matrix.shape
+    if method == "auto":
+        method = "svd" if min(m, n) <= CONDITION_SVD_MAX_DIM else "lanczos"
+    if method == "svd":
+        s = svd(matrix)[1]
+        mayor, menor = s[0], s[-1]
+    elif method == "lanczos":
+        if m < n:
+            matrix = matrix.T
+            m, n = n, m
+        transpuesta = matrix.T
+        if m == n:
+            mayor = math.sqrt(max(_largest_eigenvalue(lambda x: transpuesta * (matrix * x), n), 0.0))
+            lu = lu_decomposition(matrix)
+            if lu.is_singular:
+                return math.inf
+            lu_t = lu_decomposition(transpuesta)
+            inversa = _largest_eigenvalue(lambda x: lu.solve(lu_t.solve(x)), n)
+        else:
+            # Una sola Cholesky de la matriz normal AᵀA (n x n), en lugar de
+            # la QR de A (m x n) seguida de una LU de R
+            normal = SymmetricMatrix._from_dense(transpuesta * matrix)
+            mayor = math.sqrt(max(_largest_eigenvalue(lambda x: normal * x, n), 0.0))
+            if not normal.is_positive_definite():
+                return math.inf
+            inversa = _largest_eigenvalue(normal.solve, n)
+            if mayor * mayor * inversa >= 1 / _EPS:
+                # κ² ya no se distingue de una matriz normal singular
+                return math.inf
+        if inversa <= 0:
+            return math.inf
+        menor = 1 / math.sqrt(inversa)
+    else:
+        raise ValueError(f"Método desconocido: {method}")
+    if menor <= _EPS * mayor:
+        return math.inf
+    return mayor / menor
@@ -0,0 +1,296 @@
+"""
+Evaluación diferida de expresiones
+==================================
+
+Con ``lazy(x)`` una ``Matrix`` o un ``Vector`` pasa a modo diferido: los
+operadores ``+``, ``-``, ``*`` y ``/`` ya no calculan nada, sino que
+construyen un grafo de expresión. El cálculo ocurre solo al llamar
+``evaluate()`` o al acceder a un elemento.
+
+Al construir el grafo se aplican dos optimizaciones:
+
+- Fusión elemento a elemento: sumas, restas y productos por escalar se
+  acumulan en una única combinación lineal ``c1*X1 + c2*X2 + ...`` que se
+  evalúa en una sola pasada sobre los buffers, sin matrices intermedias.
+- Reordenamiento de cadenas de productos: ``A*B*v`` se guarda como la
+  cadena [A, B, v] y al evaluarla se elige el orden de menor costo
+  (programación dinámica de la cadena de matrices). Así se calcula
+  ``A*(B*v)`` en O(n²) en lugar de ``(A*B)*v`` en O(n³).
+
+Ejemplo::
+
+    resultado = (lazy(A) * B * v + 2 * w - u).evaluate()
+"""
+
+import operator
+from array import array
+from itertools import repeat
+from typing import List, Tuple, Union
+
+from .linAlg import Vector, Matrix
+
+Operand = Union['LazyExpr', Matrix, Vector]
+
+
+class LazyExpr:
+    """
+    Nodo base del grafo de expresión diferida.
+    """
+
+    shape: Tuple[int, ...] = ()
+
+    def evaluate(self) -> Union[Matrix, Vector]:
+        """
+        Evalúa la expresión.
+
+        Returns:
+            Una ``Matrix`` o ``Vector`` con el resultado (una hoja sin
+            operaciones retorna el mismo objeto que envuelve)
+        """
+        return self._evaluate()
+
+    def _evaluate(self) -> Union[Matrix, Vector]:
+        raise NotImplementedError
+
+    def __getitem__(self, key):
+        """
+        Acceso a elementos: evalúa la expresión y la indexa.
+
+        No se memoriza el resultado, porque los operandos pueden cambiar en
+        el lugar (``A += B``) después de construir la expresión; para leer
+        muchos elementos conviene evaluar una vez y indexar el resultado.
+        """
+        return self.evaluate()[key]
+
+    def _terms(self) -> List[Tuple[float, 'LazyExpr']]:
+        """Términos (coeficiente, nodo) de la expresión vista como combinación lineal."""
+        return [(1.0, self)]
+
+    def _factors(self) -> Tuple[float, List['LazyExpr']]:
+        """Coeficiente y factores de la expresión vista como cadena de productos."""
+        return 1.0, [self]
+
+    def __add__(self, other: Operand) -> 'LazyExpr':
+        """Suma diferida usando el operador +."""
+        other = _wrap(other)
+        if other is NotImplemented:
+            return NotImplemented
+        _check_same_shape(self, other)
+        return _Combination(self.shape, self._terms() + other._terms())
+
+    def __radd__(self, other: Operand) -> 'LazyExpr':
+        """Suma diferida con el operando concreto a la izquierda."""
+        other = _wrap(other)
+        if other is NotImplemented:
+            return NotImplemented
+        return other + self
+
+    def __sub__(self, other: Operand) -> 'LazyExpr':
+        """Resta diferida usando el operador -."""
+        other = _wrap(other)
+        if other is NotImplemented:
+            return NotImplemented
+        _check_same_shape(self, other)
+        return _Combination(self.shape, self._terms() + [(-c, t) for c, t in other._terms()])
+
+    def __rsub__(self, other: Operand) -> 'LazyExpr':
+        """Resta diferida con el operando concreto a la izquierda."""
+        other = _wrap(other)
+        if other is NotImplemented:
+            return NotImplemented
+        return other - self
+
+    def __neg__(self) -> 'LazyExpr':
+        """Cambio de signo diferido."""
+        return self * -1
+
+    def __mul__(self, other: Union[Operand, int, float]) -> 'LazyExpr':
+        """Producto diferido por escalar, vector o matriz usando el operador *."""
+        if isinstance(other, (int, float)):
+            return self._scaled(other)
+        other = _wrap(other)
+        if other is NotImplemented:
+            return NotImplemented
+        if len(self.shape) != 2 or self.shape[1] != other.shape[0]:
+            raise ValueError("Error de multiplicación")
+        coef_a, factores_a = self._factors()
+        coef_b, factores_b = other._factors()
+        return _Product(self.shape[:1] + other.shape[1:], coef_a * coef_b, factores_a + factores_b)
+
+    def __rmul__(self, other: Union[Operand, int, float]) -> 'LazyExpr':
+        """Producto diferido con el operando (escalar o matriz) a la izquierda."""
+        if isinstance(other, (int, float)):
+            return self._scaled(other)
+        other = _wrap(other)
+        if other is NotImplemented:
+            return NotImplemented
+        return other * self
+
+    def __truediv__(self, scalar: Union[int, float]) -> 'LazyExpr':
+        """División diferida por escalar usando el operador /."""
+        if not isinstance(scalar, (int, float)):
+            return NotImplemented
+        if scalar == 0:
+            raise ZeroDivisionError("indefinido")
+        return self._scaled(1 / scalar)
+
+    def _scaled(self, scalar: Union[int, float]) -> 'LazyExpr':
+        """Expresión multiplicada por un escalar."""
+        return _Combination(self.shape, [(c * scalar, t) for c, t in self._terms()])
+
+
+class _Leaf(LazyExpr):
+    """Hoja del grafo: una matriz o vector concreto."""
+
+    def __init__(self, value: Union[Matrix, Vector]):
+        self.value = value
+        self.shape = (len(value._data),) if isinstance(value, Vector) else tuple(value.shape)
+
+    def _evaluate(self) -> Union[Matrix, Vector]:
+        return self.value
+
+    def __repr__(self) -> str:
+        return f"lazy({self.value!r})"
+
+
+class _Combination(LazyExpr):
+    """Combinación lineal c1*X1 + c2*X2 + ... evaluada en una sola pasada."""
+
+    def __init__(self, shape: Tuple[int, ...], terms: List[Tuple[float, LazyExpr]]):
+        self.shape = shape
+        self.terms = terms
+
+    def _terms(self) -> List[Tuple[float, LazyExpr]]:
+        return list(self.terms)
+
+    def _factors(self) -> Tuple[float, List[LazyExpr]]:
+        if len(self.terms) == 1:
+            coef, nodo = self.terms[0]
+            coef_nodo, factores = nodo._factors()
+            return coef * coef_nodo, factores
+        return 1.0, [self]
+
+    def _evaluate(self) -> Union[Matrix, Vector]:
+        buffers = [_buffer(nodo._evaluate()) for _, nodo in self.terms]
+        # Cadena de iteradores map: los elementos se combinan uno a uno al
+        # construir el array final, sin buffers intermedios.
+        combinado = None
+        for (coef, _), buffer in zip(self.terms, buffers):
+            if coef == 1 or coef == -1:
+                termino = buffer
+            else:
+                termino = map(operator.mul, repeat(coef), buffer)
+            if combinado is None:
+                combinado = termino if coef != -1 else map(operator.neg, termino)
+            else:
+                combinado = map(operator.add if coef != -1 else operator.sub, combinado, termino)
+        return _build(self.shape, array('d', combinado))
+
+    def __repr__(self) -> str:
+        return " + ".join(f"{c}*({t!r})" for c, t in self.terms)
+
+
+class _Product(LazyExpr):
+    """Cadena de productos matriciales c * F1 * F2 * ... * Fk."""
+
+    def __init__(self, shape: Tuple[int, ...], coef: float, factors: List[LazyExpr]):
+        self.shape = shape
+        self.coef = coef
+        self.factors = factors
+
+    def _factors(self) -> Tuple[float, List[LazyExpr]]:
+        return self.coef, list(self.factors)
+
+    def _evaluate(self) -> Union[Matrix, Vector]:
+        operandos = [nodo._evaluate() for nodo in self.factors]
+        dimensiones = [self.factors[0].shape[0]] + [
+            nodo.shape[1] if len(nodo.shape) == 2 else 1 for nodo in self.factors]
+        corte = _chain_order(dimensiones)
+        resultado = _multiply_chain(operandos, corte, 0, len(operandos) - 1)
+        if self.coef != 1:
+            # La cadena tiene al menos dos factores: el resultado es un objeto nuevo
+            resultado *= self.coef
+        return resultado
+
+    def __repr__(self) -> str:
+        return f"{self.coef}*" + " @ ".join(f"({f!r})" for f in self.factors)
+
+
+def lazy(value: Union[Matrix, Vector, LazyExpr]) -> LazyExpr:
+    """
+    Envuelve una matriz o un vector para evaluar sus expresiones en diferido.
+
+    Args:
+        value: La matriz o vector (o una expresión diferida existente)
+
+    Returns:
+        Un nodo ``LazyExpr`` sobre el que se pueden encadenar operadores
+    """
+    nodo = _wrap(value)
+    if nodo is NotImplemented:
+        raise TypeError("Solo se pueden diferir objetos Matrix o Vector")
+    return nodo
+
+
+def _wrap(value) -> Union[LazyExpr, type(NotImplemented)]:
+    """Convierte un operando concreto en hoja; retorna NotImplemented si no se admite."""
+    if isinstance(value, LazyExpr):
+        return value
+    if isinstance(value, (Matrix, Vector)) or hasattr(value, "to_matrix"):
+        return _Leaf(value)
+    return NotImplemented
+
+
+def _check_same_shape(a: LazyExpr, b: LazyExpr):
+    """Valida que dos expresiones tengan la misma forma para operar elemento a elemento."""
+    if a.shape != b.shape:
+        raise ValueError("Las expresiones no tienen la misma dimensión")
+
+
+def _buffer(value) -> Union[array, List[float]]:
+    """Secuencia plana de los elementos de un resultado concreto."""
+    if isinstance(value, Vector):
+        return value._data
+    if not isinstance(value, Matrix):
+        value = value.to_matrix()
+    return value._data
+
+
+def _build(shape: Tuple[int, ...], buffer: array) -> Union[Matrix, Vector]:
+    """Construye el resultado concreto a partir de un buffer plano."""
+    if len(shape) == 1:
+        return Vector._from_buffer(buffer)
+    return Matrix._from_buffer(buffer, shape[0], shape[1])
+
+
+def _chain_order(dims: List[int]) -> List[List[int]]:
+    """
+    Orden óptimo de una cadena de productos (programación dinámica).
+
+    Args:
+        dims: El factor k tiene forma dims[k] x dims[k + 1]
+
+    Returns:
+        Tabla ``corte[i][j]`` con el punto de división óptimo de los factores i..j
+    """
+    n = len(dims) - 1
+    costo = [[0] * n for _ in range(n)]
+    corte = [[0] * n for _ in range(n)]
+    for largo in range(2, n + 1):
+        for i in range(n - largo + 1):
+            j = i + largo - 1
+            costo[i][j] = None
+            for k in range(i, j):
+                c = costo[i][k] + costo[k + 1][j] + dims[i] * dims[k + 1] * dims[j + 1]
+                if costo[i][j] is None or c < costo[i][j]:
+                    costo[i][j] = c
+                    corte[i][j] = k
+    return corte
+
+
+def _multiply_chain(operands: list, corte: List[List[int]], i: int, j: int):
+    """Multiplica los factores i..j siguiendo la tabla de cortes."""
+    if i == j:
+        return operands[i]
+    k = corte[i][j]
+    return _multiply_chain(operands, corte, i, k) * _multiply_chain(operands, corte, k + 1, j)
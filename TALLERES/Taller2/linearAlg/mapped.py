@@ -0,0 +1,367 @@
+"""
+Matrices en disco (memory-mapped)
+=================================
+
+``MappedMatrix`` guarda una matriz en un archivo y la accede con ``mmap``,
+de modo que puede ser mucho más grande que la memoria RAM: el sistema
+operativo solo carga las páginas que se van leyendo.
+
+Formato del archivo: una cabecera de ``HEADER_SIZE`` bytes (firma, versión,
+tipo de dato y forma) seguida de los elementos en orden por filas.
+
+- ``MappedMatrix.create``, ``MappedMatrix.open`` y ``MappedMatrix.from_matrix``
+  crean o abren el archivo; ``to_matrix`` lo carga como ``Matrix``.
+- ``iter_rows``/``iter_columns`` recorren la matriz fila a fila o columna
+  a columna; ``T`` es una vista transpuesta sobre el mismo archivo.
+- ``mapped_multiply`` y los operadores ``*`` multiplican por bloques de
+  ``block_size`` x ``block_size``, leyendo del disco un bloque a la vez, así
+  la memoria usada no depende del tamaño de las matrices.
+"""
+
+import mmap
+import struct
+from array import array
+from typing import Iterator, List, Optional, Tuple, Union
+
+from .linAlg import Vector, Matrix, _matmul_kernel
+
+MAGIC = b"LAMM"
+VERSION = 1
+HEADER_SIZE = 64
+_HEADER = struct.Struct("<4sBc2xQQ")
+
+# Tipos de dato admitidos (códigos de ``array``) y su tamaño en bytes.
+DTYPES = {"d": 8, "f": 4}
+
+# Tamaño de bloque por defecto de las operaciones por bloques.
+MAPPED_BLOCK_SIZE = 256
+
+
+class MappedMatrix:
+    """
+    Clase para representar una matriz guardada en disco y accedida con mmap.
+    """
+
+    def __init__(self, path: str, mode: str = "r"):
+        """
+        Abre un archivo de matriz existente.
+
+        Args:
+            path: Ruta del archivo
+            mode: "r" (solo lectura) o "r+" (lectura y escritura)
+        """
+        if mode not in ("r", "r+"):
+            raise ValueError("El modo debe ser 'r' o 'r+'")
+        self.path = path
+        self._file = open(path, "rb" if mode == "r" else "r+b")
+        try:
+            acceso = mmap.ACCESS_READ if mode == "r" else mmap.ACCESS_WRITE
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=acceso)
+            firma, version, dtype, filas, columnas = _HEADER.unpack_from(self._mmap, 0)
+            if firma != MAGIC or version != VERSION:
+                raise ValueError(f"{path} no es un archivo de matriz válido")
+            self.dtype = dtype.decode("ascii")
+            if self.dtype not in DTYPES:
+                raise ValueError(f"Tipo de dato no soportado: {self.dtype}")
+            if len(self._mmap) < HEADER_SIZE + filas * columnas * DTYPES[self.dtype]:
+                raise ValueError(f"{path} está truncado")
+        except Exception:
+            self._file.close()
+            raise
+        self.writable = mode == "r+"
+        self._view = memoryview(self._mmap)[HEADER_SIZE:HEADER_SIZE + filas * columnas * DTYPES[self.dtype]].cast(self.dtype)
+        self._base_shape = (filas, columnas)
+        self._transposed = False
+        self._owner = True
+
+    @classmethod
+    def create(cls, path: str, rows: int, columns: int, dtype: str = "d") -> 'MappedMatrix':
+        """
+        Crea un archivo nuevo con una matriz de ceros y lo abre para escritura.
+
+        Args:
+            path: Ruta del archivo (se sobrescribe si existe)
+            rows: Número de filas
+            columns: Número de columnas
+            dtype: Tipo de dato: "d" (float64) o "f" (float32)
+
+        Returns:
+            La matriz abierta en modo "r+"
+        """
+        if dtype not in DTYPES:
+            raise ValueError(f"Tipo de dato no soportado: {dtype}")
+        cabecera = bytearray(HEADER_SIZE)
+        _HEADER.pack_into(cabecera, 0, MAGIC, VERSION, dtype.encode("ascii"), rows, columns)
+        with open(path, "wb") as f:
+            f.write(cabecera)
+            f.truncate(HEADER_SIZE + rows * columns * DTYPES[dtype])
+        return cls(path, "r+")
+
+    @classmethod
+    def open(cls, path: str, mode: str = "r") -> 'MappedMatrix':
+        """Abre un archivo de matriz existente (equivale al constructor)."""
+        return cls(path, mode)
+
+    @classmethod
+    def from_matrix(cls, matrix: Matrix, path: str, dtype: str = "d") -> 'MappedMatrix':
+        """
+        Escribe una ``Matrix`` en un archivo nuevo.
+
+        Args:
+            matrix: La matriz a guardar
+            path: Ruta del archivo
+            dtype: Tipo de dato del archivo
+
+        Returns:
+            La matriz en disco abierta en modo "r+"
+        """
+        mapeada = cls.create(path, matrix.num_rows, matrix.num_columns, dtype)
+        datos = matrix._data if dtype == "d" else array(dtype, matrix._data)
+        mapeada._view[:] = datos
+        return mapeada
+
+    def close(self):
+        """Libera la vista, el mmap y el archivo."""
+        if not self._owner:
+            return
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+            self._mmap.close()
+            self._file.close()
+
+    def flush(self):
+        """Escribe al disco los cambios pendientes."""
+        self._mmap.flush()
+
+    def __enter__(self) -> 'MappedMatrix':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __repr__(self) -> str:
+        """Representación detallada de la matriz en disco."""
+        vista = ", transpuesta" if self._transposed else ""
+        return f"MappedMatrix({self.path!r}, shape={self.shape}, dtype={self.dtype!r}{vista})"
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """Retorna las dimensiones de la matriz como (filas, columnas)."""
+        filas, columnas = self._base_shape
+        return (columnas, filas) if self._transposed else (filas, columnas)
+
+    @property
+    def num_rows(self) -> int:
+        """Retorna el número de filas de la matriz."""
+        return self.shape[0]
+
+    @property
+    def num_columns(self) -> int:
+        """Retorna el número de columnas de la matriz."""
+        return self.shape[1]
+
+    @property
+    def T(self) -> 'MappedMatrix':
+        """Retorna una vista transpuesta sobre el mismo archivo (sin copiar datos)."""
+        vista = MappedMatrix.__new__(MappedMatrix)
+        vista.__dict__.update(self.__dict__)
+        vista._transposed = not self._transposed
+        vista._owner = False
+        return vista
+
+    def _offset(self, i: int, j: int) -> int:
+        """Posición del elemento (i, j) dentro de los datos del archivo."""
+        filas, columnas = self.shape
+        if i < 0:
+            i += filas
+        if j < 0:
+            j += columnas
+        if not (0 <= i < filas and 0 <= j < columnas):
+            raise IndexError("Índice fuera del rango de la matriz")
+        if self._transposed:
+            i, j = j, i
+        return i * self._base_shape[1] + j
+
+    def __getitem__(self, key: Tuple[int, int]) -> float:
+        """Permite acceder a un elemento (i, j)."""
+        if not (isinstance(key, tuple) and len(key) == 2):
+            raise TypeError("El índice debe ser una tupla (i, j)")
+        return self._view[self._offset(*key)]
+
+    def __setitem__(self, key: Tuple[int, int], value: Union[int, float]):
+        """Permite modificar un elemento (i, j) si el archivo está abierto para escritura."""
+        if not self.writable:
+            raise PermissionError("La matriz está abierta solo para lectura")
+        if not (isinstance(key, tuple) and len(key) == 2):
+            raise TypeError("El índice debe ser una tupla (i, j)")
+        self._view[self._offset(*key)] = value
+
+    def _base_line(self, index: int, along_rows: bool) -> List[float]:
+        """Fila (along_rows=True) o columna de la matriz guardada, sin transponer."""
+        filas, columnas = self._base_shape
+        if along_rows:
+            return self._view[index * columnas:(index + 1) * columnas].tolist()
+        return self._view[index:filas * columnas:columnas].tolist()
+
+    def get_row(self, index: int) -> Vector:
+        """Obtiene una fila específica como vector."""
+        self._offset(index, 0)
+        return Vector(self._base_line(index, not self._transposed))
+
+    def get_column(self, index: int) -> Vector:
+        """Obtiene una columna específica como vector."""
+        self._offset(0, index)
+        return Vector(self._base_line(index, self._transposed))
+
+    def iter_rows(self) -> Iterator[List[float]]:
+        """Recorre la matriz fila a fila, leyendo una fila del disco a la vez."""
+        for i in range(self.num_rows):
+            yield self._base_line(i, not self._transposed)
+
+    def iter_columns(self) -> Iterator[List[float]]:
+        """Recorre la matriz columna a columna, leyendo una columna del disco a la vez."""
+        for j in range(self.num_columns):
+            yield self._base_line(j, self._transposed)
+
+    def _base_block(self, i0: int, i1: int, j0: int, j1: int) -> array:
+        """Bloque [i0:i1, j0:j1] de la matriz guardada como buffer row-major ``array('d')``."""
+        columnas = self._base_shape[1]
+        bloque = array(self.dtype)
+        for i in range(i0, i1):
+            bloque.frombytes(self._view[i * columnas + j0:i * columnas + j1].tobytes())
+        return bloque if self.dtype == "d" else array('d', bloque)
+
+    def block(self, i0: int, i1: int, j0: int, j1: int) -> array:
+        """
+        Lee el bloque [i0:i1, j0:j1] de la matriz.
+
+        Returns:
+            Buffer row-major ``array('d')`` de (i1 - i0) x (j1 - j0)
+        """
+        if not self._transposed:
+            return self._base_block(i0, i1, j0, j1)
+        base = self._base_block(j0, j1, i0, i1)
+        ancho = i1 - i0
+        bloque = array('d')
+        for ii in range(ancho):
+            bloque.extend(base[ii::ancho])
+        return bloque
+
+    def write_block(self, i0: int, j0: int, data: array, rows: int, columns: int):
+        """Escribe un buffer row-major de rows x columns a partir de la posición (i0, j0)."""
+        if not self.writable:
+            raise PermissionError("La matriz está abierta solo para lectura")
+        if self._transposed:
+            raise ValueError("No se puede escribir por bloques en una vista transpuesta")
+        total = self._base_shape[1]
+        for r in range(rows):
+            fila = data[r * columns:(r + 1) * columns]
+            if self.dtype != "d":
+                fila = array(self.dtype, fila)
+            inicio = (i0 + r) * total + j0
+            self._view[inicio:inicio + columns] = fila
+
+    def to_matrix(self) -> Matrix:
+        """Carga la matriz completa en memoria como ``Matrix``."""
+        filas, columnas = self.shape
+        return Matrix._from_buffer(self.block(0, filas, 0, columnas), filas, columnas)
+
+    def __mul__(self, other: Union['MappedMatrix', Matrix, Vector]) -> Union[Matrix, Vector]:
+        """Producto por bloques con un vector o con otra matriz (resultado en memoria)."""
+        if isinstance(other, Vector):
+            return _mapped_vector_multiply(self, other)
+        if isinstance(other, (Matrix, MappedMatrix)):
+            return mapped_multiply(self, other)
+        return NotImplemented
+
+    def __rmul__(self, other: Matrix) -> Matrix:
+        """Producto por bloques con la matriz en memoria a la izquierda."""
+        if isinstance(other, Matrix):
+            return mapped_multiply(other, self)
+        return NotImplemented
+
+
+def _block(x: Union[Matrix, MappedMatrix], i0: int, i1: int, j0: int, j1: int) -> array:
+    """Bloque row-major [i0:i1, j0:j1] de una matriz en memoria o en disco."""
+    if isinstance(x, MappedMatrix):
+        return x.block(i0, i1, j0, j1)
+    columnas = x.num_columns
+    bloque = array('d')
+    for i in range(i0, i1):
+        bloque.extend(x._data[i * columnas + j0:i * columnas + j1])
+    return bloque
+
+
+def mapped_multiply(m1: Union[Matrix, MappedMatrix], m2: Union[Matrix, MappedMatrix],
+                    out: Optional[Union[Matrix, MappedMatrix]] = None,
+                    block_size: Optional[int] = None) -> Union[Matrix, MappedMatrix]:
+    """
+    Multiplica dos matrices (en memoria o en disco) leyendo un bloque a la vez.
+
+    En cada momento solo hay en memoria un bloque de cada operando y un
+    bloque del resultado (3 x block_size² elementos).
+
+    Args:
+        m1: Primera matriz
+        m2: Segunda matriz
+        out: Destino del resultado; si es una ``MappedMatrix`` el resultado
+            se escribe directamente en disco. Por defecto una nueva ``Matrix``
+        block_size: Tamaño de bloque; por defecto MAPPED_BLOCK_SIZE
+
+    Returns:
+        La matriz resultado (``out`` si se indicó)
+    """
+    filas, interna = m1.shape
+    if interna != m2.shape[0]:
+        raise ValueError("Error de multiplicación")
+    columnas = m2.shape[1]
+    paso = block_size or MAPPED_BLOCK_SIZE
+    if out is None:
+        out = Matrix._from_buffer(array('d', bytes(8 * filas * columnas)), filas, columnas)
+    elif tuple(out.shape) != (filas, columnas):
+        raise ValueError("La matriz de salida no tiene la dimensión correcta")
+
+    for i0 in range(0, filas, paso):
+        i1 = min(i0 + paso, filas)
+        for j0 in range(0, columnas, paso):
+            j1 = min(j0 + paso, columnas)
+            acumulado = None
+            for k0 in range(0, interna, paso):
+                k1 = min(k0 + paso, interna)
+                parcial = _matmul_kernel(_block(m1, i0, i1, k0, k1), _block(m2, k0, k1, j0, j1),
+                                         i1 - i0, k1 - k0, j1 - j0)
+                acumulado = parcial if acumulado is None else array(
+                    'd', map(float.__add__, acumulado, parcial))
+            if acumulado is None:
+                acumulado = array('d', bytes(8 * (i1 - i0) * (j1 - j0)))
+            if isinstance(out, MappedMatrix):
+                out.write_block(i0, j0, acumulado, i1 - i0, j1 - j0)
+            else:
+                ancho = j1 - j0
+                for r in range(i1 - i0):
+                    inicio = (i0 + r) * columnas + j0
+                    out._data[inicio:inicio + ancho] = acumulado[r * ancho:(r + 1) * ancho]
+    if isinstance(out, Matrix):
+        out._touch()
+    return out
+
+
+def _mapped_vector_multiply(matrix: MappedMatrix, vector: Vector,
+                            block_size: Optional[int] = None) -> Vector:
+    """Producto matriz-vector leyendo la matriz por bloques."""
+    filas, columnas = matrix.shape
+    if columnas != len(vector._data):
+        raise ValueError("Error de multiplicación")
+    paso = block_size or MAPPED_BLOCK_SIZE
+    x = array('d', vector._data)
+    resultado = []
+    for i0 in range(0, filas, paso):
+        i1 = min(i0 + paso, filas)
+        parcial = [0.0] * (i1 - i0)
+        for k0 in range(0, columnas, paso):
+            k1 = min(k0 + paso, columnas)
+            producto = _matmul_kernel(matrix.block(i0, i1, k0, k1), x[k0:k1], i1 - i0, k1 - k0, 1)
+            parcial = list(map(float.__add__, parcial, producto))
+        resultado.extend(parcial)
+    return Vector(resultado)
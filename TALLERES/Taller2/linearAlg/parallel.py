@@ -0,0 +1,116 @@
+"""
+Multiplicación de matrices en paralelo
+======================================
+
+Reparte el producto ``m1 * m2`` en bloques de filas del resultado y los
+calcula en un ``ProcessPoolExecutor``, esquivando el GIL. Los operandos y
+el resultado viven en ``multiprocessing.shared_memory``: a cada proceso
+solo se le envían los nombres de los segmentos, las dimensiones y el rango
+de filas que le toca, nunca las matrices serializadas.
+
+Se usa a través de ``matrix_multiply(m1, m2, workers=N)``.
+"""
+
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+
+from .linAlg import Matrix, _matmul_kernel
+
+# Bloques por proceso: algo más de uno para equilibrar la carga.
+BLOCKS_PER_WORKER = 2
+
+
+def _row_blocks(rows: int, blocks: int) -> List[Tuple[int, int]]:
+    """Divide range(rows) en a lo sumo ``blocks`` rangos contiguos de tamaño parecido."""
+    blocks = max(1, min(blocks, rows))
+    base, resto = divmod(rows, blocks)
+    rangos = []
+    inicio = 0
+    for b in range(blocks):
+        fin = inicio + base + (1 if b < resto else 0)
+        rangos.append((inicio, fin))
+        inicio = fin
+    return rangos
+
+
+def _multiply_block(name_a: str, name_b: str, name_c: str, rows: int, inner: int,
+                    columns: int, start: int, stop: int) -> int:
+    """
+    Calcula las filas [start, stop) del producto dentro de un proceso trabajador.
+
+    Lee el bloque de filas de A y la matriz B completa desde memoria
+    compartida y escribe las filas calculadas directamente en C.
+
+    Returns:
+        El número de filas calculadas
+    """
+    shm_a = shared_memory.SharedMemory(name=name_a)
+    shm_b = shared_memory.SharedMemory(name=name_b)
+    shm_c = shared_memory.SharedMemory(name=name_c)
+    try:
+        bloque_a = array('d')
+        bloque_a.frombytes(shm_a.buf[start * inner * 8:stop * inner * 8])
+        b = array('d')
+        b.frombytes(shm_b.buf[:inner * columns * 8])
+        resultado = _matmul_kernel(bloque_a, b, stop - start, inner, columns)
+        shm_c.buf[start * columns * 8:stop * columns * 8] = resultado.tobytes()
+    finally:
+        shm_a.close()
+        shm_b.close()
+        shm_c.close()
+    return stop - start
+
+
+def _to_shared(buffer: array) -> shared_memory.SharedMemory:
+    """Copia un buffer ``array('d')`` a un nuevo segmento de memoria compartida."""
+    shm = shared_memory.SharedMemory(create=True, size=max(8, len(buffer) * 8))
+    shm.buf[:len(buffer) * 8] = buffer.tobytes()
+    return shm
+
+
+def parallel_matrix_multiply(m1: Matrix, m2: Matrix, workers: Optional[int] = None) -> Matrix:
+    """
+    Multiplica dos matrices repartiendo bloques de filas entre procesos.
+
+    Args:
+        m1: Primera matriz
+        m2: Segunda matriz
+        workers: Número de procesos; por defecto ``os.cpu_count()``
+
+    Returns:
+        Una nueva matriz resultado de la multiplicación
+    """
+    filas, interna = m1.shape
+    if interna != m2.num_rows:
+        raise ValueError("Error de multiplicación")
+    columnas = m2.num_columns
+    workers = workers or os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("El número de procesos debe ser positivo")
+
+    segmentos = []
+    try:
+        shm_a = _to_shared(m1._data)
+        segmentos.append(shm_a)
+        shm_b = _to_shared(m2._data)
+        segmentos.append(shm_b)
+        shm_c = shared_memory.SharedMemory(create=True, size=max(8, filas * columnas * 8))
+        segmentos.append(shm_c)
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futuros = [executor.submit(_multiply_block, shm_a.name, shm_b.name, shm_c.name,
+                                       filas, interna, columnas, inicio, fin)
+                       for inicio, fin in _row_blocks(filas, workers * BLOCKS_PER_WORKER)]
+            for futuro in futuros:
+                futuro.result()
+
+        resultado = array('d')
+        resultado.frombytes(shm_c.buf[:filas * columnas * 8])
+        return Matrix._from_buffer(resultado, filas, columnas)
+    finally:
+        for shm in segmentos:
+            shm.close()
+            shm.unlink()
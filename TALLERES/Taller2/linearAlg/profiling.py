@@ -0,0 +1,300 @@
+"""
+Instrumentación de operaciones
+==============================
+
+Registra, para cada operación de la librería (``Matrix.__mul__``,
+``Matrix.determinant``, ``Matrix.inverse``, ``Vector.dot``, ...), el número
+de llamadas, el tiempo acumulado, una estimación de FLOPs y los bytes de los
+resultados que retorna (8 por elemento).
+
+No cuesta nada cuando está apagada: los métodos se envuelven solo al
+activar el perfilador y se restauran los originales al desactivarlo.
+
+Uso::
+
+    with profile() as perfil:
+        ejecutar_trabajo()
+    print(perfil.summary())
+    perfil.save_chrome_trace("traza.json")   # abrir en chrome://tracing
+
+También se puede usar como interruptor global con ``enable()`` y
+``disable()``.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .linAlg import Vector, Matrix, LUDecomposition
+
+# Estimación de FLOPs a partir de los argumentos de la llamada.
+CostFunction = Callable[..., int]
+
+
+class OperationStats:
+    """
+    Estadísticas acumuladas de una operación.
+
+    Atributos:
+        calls: Número de llamadas
+        seconds: Tiempo acumulado (incluye las operaciones anidadas)
+        flops: Operaciones de punto flotante estimadas
+        bytes: Bytes estimados de los resultados retornados
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.flops = 0
+        self.bytes = 0
+
+    def __repr__(self) -> str:
+        return (f"OperationStats(llamadas={self.calls}, segundos={self.seconds:.6f}, "
+                f"flops={self.flops}, bytes={self.bytes})")
+
+
+class Profiler:
+    """
+    Acumula las mediciones de las operaciones instrumentadas.
+    """
+
+    def __init__(self, trace: bool = True):
+        """
+        Args:
+            trace: Si se guarda cada llamada como evento para la traza de Chrome
+        """
+        self.trace = trace
+        self.stats: Dict[str, OperationStats] = {}
+        self.events: List[Tuple[str, int, int, int, int]] = []
+        self._lock = threading.Lock()
+
+    def record(self, name: str, start_ns: int, elapsed_ns: int, flops: int, nbytes: int):
+        """Agrega una llamada a las estadísticas (y a la traza si está activa)."""
+        with self._lock:
+            estadisticas = self.stats.get(name)
+            if estadisticas is None:
+                estadisticas = self.stats[name] = OperationStats()
+            estadisticas.calls += 1
+            estadisticas.seconds += elapsed_ns / 1e9
+            estadisticas.flops += flops
+            estadisticas.bytes += nbytes
+            if self.trace:
+                self.events.append((name, start_ns, elapsed_ns, threading.get_ident(), flops))
+
+    def reset(self):
+        """Descarta todas las mediciones."""
+        with self._lock:
+            self.stats.clear()
+            self.events.clear()
+
+    def summary(self, sort: str = "seconds") -> str:
+        """
+        Tabla de resumen por operación.
+
+        Args:
+            sort: Columna por la que ordenar ("seconds", "calls", "flops" o "bytes")
+
+        Returns:
+            La tabla como texto
+        """
+        filas = sorted(self.stats.items(), key=lambda item: getattr(item[1], sort), reverse=True)
+        lineas = [f"{'operación':<26}{'llamadas':>10}{'tiempo (s)':>14}{'ms/llamada':>12}"
+                  f"{'MFLOP':>12}{'MFLOP/s':>10}{'MB':>10}"]
+        for nombre, s in filas:
+            por_llamada = s.seconds / s.calls * 1e3 if s.calls else 0.0
+            tasa = s.flops / s.seconds / 1e6 if s.seconds else 0.0
+            lineas.append(f"{nombre:<26}{s.calls:>10}{s.seconds:>14.6f}{por_llamada:>12.4f}"
+                          f"{s.flops / 1e6:>12.3f}{tasa:>10.1f}{s.bytes / 1e6:>10.3f}")
+        return "\n".join(lineas)
+
+    def chrome_trace(self) -> dict:
+        """
+        Traza en el formato de eventos de Chrome (chrome://tracing, Perfetto).
+
+        Returns:
+            Un diccionario serializable a JSON
+        """
+        pid = os.getpid()
+        eventos = [{"name": nombre, "cat": "linearAlg", "ph": "X",
+                    "ts": inicio / 1e3, "dur": duracion / 1e3,
+                    "pid": pid, "tid": hilo, "args": {"flops": flops}}
+                   for nombre, inicio, duracion, hilo, flops in self.events]
+        return {"traceEvents": eventos, "displayTimeUnit": "ms"}
+
+    def save_chrome_trace(self, path: str):
+        """Guarda la traza de Chrome en un archivo JSON."""
+        with open(path, "w", encoding="utf-8") as archivo:
+            json.dump(self.chrome_trace(), archivo)
+
+    def __enter__(self) -> 'Profiler':
+        enable(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        disable()
+
+
+# =============================================================================
+# ESTIMACIONES DE COSTO
+# =============================================================================
+
+def _memoized(matrix: Matrix, key: str) -> bool:
+    """Indica si la matriz ya tiene memorizado un resultado vigente."""
+    entrada = matrix._cache.get(key)
+    return entrada is not None and entrada[0] == matrix._version
+
+
+def _product_flops(self: Matrix, other=None, *args) -> int:
+    filas, columnas = self.shape
+    if isinstance(other, (int, float)):
+        return filas * columnas
+    if isinstance(other, Vector):
+        return 2 * filas * columnas
+    if isinstance(other, Matrix):
+        return 2 * filas * columnas * other.num_columns
+    return 0
+
+
+def _elementwise_flops(self, *args) -> int:
+    if isinstance(self, Vector):
+        return len(self._data)
+    return self.shape[0] * self.shape[1]
+
+
+def _lu_flops(n: int) -> int:
+    return 2 * n ** 3 // 3
+
+
+def _determinant_flops(self: Matrix) -> int:
+    if _memoized(self, "determinant") or _memoized(self, "lu"):
+        return 0
+    return _lu_flops(self.num_rows)
+
+
+def _inverse_flops(self: Matrix) -> int:
+    if _memoized(self, "inverse"):
+        return 0
+    n = self.num_rows
+    return 2 * n ** 3 + (0 if _memoized(self, "lu") else _lu_flops(n))
+
+
+def _factorization_flops(self, matrix: Matrix) -> int:
+    return _lu_flops(matrix.num_rows)
+
+
+def _dot_flops(self: Vector, *args) -> int:
+    return 2 * len(self._data)
+
+
+def _result_bytes(result) -> int:
+    """Bytes estimados del resultado (8 por elemento)."""
+    if isinstance(result, Matrix):
+        return 8 * len(result._data)
+    if isinstance(result, Vector):
+        return result._data.itemsize * len(result._data)
+    return 0
+
+
+# (clase, atributo, nombre en el perfil, estimación de FLOPs)
+TARGETS = [
+    (Matrix, "__mul__", "Matrix.__mul__", _product_flops),
+    (Matrix, "__add__", "Matrix.__add__", _elementwise_flops),
+    (Matrix, "__sub__", "Matrix.__sub__", _elementwise_flops),
+    (Matrix, "T", "Matrix.T", None),
+    (Matrix, "determinant", "Matrix.determinant", _determinant_flops),
+    (Matrix, "inverse", "Matrix.inverse", _inverse_flops),
+    (LUDecomposition, "__init__", "lu_decomposition", _factorization_flops),
+    (Vector, "dot", "Vector.dot", _dot_flops),
+    (Vector, "__add__", "Vector.__add__", _elementwise_flops),
+    (Vector, "__sub__", "Vector.__sub__", _elementwise_flops),
+    (Vector, "__mul__", "Vector.__mul__", _elementwise_flops),
+]
+
+
+# =============================================================================
+# ACTIVACIÓN
+# =============================================================================
+
+_active: Optional[Profiler] = None
+_originals: Dict[Tuple[type, str], object] = {}
+
+
+def _instrument(function: Callable, name: str, cost: Optional[CostFunction]) -> Callable:
+    """Envuelve una función para que registre cada llamada en el perfilador activo."""
+    @functools.wraps(function)
+    def instrumentada(*args, **kwargs):
+        perfilador = _active
+        if perfilador is None:
+            return function(*args, **kwargs)
+        flops = cost(*args) if cost is not None else 0
+        resultado = None
+        inicio = time.perf_counter_ns()
+        try:
+            resultado = function(*args, **kwargs)
+            return resultado
+        finally:
+            duracion = time.perf_counter_ns() - inicio
+            perfilador.record(name, inicio, duracion, flops, _result_bytes(resultado))
+    return instrumentada
+
+
+def enable(profiler: Optional[Profiler] = None) -> Profiler:
+    """
+    Activa la instrumentación.
+
+    Args:
+        profiler: Perfilador donde acumular; si no se indica se crea uno
+
+    Returns:
+        El perfilador activo
+    """
+    global _active
+    if _active is not None:
+        raise RuntimeError("Ya hay un perfilador activo")
+    _active = profiler if profiler is not None else Profiler()
+    for clase, atributo, nombre, costo in TARGETS:
+        original = clase.__dict__[atributo]
+        _originals[(clase, atributo)] = original
+        if isinstance(original, property):
+            envuelto = property(_instrument(original.fget, nombre, costo),
+                                original.fset, original.fdel, original.__doc__)
+        else:
+            envuelto = _instrument(original, nombre, costo)
+        setattr(clase, atributo, envuelto)
+    return _active
+
+
+def disable() -> Optional[Profiler]:
+    """
+    Desactiva la instrumentación y restaura los métodos originales.
+
+    Returns:
+        El perfilador que estaba activo (None si no había)
+    """
+    global _active
+    for (clase, atributo), original in _originals.items():
+        setattr(clase, atributo, original)
+    _originals.clear()
+    perfilador, _active = _active, None
+    return perfilador
+
+
+def is_enabled() -> bool:
+    """Indica si la instrumentación está activa."""
+    return _active is not None
+
+
+def profile(trace: bool = True) -> Profiler:
+    """
+    Crea un perfilador para usar como administrador de contexto.
+
+    Args:
+        trace: Si se guarda cada llamada para la traza de Chrome
+
+    Returns:
+        Un ``Profiler`` que se activa al entrar al bloque ``with``
+    """
+    return Profiler(trace)
@@ -0,0 +1,202 @@
+"""
+Serialización binaria de Matrix y Vector
+========================================
+
+``save`` guarda una ``Matrix`` o un ``Vector`` en un archivo binario y
+``load`` lo recupera leyendo los bytes directamente en el buffer ``array``
+del objeto, sin interpretar texto (a diferencia de JSON o CSV).
+
+Formato de un registro: una cabecera de ``HEADER_SIZE`` bytes (firma,
+versión, clase, tipo de dato, compresión, forma, tamaño y CRC32 de los
+datos guardados) seguida de los elementos en orden por filas, en
+little-endian. Los datos se pueden comprimir con zlib.
+
+``save_archive`` y ``load_archive`` guardan y cargan varios arreglos con
+nombre en un solo archivo: una cabecera, los registros uno tras otro
+(alineados a 64 bytes) y al final un índice JSON {nombre: posición}, de
+modo que se puede cargar un arreglo sin leer los demás.
+"""
+
+import json
+import struct
+import sys
+import zlib
+from array import array
+from typing import BinaryIO, Dict, Iterable, Optional, Union
+
+from .linAlg import VECTOR_DTYPES, Vector, Matrix
+
+MAGIC = b"LAAR"
+ARCHIVE_MAGIC = b"LAAZ"
+VERSION = 1
+HEADER_SIZE = 64
+# firma, versión, clase ('M'/'V'), tipo, compresión, filas, columnas, bytes guardados, CRC32
+_HEADER = struct.Struct("<4sBccBQQQI")
+# firma, versión, número de arreglos, posición del índice
+_ARCHIVE_HEADER = struct.Struct("<4sBQQ")
+
+COMPRESSION_NONE = 0
+COMPRESSION_ZLIB = 1
+
+# Nivel de zlib usado con ``compress=True``.
+ZLIB_LEVEL = 6
+
+Serializable = Union[Matrix, Vector]
+
+
+def _payload(buffer: array) -> Union[array, memoryview]:
+    """Bytes de un buffer en little-endian (sin copia en máquinas little-endian)."""
+    if sys.byteorder == "little":
+        return memoryview(buffer)
+    copia = array(buffer.typecode, buffer)
+    copia.byteswap()
+    return memoryview(copia)
+
+
+def _write_record(archivo: BinaryIO, value: Serializable, compress: bool):
+    """Escribe un registro (cabecera + datos) en la posición actual del archivo."""
+    if isinstance(value, Matrix):
+        clase = b"M"
+        filas, columnas = value.shape
+    elif isinstance(value, Vector):
+        clase = b"V"
+        filas, columnas = len(value._data), 1
+    else:
+        raise TypeError("Solo se pueden guardar objetos Matrix o Vector")
+
+    datos = _payload(value._data)
+    compresion = COMPRESSION_NONE
+    tamaño = datos.nbytes
+    if compress:
+        datos = zlib.compress(datos, ZLIB_LEVEL)
+        compresion = COMPRESSION_ZLIB
+        tamaño = len(datos)
+    cabecera = _HEADER.pack(MAGIC, VERSION, clase, value._data.typecode.encode("ascii"),
+                            compresion, filas, columnas, tamaño, zlib.crc32(datos))
+    archivo.write(cabecera.ljust(HEADER_SIZE, b"\0"))
+    archivo.write(datos)
+
+
+def _read_record(archivo: BinaryIO, verify: bool, name: str) -> Serializable:
+    """Lee un registro desde la posición actual del archivo."""
+    cabecera = archivo.read(HEADER_SIZE)
+    if len(cabecera) < HEADER_SIZE:
+        raise ValueError(f"{name} está truncado")
+    firma, version, clase, dtype, compresion, filas, columnas, tamaño, crc = _HEADER.unpack_from(cabecera)
+    # Matrix siempre usa 'd'; Vector admite los tipos de VECTOR_DTYPES
+    tipos = ("d",) if clase == b"M" else VECTOR_DTYPES if clase == b"V" else ()
+    dtype = dtype.decode("latin-1")
+    if firma != MAGIC or version != VERSION or dtype not in tipos:
+        raise ValueError(f"{name} no es un archivo de linearAlg válido")
+    cantidad = filas * columnas
+
+    if compresion == COMPRESSION_NONE:
+        # Los bytes se leen directamente dentro del buffer, sin pasar por texto
+        buffer = array(dtype)
+        try:
+            buffer.fromfile(archivo, cantidad)
+        except (EOFError, ValueError):
+            raise ValueError(f"{name} está truncado") from None
+        if verify and zlib.crc32(memoryview(buffer)) != crc:
+            raise ValueError(f"{name}: la suma de verificación no coincide")
+    elif compresion == COMPRESSION_ZLIB:
+        datos = archivo.read(tamaño)
+        if len(datos) < tamaño:
+            raise ValueError(f"{name} está truncado")
+        if verify and zlib.crc32(datos) != crc:
+            raise ValueError(f"{name}: la suma de verificación no coincide")
+        buffer = array(dtype)
+        buffer.frombytes(zlib.decompress(datos))
+        if len(buffer) != cantidad:
+            raise ValueError(f"{name}: el tamaño de los datos no coincide con la forma")
+    else:
+        raise ValueError(f"{name}: compresión desconocida ({compresion})")
+
+    if sys.byteorder != "little":
+        buffer.byteswap()
+    if clase == b"M":
+        return Matrix._from_buffer(buffer, filas, columnas)
+    return Vector._from_buffer(buffer)
+
+
+def save(value: Serializable, path: str, compress: bool = False):
+    """
+    Guarda una matriz o un vector en un archivo binario.
+
+    Args:
+        value: La ``Matrix`` o el ``Vector``
+        path: Ruta del archivo
+        compress: Si los datos se comprimen con zlib
+    """
+    with open(path, "wb") as archivo:
+        _write_record(archivo, value, compress)
+
+
+def load(path: str, verify: bool = True) -> Serializable:
+    """
+    Carga una matriz o un vector guardado con ``save``.
+
+    Args:
+        path: Ruta del archivo
+        verify: Si se comprueba la suma de verificación CRC32
+
+    Returns:
+        La ``Matrix`` o el ``Vector`` guardado
+    """
+    with open(path, "rb") as archivo:
+        return _read_record(archivo, verify, path)
+
+
+def save_archive(path: str, arrays: Dict[str, Serializable], compress: bool = False):
+    """
+    Guarda varias matrices y vectores con nombre en un solo archivo.
+
+    Args:
+        path: Ruta del archivo
+        arrays: Diccionario {nombre: Matrix o Vector}
+        compress: Si los datos se comprimen con zlib
+    """
+    indice = {}
+    with open(path, "wb") as archivo:
+        archivo.write(bytes(HEADER_SIZE))
+        for nombre, valor in arrays.items():
+            posicion = archivo.tell()
+            relleno = -posicion % HEADER_SIZE
+            archivo.write(bytes(relleno))
+            indice[nombre] = posicion + relleno
+            _write_record(archivo, valor, compress)
+        posicion_indice = archivo.tell()
+        archivo.write(json.dumps(indice).encode("utf-8"))
+        archivo.seek(0)
+        archivo.write(_ARCHIVE_HEADER.pack(ARCHIVE_MAGIC, VERSION, len(indice), posicion_indice))
+
+
+def load_archive(path: str, names: Optional[Iterable[str]] = None,
+                 verify: bool = True) -> Dict[str, Serializable]:
+    """
+    Carga los arreglos de un archivo creado con ``save_archive``.
+
+    Args:
+        path: Ruta del archivo
+        names: Nombres a cargar (todos si es None); los demás no se leen
+        verify: Si se comprueban las sumas de verificación CRC32
+
+    Returns:
+        Diccionario {nombre: Matrix o Vector}
+    """
+    with open(path, "rb") as archivo:
+        firma, version, _, posicion_indice = _ARCHIVE_HEADER.unpack(
+            archivo.read(_ARCHIVE_HEADER.size))
+        if firma != ARCHIVE_MAGIC or version != VERSION:
+            raise ValueError(f"{path} no es un archivo de arreglos válido")
+        archivo.seek(posicion_indice)
+        indice = json.loads(archivo.read().decode("utf-8"))
+        if names is None:
+            names = list(indice)
+        resultado = {}
+        for nombre in names:
+            if nombre not in indice:
+                raise KeyError(f"{path} no contiene el arreglo '{nombre}'")
+            archivo.seek(indice[nombre])
+            resultado[nombre] = _read_record(archivo, verify, f"{path}[{nombre}]")
+        return resultado
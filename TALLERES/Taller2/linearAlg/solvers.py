@@ -0,0 +1,337 @@
+"""
+Solucionadores iterativos
+=========================
+
+Resuelven A·x = b usando solo productos matriz-vector, por lo que sirven
+para ``Matrix``, ``SparseMatrix``, ``MappedMatrix`` o cualquier función
+``A(x) -> Vector``. Para sistemas grandes y dispersos son mucho más
+rápidos que factorizar la matriz: cada iteración cuesta un producto
+matriz-vector (O(nnz) con ``SparseMatrix``).
+
+- ``conjugate_gradient``: para A simétrica definida positiva.
+- ``gmres``: GMRES con reinicio, para A general.
+- ``bicgstab``: BiCGSTAB, para A general con memoria constante.
+- ``jacobi_preconditioner``: precondicionador diagonal (inverso de la diagonal).
+
+Todos aceptan ``tol`` (tolerancia relativa sobre ||b||), ``max_iter``, un
+punto inicial ``x0``, un precondicionador ``M(r) -> z`` y un ``callback``
+que se llama en cada iteración con (iteración, norma del residuo).
+"""
+
+import math
+import operator
+from itertools import repeat
+from typing import Callable, List, Optional, Union
+
+from .linAlg import Vector, Matrix
+
+LinearOperator = Union[Matrix, Callable[[Vector], Vector]]
+Preconditioner = Callable[[List[float]], List[float]]
+Callback = Callable[[int, float], None]
+
+
+class SolverResult:
+    """
+    Resultado de un solucionador iterativo.
+
+    Atributos:
+        x: Vector solución aproximada
+        converged: Si se alcanzó la tolerancia pedida
+        iterations: Número de iteraciones realizadas
+        residual_norm: Norma del residuo ||b - A·x|| final
+        residuals: Norma del residuo en cada iteración
+    """
+
+    def __init__(self, x: Vector, converged: bool, iterations: int,
+                 residual_norm: float, residuals: List[float]):
+        self.x = x
+        self.converged = converged
+        self.iterations = iterations
+        self.residual_norm = residual_norm
+        self.residuals = residuals
+
+    def __repr__(self) -> str:
+        estado = "convergió" if self.converged else "no convergió"
+        return (f"SolverResult({estado}, iteraciones={self.iterations}, "
+                f"residuo={self.residual_norm:.3e})")
+
+
+# =============================================================================
+# OPERACIONES SOBRE LISTAS
+# =============================================================================
+
+def _dot(x: List[float], y: List[float]) -> float:
+    return sum(map(operator.mul, x, y))
+
+
+def _norm(x: List[float]) -> float:
+    return math.sqrt(_dot(x, x))
+
+
+def _axpy(a: float, x: List[float], y: List[float]) -> List[float]:
+    """Retorna y + a·x."""
+    return list(map(operator.add, y, map(operator.mul, repeat(a), x)))
+
+
+def _scale(a: float, x: List[float]) -> List[float]:
+    return list(map(operator.mul, repeat(a), x))
+
+
+def _as_operator(A: LinearOperator, n: int) -> Callable[[List[float]], List[float]]:
+    """Convierte una matriz o función en un operador lista -> lista."""
+    if callable(A) and not hasattr(A, "shape"):
+        def aplicar(x: List[float]) -> List[float]:
+            resultado = A(Vector(x))
+            return resultado.values if isinstance(resultado, Vector) else list(resultado)
+        return aplicar
+    filas, columnas = A.shape
+    if filas != columnas or columnas != n:
+        raise ValueError("La matriz debe ser cuadrada y de la misma dimensión que b")
+    return lambda x: (A * Vector(x)).values
+
+
+def _setup(A: LinearOperator, b: Vector, x0: Optional[Vector], tol: float,
+           max_iter: Optional[int], preconditioner: Optional[Preconditioner]):
+    """Prepara operador, vectores iniciales, tolerancia absoluta y límite de iteraciones."""
+    if tol <= 0:
+        raise ValueError("La tolerancia debe ser positiva")
+    b_lista = b.values
+    n = len(b_lista)
+    aplicar = _as_operator(A, n)
+    if x0 is None:
+        x = [0.0] * n
+    else:
+        if len(x0._data) != n:
+            raise ValueError("x0 no tiene la dimensión de b")
+        x = x0.values
+    precondicionar = preconditioner or list
+    limite = max_iter if max_iter is not None else 10 * n
+    norma_b = _norm(b_lista)
+    return aplicar, b_lista, x, precondicionar, limite, tol * (norma_b if norma_b else 1.0)
+
+
+def jacobi_preconditioner(A: Matrix) -> Preconditioner:
+    """
+    Crea el precondicionador de Jacobi M⁻¹ = diag(A)⁻¹.
+
+    Args:
+        A: Matriz cuadrada (densa, dispersa o en disco) sin ceros en la diagonal
+
+    Returns:
+        Función que aplica M⁻¹ a un residuo
+    """
+    n = A.shape[0]
+    if A.shape[1] != n:
+        raise ValueError("La matriz no es cuadrada")
+    if isinstance(A, Matrix):
+        diagonal = A._data[::n + 1].tolist()
+    else:
+        diagonal = [A[i, i] for i in range(n)]
+    if 0 in diagonal:
+        raise ValueError("La diagonal tiene ceros: no se puede usar el precondicionador de Jacobi")
+    inversa = [1.0 / d for d in diagonal]
+    return lambda r: list(map(operator.mul, inversa, r))
+
+
+def conjugate_gradient(A: LinearOperator, b: Vector, x0: Optional[Vector] = None,
+                       tol: float = 1e-8, max_iter: Optional[int] = None,
+                       preconditioner: Optional[Preconditioner] = None,
+                       callback: Optional[Callback] = None) -> SolverResult:
+    """
+    Resuelve A·x = b con gradiente conjugado (precondicionado).
+
+    Args:
+        A: Matriz simétrica definida positiva o función A(x)
+        b: Lado derecho
+        x0: Punto inicial (por defecto el vector cero)
+        tol: Tolerancia relativa: se detiene cuando ||r|| <= tol·||b||
+        max_iter: Máximo de iteraciones (por defecto 10·n)
+        preconditioner: Función M⁻¹(r), por ejemplo ``jacobi_preconditioner(A)``
+        callback: Función (iteración, norma del residuo) llamada en cada iteración
+
+    Returns:
+        Un ``SolverResult``
+    """
+    aplicar, b, x, precondicionar, limite, umbral = _setup(A, b, x0, tol, max_iter, preconditioner)
+    r = list(map(operator.sub, b, aplicar(x)))
+    residuo = _norm(r)
+    residuos = [residuo]
+    iteracion = 0
+    if residuo > umbral:
+        z = precondicionar(r)
+        p = list(z)
+        rz = _dot(r, z)
+        while iteracion < limite:
+            Ap = aplicar(p)
+            pAp = _dot(p, Ap)
+            if pAp <= 0:
+                raise ValueError("La matriz no es definida positiva")
+            alpha = rz / pAp
+            x = _axpy(alpha, p, x)
+            r = _axpy(-alpha, Ap, r)
+            iteracion += 1
+            residuo = _norm(r)
+            residuos.append(residuo)
+            if callback is not None:
+                callback(iteracion, residuo)
+            if residuo <= umbral:
+                break
+            z = precondicionar(r)
+            rz_nuevo = _dot(r, z)
+            p = _axpy(rz_nuevo / rz, p, z)
+            rz = rz_nuevo
+    return SolverResult(Vector(x), residuo <= umbral, iteracion, residuo, residuos)
+
+
+def gmres(A: LinearOperator, b: Vector, x0: Optional[Vector] = None,
+          tol: float = 1e-8, max_iter: Optional[int] = None, restart: int = 30,
+          preconditioner: Optional[Preconditioner] = None,
+          callback: Optional[Callback] = None) -> SolverResult:
+    """
+    Resuelve A·x = b con GMRES reiniciado cada ``restart`` iteraciones.
+
+    Usa precondicionamiento por la derecha, de modo que el residuo
+    reportado es el residuo real ||b - A·x||.
+
+    Args:
+        A: Matriz general o función A(x)
+        b: Lado derecho
+        x0: Punto inicial (por defecto el vector cero)
+        tol: Tolerancia relativa: se detiene cuando ||r|| <= tol·||b||
+        max_iter: Máximo de iteraciones totales (por defecto 10·n)
+        restart: Dimensión del subespacio de Krylov antes de reiniciar
+        preconditioner: Función M⁻¹(r), por ejemplo ``jacobi_preconditioner(A)``
+        callback: Función (iteración, norma del residuo) llamada en cada iteración
+
+    Returns:
+        Un ``SolverResult``
+    """
+    aplicar, b, x, precondicionar, limite, umbral = _setup(A, b, x0, tol, max_iter, preconditioner)
+    if restart < 1:
+        raise ValueError("restart debe ser positivo")
+    r = list(map(operator.sub, b, aplicar(x)))
+    residuo = _norm(r)
+    residuos = [residuo]
+    iteracion = 0
+
+    while residuo > umbral and iteracion < limite:
+        beta = residuo
+        V = [_scale(1 / beta, r)]
+        Z = []
+        H: List[List[float]] = []
+        cosenos: List[float] = []
+        senos: List[float] = []
+        g = [beta]
+
+        for j in range(restart):
+            z = precondicionar(V[j])
+            Z.append(z)
+            w = aplicar(z)
+            columna = []
+            for v in V:
+                h = _dot(w, v)
+                columna.append(h)
+                w = _axpy(-h, v, w)
+            h_sig = _norm(w)
+
+            for i in range(j):
+                a, c = columna[i], columna[i + 1]
+                columna[i] = cosenos[i] * a + senos[i] * c
+                columna[i + 1] = -senos[i] * a + cosenos[i] * c
+            denominador = math.hypot(columna[j], h_sig)
+            cos, sen = (1.0, 0.0) if denominador == 0 else (columna[j] / denominador, h_sig / denominador)
+            cosenos.append(cos)
+            senos.append(sen)
+            columna[j] = denominador
+            g.append(-sen * g[j])
+            g[j] = cos * g[j]
+            H.append(columna)
+
+            iteracion += 1
+            residuo = abs(g[j + 1])
+            residuos.append(residuo)
+            if callback is not None:
+                callback(iteracion, residuo)
+            if residuo <= umbral or h_sig == 0 or iteracion >= limite:
+                break
+            V.append(_scale(1 / h_sig, w))
+
+        # Resuelve el sistema triangular H·y = g y actualiza x += Z·y
+        k = len(H)
+        y = [0.0] * k
+        for i in range(k - 1, -1, -1):
+            suma = sum(H[m][i] * y[m] for m in range(i + 1, k))
+            y[i] = (g[i] - suma) / H[i][i] if H[i][i] else 0.0
+        for yi, zi in zip(y, Z):
+            x = _axpy(yi, zi, x)
+        r = list(map(operator.sub, b, aplicar(x)))
+        residuo = _norm(r)
+        residuos[-1] = residuo
+
+    return SolverResult(Vector(x), residuo <= umbral, iteracion, residuo, residuos)
+
+
+def bicgstab(A: LinearOperator, b: Vector, x0: Optional[Vector] = None,
+             tol: float = 1e-8, max_iter: Optional[int] = None,
+             preconditioner: Optional[Preconditioner] = None,
+             callback: Optional[Callback] = None) -> SolverResult:
+    """
+    Resuelve A·x = b con BiCGSTAB (gradiente biconjugado estabilizado).
+
+    Args:
+        A: Matriz general o función A(x)
+        b: Lado derecho
+        x0: Punto inicial (por defecto el vector cero)
+        tol: Tolerancia relativa: se detiene cuando ||r|| <= tol·||b||
+        max_iter: Máximo de iteraciones (por defecto 10·n)
+        preconditioner: Función M⁻¹(r), por ejemplo ``jacobi_preconditioner(A)``
+        callback: Función (iteración, norma del residuo) llamada en cada iteración
+
+    Returns:
+        Un ``SolverResult``
+    """
+    aplicar, b, x, precondicionar, limite, umbral = _setup(A, b, x0, tol, max_iter, preconditioner)
+    n = len(b)
+    r = list(map(operator.sub, b, aplicar(x)))
+    r_sombra = list(r)
+    residuo = _norm(r)
+    residuos = [residuo]
+    iteracion = 0
+    rho = alpha = omega = 1.0
+    v = [0.0] * n
+    p = [0.0] * n
+
+    while residuo > umbral and iteracion < limite:
+        rho_nuevo = _dot(r_sombra, r)
+        if rho_nuevo == 0:
+            break
+        beta = (rho_nuevo / rho) * (alpha / omega)
+        p = _axpy(beta, _axpy(-omega, v, p), r)
+        p_prec = precondicionar(p)
+        v = aplicar(p_prec)
+        denominador = _dot(r_sombra, v)
+        if denominador == 0:
+            break
+        alpha = rho_nuevo / denominador
+        s = _axpy(-alpha, v, r)
+        iteracion += 1
+        if _norm(s) <= umbral:
+            x = _axpy(alpha, p_prec, x)
+            r = s
+            residuo = _norm(r)
+        else:
+            s_prec = precondicionar(s)
+            t = aplicar(s_prec)
+            tt = _dot(t, t)
+            omega = _dot(t, s) / tt if tt else 0.0
+            x = _axpy(omega, s_prec, _axpy(alpha, p_prec, x))
+            r = _axpy(-omega, t, s)
+            residuo = _norm(r)
+        residuos.append(residuo)
+        if callback is not None:
+            callback(iteracion, residuo)
+        if omega == 0:
+            break
+        rho = rho_nuevo
+
+    return SolverResult(Vector(x), residuo <= umbral, iteracion, residuo, residuos)
@@ -0,0 +1,310 @@
+"""
+Matrices dispersas
+==================
+
+``SparseMatrix`` guarda solo los elementos distintos de cero en formato CSR
+(Compressed Sparse Row): para cada fila, las posiciones ``indptr[i]`` a
+``indptr[i + 1]`` de ``indices`` y ``data`` contienen las columnas y los
+valores no nulos de esa fila. La memoria y el tiempo de las operaciones
+escalan con el número de no ceros (``nnz``) y no con filas x columnas.
+
+Se construye a partir de tripletas COO (fila, columna, valor) o desde una
+``Matrix`` densa, y se mezcla libremente con ``Matrix`` y ``Vector`` en los
+operadores y en ``vector_multiply``, ``matrix_multiply`` y ``add``.
+"""
+
+import operator
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Tuple, Union
+
+from .linAlg import Vector, Matrix
+
+
+class SparseMatrix:
+    """
+    Clase para representar matrices dispersas en formato CSR.
+    """
+
+    def __init__(self, shape: Tuple[int, int], rows: Iterable[int] = (),
+                 columns: Iterable[int] = (), values: Iterable[Union[int, float]] = ()):
+        """
+        Construye la matriz a partir de tripletas COO.
+
+        Las entradas repetidas se suman y los ceros resultantes se descartan.
+
+        Args:
+            shape: Dimensiones (filas, columnas)
+            rows: Índices de fila de cada elemento
+            columns: Índices de columna de cada elemento
+            values: Valor de cada elemento
+        """
+        num_filas, num_columnas = shape
+        rows, columns, values = list(rows), list(columns), list(values)
+        if not len(rows) == len(columns) == len(values):
+            raise ValueError("Las listas de filas, columnas y valores deben tener la misma longitud")
+        for i, j in zip(rows, columns):
+            if not (0 <= i < num_filas and 0 <= j < num_columnas):
+                raise IndexError(f"El elemento ({i}, {j}) está fuera de la matriz")
+
+        acumulado: Dict[Tuple[int, int], float] = {}
+        for i, j, v in zip(rows, columns, values):
+            acumulado[(i, j)] = acumulado.get((i, j), 0.0) + v
+        self._set_rows(shape, _group_rows(num_filas, acumulado))
+
+    def _set_rows(self, shape: Tuple[int, int], filas: List[List[Tuple[int, float]]]):
+        """Construye los arreglos CSR a partir de filas de pares (columna, valor) ordenados."""
+        indptr = array('q', [0])
+        indices = array('q')
+        data = array('d')
+        for fila in filas:
+            for j, v in fila:
+                if v != 0:
+                    indices.append(j)
+                    data.append(v)
+            indptr.append(len(data))
+        self._shape = (shape[0], shape[1])
+        self._indptr = indptr
+        self._indices = indices
+        self._data = data
+
+    @classmethod
+    def _from_rows(cls, shape: Tuple[int, int], filas: List[List[Tuple[int, float]]]) -> 'SparseMatrix':
+        """Crea una matriz a partir de filas de pares (columna, valor) ordenados por columna."""
+        matriz = cls.__new__(cls)
+        matriz._set_rows(shape, filas)
+        return matriz
+
+    @classmethod
+    def from_matrix(cls, matrix: Matrix) -> 'SparseMatrix':
+        """
+        Convierte una matriz densa en dispersa.
+
+        Args:
+            matrix: La matriz densa
+
+        Returns:
+            Una nueva matriz dispersa con los elementos no nulos
+        """
+        filas = []
+        for i in range(matrix.num_rows):
+            filas.append([(j, v) for j, v in enumerate(matrix.row_view(i)) if v != 0])
+        return cls._from_rows(matrix.shape, filas)
+
+    def to_matrix(self) -> Matrix:
+        """Convierte la matriz dispersa en una ``Matrix`` densa."""
+        filas, columnas = self._shape
+        buffer = array('d', bytes(8 * filas * columnas))
+        for i in range(filas):
+            base = i * columnas
+            for k in range(self._indptr[i], self._indptr[i + 1]):
+                buffer[base + self._indices[k]] = self._data[k]
+        return Matrix._from_buffer(buffer, filas, columnas)
+
+    def _row(self, i: int) -> List[Tuple[int, float]]:
+        """Retorna la fila i como lista de pares (columna, valor)."""
+        a, b = self._indptr[i], self._indptr[i + 1]
+        return list(zip(self._indices[a:b], self._data[a:b]))
+
+    def __str__(self) -> str:
+        """Representación en string de la matriz dispersa."""
+        return f"Matriz dispersa {self._shape[0]}x{self._shape[1]} con {self.nnz} elementos no nulos"
+
+    def __repr__(self) -> str:
+        """Representación detallada de la matriz dispersa."""
+        return f"SparseMatrix(shape={self._shape}, nnz={self.nnz})"
+
+    def __getitem__(self, key: Tuple[int, int]) -> float:
+        """Permite acceder a un elemento (i, j); los elementos no guardados valen 0."""
+        if not (isinstance(key, tuple) and len(key) == 2):
+            raise TypeError("El índice debe ser una tupla (i, j)")
+        i, j = key
+        filas, columnas = self._shape
+        if i < 0:
+            i += filas
+        if j < 0:
+            j += columnas
+        if not (0 <= i < filas and 0 <= j < columnas):
+            raise IndexError("Índice fuera del rango de la matriz")
+        a, b = self._indptr[i], self._indptr[i + 1]
+        k = bisect_left(self._indices, j, a, b)
+        if k < b and self._indices[k] == j:
+            return self._data[k]
+        return 0.0
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """Retorna las dimensiones de la matriz como (filas, columnas)."""
+        return self._shape
+
+    @property
+    def num_rows(self) -> int:
+        """Retorna el número de filas de la matriz."""
+        return self._shape[0]
+
+    @property
+    def num_columns(self) -> int:
+        """Retorna el número de columnas de la matriz."""
+        return self._shape[1]
+
+    @property
+    def nnz(self) -> int:
+        """Retorna el número de elementos no nulos guardados."""
+        return len(self._data)
+
+    @property
+    def T(self) -> 'SparseMatrix':
+        """Retorna la transpuesta de la matriz en O(nnz)."""
+        filas, columnas = self._shape
+        transpuesta: List[List[Tuple[int, float]]] = [[] for _ in range(columnas)]
+        for i in range(filas):
+            for k in range(self._indptr[i], self._indptr[i + 1]):
+                transpuesta[self._indices[k]].append((i, self._data[k]))
+        return SparseMatrix._from_rows((columnas, filas), transpuesta)
+
+    def transpose(self) -> 'SparseMatrix':
+        """Retorna la transpuesta de la matriz (equivale a ``T``)."""
+        return self.T
+
+    @property
+    def trace(self) -> float:
+        """Calcula y retorna la traza de la matriz (suma de elementos diagonales)."""
+        if self._shape[0] != self._shape[1]:
+            raise ValueError("La matriz no es cuadrada")
+        return sum(self[i, i] for i in range(self._shape[0]))
+
+    def is_square(self) -> bool:
+        """Verifica si la matriz es cuadrada."""
+        return self._shape[0] == self._shape[1]
+
+    def is_diagonal(self) -> bool:
+        """Verifica si la matriz es diagonal recorriendo solo los no ceros."""
+        if not self.is_square():
+            return False
+        for i in range(self._shape[0]):
+            for k in range(self._indptr[i], self._indptr[i + 1]):
+                if self._indices[k] != i:
+                    return False
+        return True
+
+    def __eq__(self, other: Union['SparseMatrix', Matrix]) -> bool:
+        """Igualdad con otra matriz dispersa o densa."""
+        if isinstance(other, SparseMatrix):
+            return (self._shape == other._shape and self._indptr == other._indptr
+                    and self._indices == other._indices and self._data == other._data)
+        if isinstance(other, Matrix):
+            return self.to_matrix() == other
+        return NotImplemented
+
+    def __ne__(self, other: Union['SparseMatrix', Matrix]) -> bool:
+        """Desigualdad con otra matriz dispersa o densa."""
+        resultado = self.__eq__(other)
+        return resultado if resultado is NotImplemented else not resultado
+
+    def __add__(self, other: Union['SparseMatrix', Matrix]) -> Union['SparseMatrix', Matrix]:
+        """Suma con otra matriz dispersa (resultado disperso) o densa (resultado denso)."""
+        if isinstance(other, SparseMatrix):
+            if self._shape != other._shape:
+                raise ValueError("Las matrices no tienen la misma dimensión")
+            filas = []
+            for i in range(self._shape[0]):
+                acumulado = dict(self._row(i))
+                for j, v in other._row(i):
+                    acumulado[j] = acumulado.get(j, 0.0) + v
+                filas.append(sorted(acumulado.items()))
+            return SparseMatrix._from_rows(self._shape, filas)
+
+        elif isinstance(other, Matrix):
+            if self._shape != other.shape:
+                raise ValueError("Las matrices no tienen la misma dimensión")
+            resultado = other._rows()
+            for i in range(self._shape[0]):
+                fila = resultado[i]
+                for j, v in self._row(i):
+                    fila[j] += v
+            return Matrix(resultado)
+
+        return NotImplemented
+
+    def __radd__(self, other: Matrix) -> Matrix:
+        """Suma con la matriz densa a la izquierda."""
+        return self + other
+
+    def __sub__(self, other: Union['SparseMatrix', Matrix]) -> Union['SparseMatrix', Matrix]:
+        """Resta de matrices usando el operador -."""
+        if isinstance(other, (SparseMatrix, Matrix)):
+            return self + other * -1
+        return NotImplemented
+
+    def __rsub__(self, other: Matrix) -> Matrix:
+        """Resta con la matriz densa a la izquierda."""
+        return self * -1 + other
+
+    def __mul__(self, other: Union['SparseMatrix', Matrix, Vector, int, float]
+                ) -> Union['SparseMatrix', Matrix, Vector]:
+        """Multiplicación por escalar, vector, matriz dispersa o matriz densa."""
+        if isinstance(other, (int, float)):
+            resultado = SparseMatrix.__new__(SparseMatrix)
+            if other == 0:
+                resultado._set_rows(self._shape, [[] for _ in range(self._shape[0])])
+            else:
+                resultado._shape = self._shape
+                resultado._indptr = array('q', self._indptr)
+                resultado._indices = array('q', self._indices)
+                resultado._data = array('d', [v * other for v in self._data])
+            return resultado
+
+        elif isinstance(other, Vector):
+            if self._shape[1] != len(other._data):
+                raise ValueError("Error de multiplicación")
+            x = other._data
+            componentes = []
+            for i in range(self._shape[0]):
+                a, b = self._indptr[i], self._indptr[i + 1]
+                componentes.append(sum(map(operator.mul, self._data[a:b],
+                                           map(x.__getitem__, self._indices[a:b]))))
+            return Vector(componentes)
+
+        elif isinstance(other, SparseMatrix):
+            if self._shape[1] != other._shape[0]:
+                raise ValueError("Error de multiplicación")
+            filas = []
+            for i in range(self._shape[0]):
+                acumulado: Dict[int, float] = {}
+                for k, a_ik in self._row(i):
+                    for j, b_kj in other._row(k):
+                        acumulado[j] = acumulado.get(j, 0.0) + a_ik * b_kj
+                filas.append(sorted(acumulado.items()))
+            return SparseMatrix._from_rows((self._shape[0], other._shape[1]), filas)
+
+        elif isinstance(other, Matrix):
+            if self._shape[1] != other.num_rows:
+                raise ValueError("Error de multiplicación")
+            columnas = other.num_columns
+            resultado = array('d')
+            for i in range(self._shape[0]):
+                fila = [0.0] * columnas
+                for k, a_ik in self._row(i):
+                    fila = list(map(operator.add, fila,
+                                    map(operator.mul, other.row_view(k), [a_ik] * columnas)))
+                resultado.extend(fila)
+            return Matrix._from_buffer(resultado, self._shape[0], columnas)
+
+        return NotImplemented
+
+    def __rmul__(self, other: Union[Matrix, int, float]) -> Union['SparseMatrix', Matrix]:
+        """Multiplicación con el escalar o la matriz densa a la izquierda."""
+        if isinstance(other, (int, float)):
+            return self * other
+        elif isinstance(other, Matrix):
+            # (M·S) = (Sᵀ·Mᵀ)ᵀ reutiliza el producto disperso x denso
+            return (self.T * other.T).T
+        return NotImplemented
+
+
+def _group_rows(num_rows: int, entries: Dict[Tuple[int, int], float]) -> List[List[Tuple[int, float]]]:
+    """Agrupa un diccionario {(i, j): valor} en filas ordenadas por columna."""
+    filas: List[List[Tuple[int, float]]] = [[] for _ in range(num_rows)]
+    for (i, j), v in sorted(entries.items()):
+        filas[i].append((j, v))
+    return filas
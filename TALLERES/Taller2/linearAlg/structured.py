@@ -0,0 +1,623 @@
+"""
+Matrices con estructura
+=======================
+
+Matrices cuadradas que guardan solo la parte que no es redundante:
+
+- ``SymmetricMatrix``: la mitad triangular inferior empaquetada, n(n+1)/2
+  elementos. ``cholesky()`` factoriza las definidas positivas.
+- ``LowerTriangular`` y ``UpperTriangular``: la mitad no nula empaquetada;
+  los sistemas se resuelven por sustitución en O(n²).
+- ``DiagonalMatrix``: solo la diagonal; producto, inversa y sistemas en O(n).
+
+La mitad empaquetada se guarda por filas en un ``array('d')``: la fila i
+ocupa un tramo contiguo, así que los productos recorren solo los elementos
+guardados. Como ``SparseMatrix``, estas clases se mezclan con ``Matrix`` y
+``Vector`` en los operadores y en las funciones del módulo.
+``Matrix.detect_structure()`` elige la clase adecuada para una matriz densa.
+"""
+
+import math
+import operator
+from array import array
+from itertools import repeat
+from typing import List, Sequence, Tuple, Union
+
+from .linAlg import Vector, Matrix, lu_decomposition
+
+
+class StructuredMatrix:
+    """
+    Base de las matrices cuadradas con almacenamiento compacto.
+
+    Cada subclase define cómo empaquetar una matriz densa (``_pack``), dónde
+    vive cada elemento (``_position``) y qué tramo de cada fila guarda
+    (``_row``); el resto de operaciones se construyen sobre eso.
+    """
+
+    _kind = "estructurada"
+
+    def __init__(self, data: List[List[Union[int, float]]]):
+        """
+        Inicializa la matriz a partir de la lista de filas completa.
+
+        Args:
+            data: Lista de listas (cuadrada) con la estructura de la clase
+        """
+        self._init_from(Matrix(data))
+
+    def _init_from(self, matrix: Matrix):
+        """Valida la estructura de una matriz densa y guarda su parte empaquetada."""
+        if not matrix.is_square():
+            raise ValueError("La matriz no es cuadrada")
+        if not self._accepts(matrix):
+            raise ValueError(f"La matriz no es {self._kind}")
+        self._n = matrix.num_rows
+        self._data = self._pack(matrix)
+
+    @classmethod
+    def from_matrix(cls, matrix: Matrix) -> 'StructuredMatrix':
+        """
+        Convierte una matriz densa, validando que tenga la estructura de la clase.
+
+        Args:
+            matrix: La matriz densa cuadrada
+
+        Returns:
+            Una nueva matriz con almacenamiento compacto
+        """
+        resultado = cls.__new__(cls)
+        resultado._init_from(matrix)
+        return resultado
+
+    @classmethod
+    def _from_packed(cls, n: int, buffer: array) -> 'StructuredMatrix':
+        """Crea una matriz a partir de su buffer empaquetado (sin copiarlo)."""
+        resultado = cls.__new__(cls)
+        resultado._n = n
+        resultado._data = buffer
+        return resultado
+
+    @classmethod
+    def _from_dense(cls, matrix: Matrix) -> 'StructuredMatrix':
+        """Empaqueta una matriz densa sin validar la parte descartada."""
+        return cls._from_packed(matrix.num_rows, cls._pack(matrix))
+
+    @staticmethod
+    def _accepts(matrix: Matrix) -> bool:
+        raise NotImplementedError
+
+    @staticmethod
+    def _pack(matrix: Matrix) -> array:
+        raise NotImplementedError
+
+    def _position(self, i: int, j: int) -> Union[int, None]:
+        """Posición del elemento (i, j) en el buffer, o None si es un cero estructural."""
+        raise NotImplementedError
+
+    def _row(self, i: int) -> Tuple[int, Sequence[float]]:
+        """Primera columna y valores del tramo guardado de la fila i."""
+        raise NotImplementedError
+
+    def _solve_list(self, b: List[float]) -> List[float]:
+        """Resuelve A·x = b para un lado derecho dado como lista."""
+        raise NotImplementedError
+
+    def to_matrix(self) -> Matrix:
+        """Convierte la matriz en una ``Matrix`` densa."""
+        n = self._n
+        buffer = array('d', bytes(8 * n * n))
+        for i in range(n):
+            inicio, valores = self._row(i)
+            buffer[i * n + inicio:i * n + inicio + len(valores)] = array('d', valores)
+        return Matrix._from_buffer(buffer, n, n)
+
+    def __str__(self) -> str:
+        """Representación en string de la matriz."""
+        return f"Matriz {self._kind} {self._n}x{self._n}"
+
+    def __repr__(self) -> str:
+        """Representación detallada de la matriz."""
+        return f"{type(self).__name__}({self.to_matrix().values})"
+
+    def __getitem__(self, key: Tuple[int, int]) -> float:
+        """Permite acceder a un elemento (i, j); los ceros estructurales valen 0."""
+        if not (isinstance(key, tuple) and len(key) == 2):
+            raise TypeError("El índice debe ser una tupla (i, j)")
+        i, j = key
+        n = self._n
+        if i < 0:
+            i += n
+        if j < 0:
+            j += n
+        if not (0 <= i < n and 0 <= j < n):
+            raise IndexError("Índice fuera del rango de la matriz")
+        posicion = self._position(i, j)
+        return 0.0 if posicion is None else self._data[posicion]
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """Retorna las dimensiones de la matriz como (filas, columnas)."""
+        return (self._n, self._n)
+
+    @property
+    def num_rows(self) -> int:
+        """Retorna el número de filas de la matriz."""
+        return self._n
+
+    @property
+    def num_columns(self) -> int:
+        """Retorna el número de columnas de la matriz."""
+        return self._n
+
+    @property
+    def diagonal(self) -> List[float]:
+        """Retorna los elementos de la diagonal."""
+        return [self._data[self._position(i, i)] for i in range(self._n)]
+
+    @property
+    def trace(self) -> float:
+        """Calcula y retorna la traza de la matriz en O(n)."""
+        return sum(self.diagonal)
+
+    def is_square(self) -> bool:
+        """Verifica si la matriz es cuadrada (siempre lo es)."""
+        return True
+
+    def __eq__(self, other) -> bool:
+        """Igualdad con otra matriz estructurada o densa."""
+        if type(other) is type(self):
+            return self._n == other._n and self._data == other._data
+        if isinstance(other, (StructuredMatrix, Matrix)):
+            return self.to_matrix() == (other if isinstance(other, Matrix) else other.to_matrix())
+        return NotImplemented
+
+    def __ne__(self, other) -> bool:
+        """Desigualdad con otra matriz estructurada o densa."""
+        resultado = self.__eq__(other)
+        return resultado if resultado is NotImplemented else not resultado
+
+    def __add__(self, other: Union['StructuredMatrix', Matrix]) -> Union['StructuredMatrix', Matrix]:
+        """Suma: conserva la estructura si ambas matrices son de la misma clase."""
+        if type(other) is type(self):
+            if self._n != other._n:
+                raise ValueError("Las matrices no tienen la misma dimensión")
+            return self._from_packed(self._n, array('d', map(operator.add, self._data, other._data)))
+        if isinstance(other, StructuredMatrix):
+            return self.to_matrix() + other.to_matrix()
+        if isinstance(other, Matrix):
+            return self.to_matrix() + other
+        return NotImplemented
+
+    def __radd__(self, other: Matrix) -> Matrix:
+        """Suma con la matriz densa a la izquierda."""
+        return self + other
+
+    def __sub__(self, other: Union['StructuredMatrix', Matrix]) -> Union['StructuredMatrix', Matrix]:
+        """Resta de matrices usando el operador -."""
+        if isinstance(other, (StructuredMatrix, Matrix)):
+            return self + other * -1
+        return NotImplemented
+
+    def __rsub__(self, other: Matrix) -> Matrix:
+        """Resta con la matriz densa a la izquierda."""
+        return self * -1 + other
+
+    def __mul__(self, other: Union['StructuredMatrix', Matrix, Vector, int, float]
+                ) -> Union['StructuredMatrix', Matrix, Vector]:
+        """Multiplicación por escalar, vector o matriz recorriendo solo los tramos guardados."""
+        if isinstance(other, (int, float)):
+            return self._from_packed(self._n, array('d', map(operator.mul, self._data, repeat(other))))
+
+        elif isinstance(other, Vector):
+            if self._n != len(other._data):
+                raise ValueError("Error de multiplicación")
+            x = other._data
+            componentes = []
+            for i in range(self._n):
+                inicio, valores = self._row(i)
+                componentes.append(sum(map(operator.mul, valores, x[inicio:inicio + len(valores)])))
+            return Vector(componentes)
+
+        elif isinstance(other, (StructuredMatrix, Matrix)):
+            if self._n != other.num_rows:
+                raise ValueError("Error de multiplicación")
+            if isinstance(other, StructuredMatrix):
+                other = other.to_matrix()
+            columnas = [other.column_view(j).tolist() for j in range(other.num_columns)]
+            resultado = array('d')
+            for i in range(self._n):
+                inicio, valores = self._row(i)
+                fin = inicio + len(valores)
+                resultado.extend([sum(map(operator.mul, valores, columna[inicio:fin]))
+                                  for columna in columnas])
+            return Matrix._from_buffer(resultado, self._n, len(columnas))
+
+        return NotImplemented
+
+    def __rmul__(self, other: Union[Matrix, int, float]) -> Union['StructuredMatrix', Matrix]:
+        """Multiplicación con el escalar o la matriz densa a la izquierda."""
+        if isinstance(other, (int, float)):
+            return self * other
+        elif isinstance(other, Matrix):
+            # M·A = (Aᵀ·Mᵀ)ᵀ reutiliza el producto por tramos
+            return (self.T * other.T).T
+        return NotImplemented
+
+    def transpose(self) -> 'StructuredMatrix':
+        """Retorna la transpuesta de la matriz (equivale a ``T``)."""
+        return self.T
+
+    @property
+    def determinant(self) -> float:
+        """Calcula el determinante (producto de la diagonal en las triangulares)."""
+        det = 1.0
+        for valor in self.diagonal:
+            det *= valor
+        return det
+
+    def solve(self, b: Union[Vector, Matrix]) -> Union[Vector, Matrix]:
+        """
+        Resuelve el sistema A·x = b aprovechando la estructura.
+
+        Args:
+            b: Vector lado derecho, o matriz cuyas columnas son varios lados derechos
+
+        Returns:
+            Un vector (o matriz) con la solución
+        """
+        if isinstance(b, Vector):
+            if len(b._data) != self._n:
+                raise ValueError("Las dimensiones del sistema no coinciden")
+            return Vector(self._solve_list(b.values))
+
+        elif isinstance(b, Matrix):
+            if b.num_rows != self._n:
+                raise ValueError("Las dimensiones del sistema no coinciden")
+            columnas = [self._solve_list(b.column_view(j).tolist()) for j in range(b.num_columns)]
+            resultado = array('d')
+            for i in range(self._n):
+                resultado.extend([columna[i] for columna in columnas])
+            return Matrix._from_buffer(resultado, self._n, b.num_columns)
+
+        else:
+            raise TypeError("El lado derecho debe ser un Vector o una Matrix")
+
+    def _check_invertible(self):
+        """Lanza ValueError si algún elemento de la diagonal es cero."""
+        if not all(self.diagonal):
+            raise ValueError("La matriz es singular, el sistema no tiene solución única")
+
+    @property
+    def inverse(self) -> 'StructuredMatrix':
+        """Calcula la inversa, que conserva la estructura de la matriz."""
+        n = self._n
+        identidad = Matrix._from_buffer(
+            array('d', [1.0 if i == j else 0.0 for i in range(n) for j in range(n)]), n, n)
+        try:
+            return self._from_dense(self.solve(identidad))
+        except ValueError:
+            raise ValueError("La matriz no tiene inversa") from None
+
+
+class LowerTriangular(StructuredMatrix):
+    """
+    Matriz triangular inferior: guarda las n(n+1)/2 entradas con j <= i.
+
+    La fila i ocupa las posiciones i(i+1)/2 a i(i+1)/2 + i del buffer.
+    """
+
+    _kind = "triangular inferior"
+
+    @staticmethod
+    def _accepts(matrix: Matrix) -> bool:
+        return matrix.is_lower_triangular()
+
+    @staticmethod
+    def _pack(matrix: Matrix) -> array:
+        buffer = array('d')
+        for i in range(matrix.num_rows):
+            buffer.extend(matrix.row_view(i)[:i + 1])
+        return buffer
+
+    def _position(self, i: int, j: int) -> Union[int, None]:
+        return i * (i + 1) // 2 + j if j <= i else None
+
+    def _row(self, i: int) -> Tuple[int, Sequence[float]]:
+        base = i * (i + 1) // 2
+        return 0, self._data[base:base + i + 1]
+
+    @property
+    def T(self) -> 'UpperTriangular':
+        """Retorna la transpuesta (triangular superior)."""
+        n = self._n
+        buffer = array('d')
+        for j in range(n):
+            buffer.extend(self._data[k * (k + 1) // 2 + j] for k in range(j, n))
+        return UpperTriangular._from_packed(n, buffer)
+
+    def _solve_list(self, b: List[float]) -> List[float]:
+        """Sustitución hacia adelante en O(n²)."""
+        self._check_invertible()
+        datos = self._data
+        x = [0.0] * self._n
+        for i in range(self._n):
+            base = i * (i + 1) // 2
+            suma = sum(map(operator.mul, datos[base:base + i], x[:i]))
+            x[i] = (b[i] - suma) / datos[base + i]
+        return x
+
+
+class UpperTriangular(StructuredMatrix):
+    """
+    Matriz triangular superior: guarda las n(n+1)/2 entradas con j >= i.
+
+    La fila i ocupa las posiciones i·n - i(i-1)/2 a i·n - i(i-1)/2 + (n - i) - 1.
+    """
+
+    _kind = "triangular superior"
+
+    @staticmethod
+    def _accepts(matrix: Matrix) -> bool:
+        return matrix.is_upper_triangular()
+
+    @staticmethod
+    def _pack(matrix: Matrix) -> array:
+        buffer = array('d')
+        for i in range(matrix.num_rows):
+            buffer.extend(matrix.row_view(i)[i:])
+        return buffer
+
+    def _base(self, i: int) -> int:
+        """Posición del elemento diagonal (i, i) en el buffer."""
+        return i * self._n - i * (i - 1) // 2
+
+    def _position(self, i: int, j: int) -> Union[int, None]:
+        return self._base(i) + j - i if j >= i else None
+
+    def _row(self, i: int) -> Tuple[int, Sequence[float]]:
+        base = self._base(i)
+        return i, self._data[base:base + self._n - i]
+
+    @property
+    def T(self) -> LowerTriangular:
+        """Retorna la transpuesta (triangular inferior)."""
+        buffer = array('d')
+        for i in range(self._n):
+            buffer.extend(self._data[self._base(k) + i - k] for k in range(i + 1))
+        return LowerTriangular._from_packed(self._n, buffer)
+
+    def _solve_list(self, b: List[float]) -> List[float]:
+        """Sustitución hacia atrás en O(n²)."""
+        self._check_invertible()
+        n = self._n
+        datos = self._data
+        x = [0.0] * n
+        for i in range(n - 1, -1, -1):
+            base = self._base(i)
+            suma = sum(map(operator.mul, datos[base + 1:base + n - i], x[i + 1:]))
+            x[i] = (b[i] - suma) / datos[base]
+        return x
+
+
+class DiagonalMatrix(StructuredMatrix):
+    """
+    Matriz diagonal: guarda solo los n elementos de la diagonal.
+    """
+
+    _kind = "diagonal"
+
+    def __init__(self, diagonal: List[Union[int, float]]):
+        """
+        Inicializa la matriz a partir de su diagonal.
+
+        Args:
+            diagonal: Lista con los elementos de la diagonal
+        """
+        self._n = len(diagonal)
+        self._data = array('d', diagonal)
+
+    @staticmethod
+    def _accepts(matrix: Matrix) -> bool:
+        return matrix.is_diagonal()
+
+    @staticmethod
+    def _pack(matrix: Matrix) -> array:
+        return array('d', matrix._data[::matrix.num_columns + 1])
+
+    def _position(self, i: int, j: int) -> Union[int, None]:
+        return i if i == j else None
+
+    def _row(self, i: int) -> Tuple[int, Sequence[float]]:
+        return i, self._data[i:i + 1]
+
+    @property
+    def diagonal(self) -> List[float]:
+        """Retorna los elementos de la diagonal."""
+        return self._data.tolist()
+
+    @property
+    def T(self) -> 'DiagonalMatrix':
+        """Una matriz diagonal es su propia transpuesta."""
+        return self
+
+    def __mul__(self, other: Union[StructuredMatrix, Matrix, Vector, int, float]
+                ) -> Union[StructuredMatrix, Matrix, Vector]:
+        """Multiplicación en O(n) por vector o diagonal; por matriz escala sus filas."""
+        if isinstance(other, Vector):
+            if self._n != len(other._data):
+                raise ValueError("Error de multiplicación")
+            return Vector(list(map(operator.mul, self._data, other._data)))
+        elif isinstance(other, DiagonalMatrix):
+            if self._n != other._n:
+                raise ValueError("Error de multiplicación")
+            return DiagonalMatrix._from_packed(self._n, array('d', map(operator.mul, self._data, other._data)))
+        elif isinstance(other, Matrix):
+            if self._n != other.num_rows:
+                raise ValueError("Error de multiplicación")
+            resultado = array('d')
+            for i, d in enumerate(self._data):
+                resultado.extend(map(operator.mul, other.row_view(i), repeat(d)))
+            return Matrix._from_buffer(resultado, self._n, other.num_columns)
+        return super().__mul__(other)
+
+    def _solve_list(self, b: List[float]) -> List[float]:
+        """Divide cada componente por su elemento diagonal en O(n)."""
+        self._check_invertible()
+        return list(map(operator.truediv, b, self._data))
+
+    @property
+    def inverse(self) -> 'DiagonalMatrix':
+        """Calcula la inversa en O(n)."""
+        if not all(self._data):
+            raise ValueError("La matriz no tiene inversa")
+        return DiagonalMatrix._from_packed(self._n, array('d', [1 / d for d in self._data]))
+
+
+class SymmetricMatrix(StructuredMatrix):
+    """
+    Matriz simétrica: guarda la mitad triangular inferior (n(n+1)/2 entradas).
+
+    Si es definida positiva (como las matrices XᵀX de una regresión), los
+    sistemas, el determinante y la inversa usan la factorización de
+    Cholesky A = L·Lᵀ, que cuesta la mitad que LU.
+    """
+
+    _kind = "simétrica"
+
+    @staticmethod
+    def _accepts(matrix: Matrix) -> bool:
+        return matrix.is_symmetric()
+
+    _pack = staticmethod(LowerTriangular._pack)
+
+    def _position(self, i: int, j: int) -> int:
+        if j > i:
+            i, j = j, i
+        return i * (i + 1) // 2 + j
+
+    def _row(self, i: int) -> Tuple[int, Sequence[float]]:
+        base = i * (i + 1) // 2
+        fila = self._data[base:base + i + 1].tolist()
+        fila.extend(self._data[k * (k + 1) // 2 + i] for k in range(i + 1, self._n))
+        return 0, fila
+
+    @property
+    def T(self) -> 'SymmetricMatrix':
+        """Una matriz simétrica es su propia transpuesta."""
+        return self
+
+    def cholesky(self) -> LowerTriangular:
+        """
+        Calcula la factorización de Cholesky A = L·Lᵀ.
+
+        El resultado (o el hecho de que la matriz no es definida positiva)
+        se memoriza: estas matrices no se modifican después de creadas.
+
+        Returns:
+            El factor triangular inferior L
+
+        Raises:
+            ValueError: Si la matriz no es definida positiva
+        """
+        L = getattr(self, "_cholesky", None)
+        if L is None:
+            try:
+                L = self._factor_cholesky()
+            except ValueError:
+                L = False
+            self._cholesky = L
+        if L is False:
+            raise ValueError("La matriz no es definida positiva")
+        return L
+
+    def _factor_cholesky(self) -> LowerTriangular:
+        """Factoriza con Cholesky; lanza ValueError si la matriz no es definida positiva."""
+        n = self._n
+        datos = self._data
+        L = array('d', bytes(8 * len(datos)))
+        for i in range(n):
+            base_i = i * (i + 1) // 2
+            for j in range(i + 1):
+                base_j = j * (j + 1) // 2
+                suma = datos[base_i + j] - sum(map(operator.mul, L[base_i:base_i + j], L[base_j:base_j + j]))
+                if i == j:
+                    if suma <= 0:
+                        raise ValueError("La matriz no es definida positiva")
+                    L[base_i + i] = math.sqrt(suma)
+                else:
+                    L[base_i + j] = suma / L[base_j + j]
+        return LowerTriangular._from_packed(n, L)
+
+    def _lu(self):
+        """Factorización LU memorizada, para las matrices que no son definidas positivas."""
+        lu = getattr(self, "_lu_factor", None)
+        if lu is None:
+            lu = self._lu_factor = lu_decomposition(self.to_matrix())
+        return lu
+
+    def is_positive_definite(self) -> bool:
+        """Verifica si la matriz es definida positiva (intenta factorizar con Cholesky)."""
+        try:
+            self.cholesky()
+        except ValueError:
+            return False
+        return True
+
+    def solve(self, b: Union[Vector, Matrix]) -> Union[Vector, Matrix]:
+        """
+        Resuelve el sistema A·x = b (Cholesky si es definida positiva, LU si no).
+
+        La factorización se calcula en la primera llamada y se reutiliza en
+        las siguientes.
+
+        Args:
+            b: Vector lado derecho, o matriz cuyas columnas son varios lados derechos
+
+        Returns:
+            Un vector (o matriz) con la solución
+        """
+        try:
+            L = self.cholesky()
+        except ValueError:
+            return self._lu().solve(b)
+        return L.T.solve(L.solve(b))
+
+    @property
+    def determinant(self) -> float:
+        """Calcula el determinante con Cholesky (producto de la diagonal de L al cuadrado) o con LU."""
+        try:
+            L = self.cholesky()
+        except ValueError:
+            return self._lu().determinant
+        det = 1.0
+        for valor in L.diagonal:
+            det *= valor * valor
+        return det
+
+
+def detect_structure(matrix: Matrix) -> Union[StructuredMatrix, Matrix]:
+    """
+    Detecta la estructura de una matriz densa y la convierte a la clase compacta.
+
+    Se prueba en orden: diagonal, triangular inferior, triangular superior
+    y simétrica.
+
+    Args:
+        matrix: La matriz densa
+
+    Returns:
+        La matriz con almacenamiento compacto, o la misma matriz si no
+        tiene ninguna estructura (o no es cuadrada)
+    """
+    if not matrix.is_square() or matrix.num_rows == 0:
+        return matrix
+    if matrix.is_diagonal():
+        return DiagonalMatrix._from_dense(matrix)
+    if matrix.is_lower_triangular():
+        return LowerTriangular._from_dense(matrix)
+    if matrix.is_upper_triangular():
+        return UpperTriangular._from_dense(matrix)
+    if matrix.is_symmetric():
+        return SymmetricMatrix._from_dense(matrix)
+    return matrix
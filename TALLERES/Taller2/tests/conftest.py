@@ -0,0 +1,27 @@
+"""
+Configuración común de las pruebas
+==================================
+
+Agrega al ``sys.path`` la carpeta de ``linearAlg`` y la de
+``Concurrencia`` (scripts planos que se importan entre sí) para poder
+ejecutar ``python -m pytest tests`` desde ``TALLERES/Taller2``.
+"""
+import os
+import sys
+
+import pytest
+
+TALLER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for carpeta in (TALLER, os.path.join(TALLER, "Concurrencia")):
+    if carpeta not in sys.path:
+        sys.path.insert(0, carpeta)
+
+
+@pytest.fixture
+def motor_python():
+    """Ejecuta la prueba con el motor Python y restaura el motor anterior."""
+    from linearAlg import get_backend, set_backend
+    anterior = get_backend()
+    set_backend("python")
+    yield
+    set_backend(anterior)
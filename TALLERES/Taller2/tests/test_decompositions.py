@@ -0,0 +1,46 @@
+"""Pruebas de ``condition_number``."""
+import math
+import random
+
+import pytest
+
+from linearAlg import Matrix
+from linearAlg import decompositions
+from linearAlg.decompositions import condition_number
+
+
+def aleatoria(filas, columnas, semilla):
+    generador = random.Random(semilla)
+    return Matrix([[generador.uniform(-1, 1) for _ in range(columnas)] for _ in range(filas)])
+
+
+@pytest.mark.parametrize("forma", [(30, 30), (60, 12), (12, 60)])
+def test_lanczos_coincide_con_svd(forma):
+    matriz = aleatoria(*forma, semilla=1)
+    exacto = condition_number(matriz, method="svd")
+    estimado = condition_number(matriz, method="lanczos")
+    assert estimado <= exacto * (1 + 1e-8)
+    assert estimado == pytest.approx(exacto, rel=1e-6)
+
+
+def test_rectangular_sin_qr(monkeypatch):
+    def prohibida(*args, **kwargs):
+        raise AssertionError("condition_number no debe usar la QR")
+
+    monkeypatch.setattr(decompositions, "qr_decomposition", prohibida)
+    matriz = aleatoria(40, 8, semilla=2)
+    assert condition_number(matriz, method="lanczos") == pytest.approx(
+        condition_number(matriz, method="svd"), rel=1e-6)
+
+
+def test_columnas_colineales():
+    base = aleatoria(20, 3, semilla=3).values
+    columnas_repetidas = Matrix([fila + [fila[0]] for fila in base])
+    assert condition_number(columnas_repetidas, method="lanczos") == math.inf
+    singular = Matrix([[1.0, 2.0], [2.0, 4.0]])
+    assert condition_number(singular, method="lanczos") == math.inf
+
+
+def test_metodo_desconocido():
+    with pytest.raises(ValueError):
+        condition_number(aleatoria(3, 3, semilla=4), method="otro")
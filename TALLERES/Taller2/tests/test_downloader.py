@@ -0,0 +1,78 @@
+"""Pruebas de los destinos de descarga y de la reanudación con ``Range``."""
+import hashlib
+import os
+
+import pytest
+
+from downloader import StreamWriter, _content_range, _targets
+
+
+def test_content_range():
+    assert _content_range("bytes 100-199/200") == (100, 200)
+    assert _content_range("bytes */300") == (None, 300)
+    assert _content_range("bytes 0-9/*") == (0, None)
+    assert _content_range("items 0-9/10") == (None, None)
+    assert _content_range(None) == (None, None)
+
+
+def test_destinos_sin_colision(tmp_path):
+    destinos = _targets(["http://a.test/x/datos.csv", "http://a.test/y/otro.csv"], str(tmp_path))
+    assert [os.path.basename(ruta) for _, ruta in destinos] == ["datos.csv", "otro.csv"]
+
+
+def test_destinos_que_solo_difieren_en_la_consulta(tmp_path):
+    urls = ["http://a.test/datos.csv?pagina=1", "http://a.test/datos.csv?pagina=2",
+            "http://b.test/datos.csv"]
+    nombres = [os.path.basename(ruta) for _, ruta in _targets(urls, str(tmp_path))]
+    assert len(set(nombres)) == 3
+    assert all(nombre.startswith("datos-") and nombre.endswith(".csv") for nombre in nombres)
+    # El nombre no depende del orden de la lista (para poder reanudar)
+    invertidos = [os.path.basename(ruta) for _, ruta in _targets(urls[::-1], str(tmp_path))]
+    assert invertidos == nombres[::-1]
+
+
+def test_destinos_repetidos(tmp_path):
+    with pytest.raises(ValueError):
+        _targets(["http://a.test/x", "http://a.test/x"], str(tmp_path))
+    with pytest.raises(ValueError):
+        _targets({"a.txt": "http://a.test/1", "./a.txt": "http://a.test/2"}, str(tmp_path))
+
+
+def preparar_parcial(tmp_path, contenido):
+    ruta = str(tmp_path / "archivo.bin")
+    with open(ruta + ".part", "wb") as archivo:
+        archivo.write(contenido)
+    return ruta
+
+
+def test_reanuda_con_rango_correcto(tmp_path):
+    ruta = preparar_parcial(tmp_path, b"abcd")
+    escritor = StreamWriter("http://a.test/archivo.bin", ruta)
+    assert escritor.request_headers()["Range"] == "bytes=4-"
+    assert escritor.start(206, {"Content-Range": "bytes 4-7/8"})
+    escritor.write(b"efgh")
+    resultado = escritor.finish(206, 0.0)
+    assert resultado.size == 8 and resultado.checksum == hashlib.sha256(b"abcdefgh").hexdigest()
+    with open(ruta, "rb") as archivo:
+        assert archivo.read() == b"abcdefgh"
+
+
+def test_descarta_parcial_con_rango_distinto(tmp_path):
+    ruta = preparar_parcial(tmp_path, b"abcd")
+    escritor = StreamWriter("http://a.test/archivo.bin", ruta)
+    assert not escritor.start(206, {"Content-Range": "bytes 0-7/8"})
+    assert escritor.restart
+    assert not os.path.exists(ruta + ".part")
+
+
+def test_416_solo_si_el_parcial_esta_completo(tmp_path):
+    ruta = preparar_parcial(tmp_path, b"abcd")
+    escritor = StreamWriter("http://a.test/archivo.bin", ruta)
+    assert not escritor.start(416, {"Content-Range": "bytes */4"})
+    assert not escritor.restart
+    assert escritor.finish(416, 0.0).size == 4
+
+    ruta = preparar_parcial(tmp_path, b"abcd")
+    escritor = StreamWriter("http://a.test/archivo.bin", ruta)
+    assert not escritor.start(416, {"Content-Range": "bytes */2"})
+    assert escritor.restart
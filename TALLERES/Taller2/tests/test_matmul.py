@@ -0,0 +1,55 @@
+"""Pruebas del kernel de multiplicación de matrices."""
+import random
+
+import pytest
+
+from linearAlg import Matrix, matrix_multiply
+from linearAlg.linAlg import _matmul_kernel
+
+
+def aleatoria(filas, columnas, semilla):
+    generador = random.Random(semilla)
+    return Matrix([[generador.uniform(-1, 1) for _ in range(columnas)] for _ in range(filas)])
+
+
+def producto_clasico(m1, m2):
+    a, b = m1.values, m2.values
+    return [[sum(a[i][k] * b[k][j] for k in range(len(b))) for j in range(len(b[0]))]
+            for i in range(len(a))]
+
+
+def error_maximo(obtenido, esperado):
+    return max(abs(x - y) for fo, fe in zip(obtenido, esperado) for x, y in zip(fo, fe))
+
+
+@pytest.mark.parametrize("forma", [(1, 1, 1), (3, 5, 2), (17, 9, 31), (40, 40, 40)])
+def test_kernel_coincide_con_bucle_clasico(motor_python, forma):
+    filas, interna, columnas = forma
+    m1, m2 = aleatoria(filas, interna, 1), aleatoria(interna, columnas, 2)
+    obtenido = matrix_multiply(m1, m2, strassen=False)
+    assert obtenido.shape == (filas, columnas)
+    assert error_maximo(obtenido.values, producto_clasico(m1, m2)) < 1e-12
+
+
+def test_kernel_con_enteros_es_exacto(motor_python):
+    m1 = Matrix([[1, 2, 3], [4, 5, 6]])
+    m2 = Matrix([[7, 8], [9, 10], [11, 12]])
+    producto = matrix_multiply(m1, m2, strassen=False).values
+    assert producto == [[58, 64], [139, 154]]
+    assert all(isinstance(x, int) for fila in producto for x in fila)
+
+
+def test_kernel_escribe_sobre_un_operando(motor_python):
+    m1, m2 = aleatoria(6, 6, 3), aleatoria(6, 6, 4)
+    esperado = producto_clasico(m1, m2)
+    resultado = _matmul_kernel(m1._data, m2._data, 6, 6, 6, out=m1._data)
+    assert resultado is m1._data
+    m1._touch()
+    assert error_maximo(m1.values, esperado) < 1e-12
+
+
+def test_out_no_crea_otra_matriz(motor_python):
+    m1, m2 = aleatoria(5, 4, 5), aleatoria(4, 3, 6)
+    destino = Matrix([[0.0] * 3 for _ in range(5)])
+    assert matrix_multiply(m1, m2, out=destino) is destino
+    assert error_maximo(destino.values, producto_clasico(m1, m2)) < 1e-12
@@ -0,0 +1,88 @@
+"""Pruebas de los parámetros ``out=`` y de los operadores en el lugar."""
+import random
+
+import pytest
+
+from linearAlg import Matrix, Vector, add, scale, subtract, vector_multiply
+from linearAlg import linAlg
+
+
+def aleatoria(filas, columnas, semilla):
+    generador = random.Random(semilla)
+    return Matrix([[generador.uniform(-1, 1) for _ in range(columnas)] for _ in range(filas)])
+
+
+@pytest.fixture(params=[linAlg.INPLACE_CHUNK, 7], ids=["bloque normal", "bloque de 7"])
+def bloque(request, monkeypatch):
+    """Repite la prueba con bloques pequeños para cruzar varios límites de bloque."""
+    monkeypatch.setattr(linAlg, "INPLACE_CHUNK", request.param)
+
+
+def copia(matriz):
+    return Matrix(matriz.values)
+
+
+@pytest.mark.parametrize("funcion", [add, subtract])
+def test_out_aparte(motor_python, bloque, funcion):
+    a, b = aleatoria(9, 11, 1), aleatoria(9, 11, 2)
+    esperado = funcion(a, b).values
+    destino = Matrix([[0.0] * 11 for _ in range(9)])
+    assert funcion(a, b, out=destino) is destino
+    assert destino.values == esperado
+
+
+@pytest.mark.parametrize("funcion", [add, subtract])
+@pytest.mark.parametrize("alias", ["primero", "segundo", "ambos"])
+def test_out_igual_a_un_operando(motor_python, bloque, funcion, alias):
+    a, b = aleatoria(9, 11, 3), aleatoria(9, 11, 4)
+    if alias == "ambos":
+        b = a
+    esperado = funcion(copia(a), copia(b)).values
+    destino = b if alias == "segundo" else a
+    assert funcion(a, b, out=destino) is destino
+    assert destino.values == esperado
+
+
+def test_scale_en_si_misma(motor_python, bloque):
+    a = aleatoria(9, 11, 5)
+    esperado = scale(copia(a), 2.5).values
+    assert scale(a, 2.5, out=a) is a
+    assert a.values == esperado
+
+
+def test_out_conserva_enteros(motor_python):
+    a = Matrix([[1, 2], [3, 4]])
+    destino = Matrix([[0.5, 0.5], [0.5, 0.5]])
+    add(a, a, out=destino)
+    assert destino.values == [[2, 4], [6, 8]]
+    assert all(isinstance(x, int) for fila in destino.values for x in fila)
+    scale(a, 0.5, out=destino)
+    assert destino.values == [[0.5, 1.0], [1.5, 2.0]]
+    assert isinstance(destino.values[0][1], float)
+
+
+def test_vector_multiply_sobre_el_mismo_vector(motor_python, bloque):
+    matriz = aleatoria(12, 12, 6)
+    vector = Vector([float(i) for i in range(12)])
+    esperado = list((matriz * Vector(list(vector._data)))._data)
+    assert vector_multiply(matriz, vector, out=vector) is vector
+    assert list(vector._data) == pytest.approx(esperado)
+
+
+def test_out_con_forma_incorrecta(motor_python):
+    with pytest.raises(ValueError):
+        add(aleatoria(2, 2, 1), aleatoria(2, 2, 2), out=aleatoria(2, 3, 3))
+    with pytest.raises(ValueError):
+        vector_multiply(aleatoria(2, 3, 1), Vector([1.0, 2.0, 3.0]), out=Vector([0.0] * 3))
+
+
+def test_operadores_en_el_lugar(motor_python, bloque):
+    a, b = aleatoria(9, 11, 7), aleatoria(9, 11, 8)
+    original = a
+    esperado = ((copia(a) + b) * 3 - b).values
+    a += b
+    a *= 3
+    a -= b
+    assert a is original
+    for fila, fila_esperada in zip(a.values, esperado):
+        assert fila == pytest.approx(fila_esperada)
@@ -0,0 +1,197 @@
+"""Pruebas de los reintentos, el plazo total y los cortacircuitos."""
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from downloader import FetchResult
+from policies import (CIRCUIT_OPEN, TIMEOUT, CircuitBreaker, DeadlineExceeded, Policy,
+                      time_left)
+
+
+def test_cortacircuitos_cerrado_abierto_semiabierto():
+    cortacircuitos = CircuitBreaker(threshold=2, reset=0.0)
+    assert cortacircuitos.allow()
+    cortacircuitos.record_failure()
+    assert cortacircuitos.state == CircuitBreaker.CLOSED
+    cortacircuitos.record_failure()
+    assert cortacircuitos.state == CircuitBreaker.OPEN
+    # Con reset=0 el siguiente intento es la prueba semiabierta, y solo una
+    assert cortacircuitos.allow()
+    assert cortacircuitos.state == CircuitBreaker.HALF_OPEN
+    assert not cortacircuitos.allow()
+    cortacircuitos.record_failure()
+    assert cortacircuitos.state == CircuitBreaker.OPEN
+    assert cortacircuitos.allow()
+    cortacircuitos.record_success()
+    assert cortacircuitos.state == CircuitBreaker.CLOSED and cortacircuitos.failures == 0
+
+
+def test_cortacircuitos_abierto_no_deja_pasar():
+    cortacircuitos = CircuitBreaker(threshold=1, reset=60.0)
+    cortacircuitos.record_failure()
+    assert not cortacircuitos.allow()
+
+
+def test_cortacircuitos_desactivado():
+    cortacircuitos = CircuitBreaker(threshold=0, reset=60.0)
+    for _ in range(10):
+        cortacircuitos.record_failure()
+    assert cortacircuitos.allow()
+
+
+def test_policy_falla_rapido_con_circuito_abierto():
+    politica = Policy(retries=0, breaker_threshold=1, breaker_reset=60.0)
+    url = "http://caido.test/a"
+    politica.run(url, lambda limite: FetchResult(url, error="sin conexión", error_kind="connection"))
+    resultado = politica.run(url, lambda limite: pytest.fail("no debía intentar"))
+    assert resultado.error_kind == CIRCUIT_OPEN
+
+
+def excepcion_en_la_prueba(ejecutar):
+    politica = Policy(retries=0, breaker_threshold=1, breaker_reset=0.0)
+    url = "http://caido.test/a"
+    politica.run(url, lambda limite: FetchResult(url, status=503))
+    cortacircuitos = politica.breakers.get(url)
+    assert cortacircuitos.state == CircuitBreaker.OPEN
+    with pytest.raises(RuntimeError):
+        ejecutar(politica, url)
+    # La prueba semiabierta falló: vuelve a abierto y se puede probar otra vez
+    assert cortacircuitos.state == CircuitBreaker.OPEN
+    assert politica.run(url, lambda limite: FetchResult(url, status=200)).status == 200
+    assert cortacircuitos.state == CircuitBreaker.CLOSED
+
+
+def lanzar(limite=None):
+    raise RuntimeError("error inesperado")
+
+
+def test_excepcion_en_la_prueba_semiabierta():
+    excepcion_en_la_prueba(lambda politica, url: politica.run(url, lanzar))
+
+
+def test_excepcion_en_la_prueba_semiabierta_async():
+    async def intento(limite):
+        lanzar()
+
+    excepcion_en_la_prueba(lambda politica, url: asyncio.run(politica.run_async(url, intento)))
+
+
+def test_reintenta_fallas_transitorias():
+    politica = Policy(retries=2, backoff=0.0, breaker_threshold=0)
+    respuestas = iter([503, 503, 200])
+    url = "http://a.test/x"
+    resultado = politica.run(url, lambda limite: FetchResult(url, status=next(respuestas)))
+    assert resultado.status == 200 and resultado.attempts == 3
+    assert [falla.detail for falla in resultado.failures] == ["HTTP 503", "HTTP 503"]
+
+
+def test_time_left():
+    assert time_left(None) is None
+    assert 0 < time_left(time.monotonic() + 10) <= 10
+    with pytest.raises(DeadlineExceeded):
+        time_left(time.monotonic() - 1)
+
+
+def test_timeouts_no_pasan_del_plazo():
+    politica = Policy(connect_timeout=5, read_timeout=30)
+    assert politica.timeouts(None) == (5, 30)
+    conexion, lectura = politica.timeouts(time.monotonic() + 2)
+    assert conexion <= 2 and lectura <= 2
+
+
+def test_plazo_agotado_no_inicia_intentos():
+    politica = Policy(deadline=0, breaker_threshold=0)
+    url = "http://a.test/x"
+    resultado = politica.run(url, lambda limite: pytest.fail("no debía intentar"))
+    assert resultado.error_kind == TIMEOUT
+
+
+def test_plazo_incluye_intentos_y_esperas():
+    politica = Policy(retries=100, backoff=0.02, max_backoff=0.02, deadline=0.3,
+                      breaker_threshold=0)
+    url = "http://a.test/x"
+    limites = []
+
+    def intento(limite):
+        limites.append(limite)
+        assert limite is not None and time.monotonic() < limite
+        return FetchResult(url, status=503)
+
+    inicio = time.monotonic()
+    resultado = politica.run(url, intento)
+    assert time.monotonic() - inicio < 0.3 + 0.1
+    assert resultado.status == 503 and len(limites) > 1
+    assert len(set(limites)) == 1
+
+
+# -----------------------------------------------------------------------------
+# Plazo total frente a una respuesta que llega byte a byte
+# -----------------------------------------------------------------------------
+
+class _Goteo(BaseHTTPRequestHandler):
+    """Responde un cuerpo de 1000 bytes, uno cada 20 ms."""
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "1000")
+        self.end_headers()
+        try:
+            for _ in range(1000):
+                self.wfile.write(b"x")
+                self.wfile.flush()
+                time.sleep(0.02)
+        except OSError:
+            pass
+
+
+@pytest.fixture
+def servidor_lento():
+    servidor = ThreadingHTTPServer(("127.0.0.1", 0), _Goteo)
+    servidor.daemon_threads = True
+    hilo = threading.Thread(target=servidor.serve_forever, daemon=True)
+    hilo.start()
+    yield f"http://127.0.0.1:{servidor.server_address[1]}/lento"
+    servidor.shutdown()
+    servidor.server_close()
+
+
+POLITICA_CORTA = dict(read_timeout=5, retries=0, deadline=0.4, breaker_threshold=0)
+
+
+def test_plazo_corta_la_lectura_con_hilos(servidor_lento):
+    pytest.importorskip("requests")
+    import io_threading
+    inicio = time.monotonic()
+    resultado = io_threading.download_site(servidor_lento, Policy(**POLITICA_CORTA))
+    assert resultado.error_kind == TIMEOUT
+    assert time.monotonic() - inicio < 1.5
+
+
+def test_plazo_corta_la_lectura_con_asyncio(servidor_lento):
+    aiohttp = pytest.importorskip("aiohttp")
+    import io_asyncio
+
+    async def descargar():
+        async with aiohttp.ClientSession() as session:
+            return await io_asyncio.download_site(session, servidor_lento, Policy(**POLITICA_CORTA))
+
+    inicio = time.monotonic()
+    resultado = asyncio.run(descargar())
+    assert resultado.error_kind == TIMEOUT
+    assert time.monotonic() - inicio < 1.5
+
+
+def test_plazo_corta_la_descarga_a_disco(servidor_lento, tmp_path):
+    pytest.importorskip("requests")
+    import io_threading
+    destino = (servidor_lento, str(tmp_path / "lento.bin"))
+    resultado = io_threading.download_to_disk(destino, 64 * 1024, True, "sha256", None,
+                                              Policy(**POLITICA_CORTA))
+    assert resultado.error_kind == TIMEOUT
+    assert resultado.path.endswith(".part")
@@ -0,0 +1,80 @@
+"""Pruebas de la serialización binaria de Matrix y Vector."""
+import pytest
+
+from linearAlg import Matrix, Vector, load, load_archive, save, save_archive
+from linearAlg.serialization import HEADER_SIZE
+
+
+def test_matriz_ida_y_vuelta(tmp_path):
+    matriz = Matrix([[1.5, -2.0, 3.25], [4.0, 5.5, -6.0]])
+    for comprimir in (False, True):
+        ruta = str(tmp_path / f"m{comprimir}.bin")
+        save(matriz, ruta, compress=comprimir)
+        cargada = load(ruta)
+        assert cargada.shape == (2, 3)
+        assert cargada.values == matriz.values
+
+
+@pytest.mark.parametrize("dtype", ["d", "f", "q"])
+def test_vector_conserva_el_tipo(tmp_path, dtype):
+    vector = Vector([1, 2, 3, -4], dtype=dtype)
+    ruta = str(tmp_path / "v.bin")
+    save(vector, ruta, compress=dtype == "f")
+    cargado = load(ruta)
+    assert cargado._data.typecode == dtype
+    assert list(cargado._data) == list(vector._data)
+
+
+def cambiar_byte(ruta, posicion, valor):
+    with open(ruta, "r+b") as archivo:
+        archivo.seek(posicion)
+        archivo.write(valor)
+
+
+@pytest.mark.parametrize("valor, dtype", [(Matrix([[1.0, 2.0]]), b"q"),
+                                          (Vector([1.0, 2.0]), b"x"),
+                                          (Vector([1.0, 2.0]), b"i")])
+def test_rechaza_tipos_no_validos(tmp_path, valor, dtype):
+    ruta = str(tmp_path / "a.bin")
+    save(valor, ruta)
+    # El tipo de dato es el séptimo byte de la cabecera (tras firma, versión y clase)
+    cambiar_byte(ruta, 6, dtype)
+    with pytest.raises(ValueError):
+        load(ruta)
+
+
+def test_rechaza_firma_y_clase_desconocidas(tmp_path):
+    ruta = str(tmp_path / "a.bin")
+    save(Vector([1.0]), ruta)
+    cambiar_byte(ruta, 5, b"Z")
+    with pytest.raises(ValueError):
+        load(ruta)
+    save(Vector([1.0]), ruta)
+    cambiar_byte(ruta, 0, b"X")
+    with pytest.raises(ValueError):
+        load(ruta)
+
+
+def test_detecta_datos_corruptos_y_truncados(tmp_path):
+    ruta = str(tmp_path / "a.bin")
+    save(Matrix([[1.0, 2.0], [3.0, 4.0]]), ruta)
+    cambiar_byte(ruta, HEADER_SIZE + 3, b"\xff")
+    with pytest.raises(ValueError):
+        load(ruta)
+    assert load(ruta, verify=False).shape == (2, 2)
+
+    with open(ruta, "r+b") as archivo:
+        archivo.truncate(HEADER_SIZE + 10)
+    with pytest.raises(ValueError):
+        load(ruta)
+
+
+def test_archivo_con_nombres(tmp_path):
+    ruta = str(tmp_path / "todo.laz")
+    arreglos = {"a": Matrix([[1.0, 2.0], [3.0, 4.0]]), "b": Vector([5, 6], dtype="q")}
+    save_archive(ruta, arreglos, compress=True)
+    assert load_archive(ruta, names=["b"])["b"]._data.tolist() == [5, 6]
+    cargados = load_archive(ruta)
+    assert cargados["a"].values == [[1.0, 2.0], [3.0, 4.0]]
+    with pytest.raises(KeyError):
+        load_archive(ruta, names=["c"])
@@ -0,0 +1,74 @@
+"""Pruebas de la multiplicación Strassen-Winograd frente al kernel clásico."""
+import random
+
+import pytest
+
+from linearAlg import Matrix, matrix_multiply
+from linearAlg import linAlg
+
+TOLERANCIA = 1e-10
+
+
+def aleatoria(filas, columnas, semilla):
+    generador = random.Random(semilla)
+    return Matrix([[generador.uniform(-1, 1) for _ in range(columnas)] for _ in range(filas)])
+
+
+def diferencia(m1, m2, **opciones):
+    clasico = matrix_multiply(m1, m2, strassen=False).values
+    strassen = matrix_multiply(m1, m2, strassen=True, **opciones).values
+    return max(abs(x - y) for fc, fs in zip(clasico, strassen) for x, y in zip(fc, fs))
+
+
+@pytest.mark.parametrize("n, corte", [(129, 64), (200, 32), (200, 128), (64, 16)])
+def test_cuadradas_con_y_sin_relleno(motor_python, n, corte):
+    assert diferencia(aleatoria(n, n, 1), aleatoria(n, n, 2), cutoff=corte) < TOLERANCIA
+
+
+@pytest.mark.parametrize("forma", [(30, 50, 20), (1, 70, 1), (65, 3, 40), (17, 33, 9)])
+def test_rectangulares(motor_python, forma):
+    filas, interna, columnas = forma
+    m1, m2 = aleatoria(filas, interna, 3), aleatoria(interna, columnas, 4)
+    resultado = matrix_multiply(m1, m2, strassen=True, cutoff=8)
+    assert resultado.shape == (filas, columnas)
+    assert diferencia(m1, m2, cutoff=8) < TOLERANCIA
+
+
+@pytest.mark.parametrize("n", [31, 32, 33])
+def test_tamaños_alrededor_del_corte(motor_python, n):
+    assert diferencia(aleatoria(n, n, 5), aleatoria(n, n, 6), cutoff=32) < TOLERANCIA
+
+
+def test_enteros_exactos(motor_python):
+    generador = random.Random(7)
+    datos_a = [[generador.randint(-9, 9) for _ in range(45)] for _ in range(45)]
+    datos_b = [[generador.randint(-9, 9) for _ in range(45)] for _ in range(45)]
+    m1, m2 = Matrix(datos_a), Matrix(datos_b)
+    producto = matrix_multiply(m1, m2, strassen=True, cutoff=8).values
+    assert producto == matrix_multiply(m1, m2, strassen=False).values
+    assert all(isinstance(x, int) for fila in producto for x in fila)
+
+
+def test_umbral_automatico(motor_python, monkeypatch):
+    llamadas = []
+    original = linAlg._strassen_kernel
+
+    def espia(*args, **kwargs):
+        llamadas.append(args[2:5])
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(linAlg, "STRASSEN_THRESHOLD", 24)
+    monkeypatch.setattr(linAlg, "STRASSEN_CUTOFF", 8)
+    monkeypatch.setattr(linAlg, "_strassen_kernel", espia)
+    m1, m2 = aleatoria(24, 24, 8), aleatoria(24, 24, 9)
+    m1 * m2
+    assert llamadas == [(24, 24, 24)]
+    aleatoria(23, 23, 8) * aleatoria(23, 23, 9)
+    aleatoria(24, 24, 8) * aleatoria(24, 25, 9)
+    matrix_multiply(m1, m2, strassen=False)
+    assert llamadas == [(24, 24, 24)]
+
+
+def test_corte_invalido(motor_python):
+    with pytest.raises(ValueError):
+        matrix_multiply(aleatoria(4, 4, 1), aleatoria(4, 4, 2), strassen=True, cutoff=-1)